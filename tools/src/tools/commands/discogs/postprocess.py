@@ -3,8 +3,12 @@
 import click
 
 from tools.app_context import AppContext
-from tools.services.discogs_interaction_strategy import CliInteractionStrategy
-from tools.services.discogs_processor import DiscogsProcessor
+from tools.services.auto_interaction_strategy import AutoInteractionStrategy
+from tools.services.discogs_interaction_strategy import (
+    CliInteractionStrategy,
+    InteractionStrategy,
+)
+from tools.services.discogs_processor import PREFETCH_SEARCHES, DiscogsProcessor
 from tools.services.discogs_search_service import DiscogsSearchService
 from tools.services.discogs_service import create_discogs_service
 
@@ -15,8 +19,18 @@ from tools.services.discogs_service import create_discogs_service
     default=False,
     help="Process videos sequentially (deterministic) or randomly (random). Default is deterministic.",
 )
+@click.option(
+    "--refresh-cache",
+    is_flag=True,
+    help="Forget cached Discogs responses, e.g. after editing Discogs data.",
+)
+@click.option(
+    "--auto",
+    is_flag=True,
+    help="Pick the first search string, release and track without asking.",
+)
 @click.pass_context
-def postprocess(ctx: click.Context, deterministic: bool) -> None:
+def postprocess(ctx: click.Context, deterministic: bool, refresh_cache: bool, auto: bool) -> None:
     """
     Interactive command to update DB with Discogs information.
 
@@ -27,9 +41,14 @@ def postprocess(ctx: click.Context, deterministic: bool) -> None:
     Use --random to get a random video each time instead of sequential processing.
     This is useful when testing to avoid repeatedly encountering videos that
     cannot be found in Discogs.
+
+    Use --auto for unattended batch runs, accepting the first match at
+    every step; videos are then processed sequentially, so that those
+    without a match are not picked again.
     """
     app_context: AppContext = ctx.obj
     logger = app_context.logger
+    deterministic = deterministic or auto
     logger.debug(
         f"Starting postprocess command (mode: {'deterministic' if deterministic else 'random'})"
     )
@@ -42,13 +61,19 @@ def postprocess(ctx: click.Context, deterministic: bool) -> None:
         config=app_context.config,
         logger=logger,
     )
+    if refresh_cache:
+        discogs_service.clear_cache()
 
-    # Create processor with CLI interaction strategy
-    interaction_strategy = CliInteractionStrategy()
+    # Create processor with CLI or automatic interaction strategy
+    interaction_strategy: InteractionStrategy = (
+        AutoInteractionStrategy() if auto else CliInteractionStrategy()
+    )
     processor = DiscogsProcessor(
         discogs_service=discogs_service,
         interaction_strategy=interaction_strategy,
         logger=logger,
+        # only the first search string is ever used in auto mode
+        prefetch_searches=1 if auto else PREFETCH_SEARCHES,
     )
 
     # Process videos in loop
@@ -85,5 +110,7 @@ def postprocess(ctx: click.Context, deterministic: bool) -> None:
                     break
     except (KeyboardInterrupt, click.Abort):
         click.echo("\n\nInterrupted by user (CTRL-C)")
+    finally:
+        processor.close()
 
     click.echo("\nFinished")
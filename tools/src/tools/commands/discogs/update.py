@@ -11,8 +11,13 @@ from tools.services.discogs_service import create_discogs_service
 
 @click.command()
 @click.argument("video_id")
+@click.option(
+    "--refresh-cache",
+    is_flag=True,
+    help="Forget cached Discogs responses, e.g. after editing Discogs data.",
+)
 @click.pass_context
-def update(ctx: click.Context, video_id: str) -> None:
+def update(ctx: click.Context, video_id: str, refresh_cache: bool) -> None:
     """
     Update Discogs metadata for a specific video.
 
@@ -40,6 +45,8 @@ def update(ctx: click.Context, video_id: str) -> None:
         config=app_context.config,
         logger=logger,
     )
+    if refresh_cache:
+        discogs_service.clear_cache()
 
     # Generate search strings from video metadata
     search_strings = search_service.generate_search_strings(
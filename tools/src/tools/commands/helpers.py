@@ -12,6 +12,11 @@ import click
 T = TypeVar("T")
 
 
+def _format_item(idx: int, item: object) -> str:
+    """Format an item as a numbered choice, by default."""
+    return f"{idx}. {item}"
+
+
 def prompt_numbered_choice(
     items: list[T],
     *,
@@ -49,13 +54,9 @@ def prompt_numbered_choice(
     if not items:
         return None
 
-    # Display numbered options
-    for idx, item in enumerate(items, 1):
-        if formatter:
-            display = formatter(idx, item)
-        else:
-            display = f"{idx}. {item}"
-        click.echo(display)
+    # Display numbered options, in a single write as the list can be long
+    format_item = formatter or _format_item
+    click.echo("\n".join(format_item(idx, item) for idx, item in enumerate(items, 1)))
 
     # Build prompt text with range
     full_prompt = f"{prompt_text} (1-{len(items)})"
@@ -8,13 +8,19 @@ from tools.services.archiver_service import create_archiver_service
 
 @click.command()
 @click.argument("keys", type=click.STRING, nargs=-1)
+@click.option(
+    "--refresh-metadata",
+    is_flag=True,
+    help="Ignore info cached from earlier runs and fetch it from YouTube again.",
+)
 @click.pass_context
-def refresh(ctx: click.Context, keys: tuple[str, ...] | None) -> None:
+def refresh(ctx: click.Context, keys: tuple[str, ...] | None, refresh_metadata: bool) -> None:
     """
     Fetch playlist info and match to DB.
 
     Args:
         - key: The identifier of the playlist to refresh.
+        - refresh_metadata: Whether to skip the YouTube info cache.
     """
     app_context: AppContext = ctx.obj
     archiver = create_archiver_service(
@@ -24,5 +30,5 @@ def refresh(ctx: click.Context, keys: tuple[str, ...] | None) -> None:
         config=app_context.config,
         logger=app_context.logger,
     )
-    archiver.refresh_playlist(keys=keys)
+    archiver.refresh_playlist(keys=keys, refresh_metadata=refresh_metadata)
     click.echo("Finished")
@@ -17,3 +17,16 @@ class YarkieSettings(BaseSettings, extra="ignore", env_ignore_empty=True):
     db_path: Path = DEFAULT_DATA_ROOT / "db" / "yarkie.db"
     thumbnail_ext: str = "webp"
     video_ext: str = "mp4"
+    # yt-dlp download tuning; external_downloader can be e.g. "aria2c"
+    concurrent_fragments: int = 16
+    external_downloader: str | None = None
+    # how many videos are downloaded at the same time; each one opens up to
+    # concurrent_fragments connections, so 4 workers means 64 connections
+    download_workers: int = 1
+    # seconds info fetched from YouTube is reused for; 0 turns it off
+    info_cache_path: Path = DEFAULT_DATA_ROOT / "cache"
+    info_cache_ttl: int = 0
+    # seconds Discogs responses are reused for (searches at most a day);
+    # 0 turns it off
+    discogs_cache_path: Path = DEFAULT_DATA_ROOT / "cache" / "discogs"
+    discogs_cache_ttl: int = 30 * 24 * 3600
@@ -5,6 +5,8 @@ infrastructure for database operations including simple upsert helpers and
 table field mapping that can be reused by domain-specific repositories.
 """
 
+from collections.abc import Generator
+from contextlib import contextmanager
 from logging import Logger, getLogger
 from typing import Any, Optional
 
@@ -69,11 +71,27 @@ class BaseRepository:
         self.logger = logger or getLogger(__name__)
         self.config = config
 
+    @contextmanager
+    def _session(self, session: Optional[Session] = None) -> Generator[Session]:
+        """Yield the given session, or a new one committed on exit.
+
+        When a session is passed in, it belongs to a transaction opened by
+        the caller, so nothing is committed here.
+        """
+        if session is not None:
+            yield session
+            return
+        with Session(self.sql_client.engine) as new_session:
+            yield new_session
+            new_session.commit()
+
     def _simple_upsert(
         self,
         table_class: type[Base],
         records: list[dict[str, Any]],
         pk: str | list[str] = "id",
+        *,
+        session: Optional[Session] = None,
     ) -> None:
         """Perform a simple upsert operation on a table.
 
@@ -93,12 +111,16 @@ class BaseRepository:
         pk : str | list[str], optional
             The primary key column name(s) for conflict resolution,
             by default "id".
+        session : Optional[Session], optional
+            Session to run in, as part of the caller's transaction, by
+            default None (a new session is committed on completion).
 
         Notes
         -----
         - Empty records list is handled gracefully (no-op).
         - All columns except the primary key are updated on conflict.
-        - Errors are logged but not raised.
+        - Errors are logged but not raised, unless a session was passed
+          in, so that the caller can roll back its transaction.
 
         Examples
         --------
@@ -112,7 +134,7 @@ class BaseRepository:
             return
 
         try:
-            with Session(self.sql_client.engine) as session:
+            with self._session(session) as db_session:
                 stmt = sqlite_insert(table_class).values(records)
 
                 # Determine which columns to update (all except primary key)
@@ -127,9 +149,10 @@ class BaseRepository:
                     index_elements=[pk] if isinstance(pk, str) else pk,
                     set_=updates,
                 )
-                session.execute(stmt)
-                session.commit()
+                db_session.execute(stmt)
         except (SQLAlchemyError, TypeError) as e:
+            if session is not None:
+                raise
             table_name = getattr(table_class, "__tablename__", "unknown")
             self.logger.error(f"Error inserting or updating {table_name}: {e}")
 
@@ -0,0 +1,186 @@
+"""Module providing rate limited and caching fetchers for the Discogs client."""
+
+import hashlib
+import os
+import shutil
+import tempfile
+import time
+from logging import Logger, getLogger
+from pathlib import Path
+from threading import Lock
+from typing import Any, Optional
+
+from discogs_client.fetchers import UserTokenRequestsFetcher
+from discogs_client.utils import backoff
+from requests import Response, Session
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Searches are cached for a shorter time than releases and artists, as
+# new releases are added to Discogs all the time
+SEARCH_TTL = 24 * 3600
+
+# Discogs allows authenticated clients 60 requests per minute
+RATE_LIMIT = 60
+RATE_PERIOD = 60.0
+
+# Connections kept open to Discogs, enough for the processor's threads
+POOL_SIZE = 4
+
+
+class TokenBucket:
+    """Allow bursts of up to `rate` calls, then `rate` calls every `per` seconds."""
+
+    def __init__(self, *, rate: int = RATE_LIMIT, per: float = RATE_PERIOD):
+        """Initialize the bucket, full.
+
+        Args:
+            - rate: How many tokens the bucket holds.
+            - per: How many seconds it takes to refill an empty bucket.
+        """
+        self.rate = rate
+        self.per = per
+        self._tokens = float(rate)
+        self._last = time.monotonic()
+        self._lock = Lock()
+
+    def acquire(self) -> None:
+        """Take a token, waiting for one if the bucket is empty."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.rate, self._tokens + (now - self._last) * self.rate / self.per)
+            self._last = now
+            if self._tokens < 1:
+                time.sleep((1 - self._tokens) * self.per / self.rate)
+                self._last = time.monotonic()
+                self._tokens = 1
+            self._tokens -= 1
+
+
+class RateLimitedFetcher(UserTokenRequestsFetcher):
+    """Fetch from the Discogs API, without going over its rate limit.
+
+    The client only backs off once Discogs has refused a request; waiting
+    for a token beforehand avoids most of those refusals.
+    """
+
+    def __init__(self, user_token: str, *, bucket: Optional[TokenBucket] = None):
+        """Initialize the fetcher.
+
+        Args:
+            - user_token: The Discogs user token.
+            - bucket: Optional TokenBucket, by default one for the Discogs limit.
+        """
+        super().__init__(user_token)
+        self.bucket = bucket or TokenBucket()
+        # the client would open a new connection for every request
+        self.session = Session()
+        self.session.mount(
+            "https://",
+            HTTPAdapter(pool_maxsize=POOL_SIZE, max_retries=Retry(total=3, backoff_factor=0.3)),
+        )
+
+    @backoff
+    def request(
+        self, method: str, url: str, data: Any, headers: Any, params: Any = None
+    ) -> Response:
+        """Send the request over a pooled connection, once a token is available.
+
+        Decorated like the client's own method, to back off when Discogs
+        still answers 429.
+        """
+        self.bucket.acquire()
+        return self.session.request(
+            method=method,
+            url=url,
+            data=data,
+            headers=headers,
+            params=params,
+            timeout=(self.connect_timeout, self.read_timeout),
+        )
+
+
+class CachingFetcher(RateLimitedFetcher):
+    """Fetch from the Discogs API, keeping successful GETs on disk.
+
+    Discogs rate limits requests heavily, and the same searches, releases
+    and artists are requested again every time a run is restarted.
+    """
+
+    def __init__(
+        self,
+        user_token: str,
+        *,
+        cache_path: Path,
+        ttl: int,
+        logger: Optional[Logger] = None,
+        bucket: Optional[TokenBucket] = None,
+    ):
+        """Initialize the fetcher.
+
+        Args:
+            - user_token: The Discogs user token.
+            - cache_path: The folder responses are kept in.
+            - ttl: How many seconds responses are reused for.
+            - logger: Optional logger instance.
+            - bucket: Optional TokenBucket, by default one for the Discogs limit.
+        """
+        super().__init__(user_token, bucket=bucket)
+        self.cache_path = cache_path
+        self.ttl = ttl
+        self.logger = logger or getLogger(__name__)
+
+    def fetch(
+        self,
+        client: Any,
+        method: str,
+        url: str,
+        data: Any = None,
+        headers: Any = None,
+        json_format: bool = True,
+    ) -> tuple[bytes, int]:
+        """Fetch the given request, from the cache if possible.
+
+        Only successful GET requests are cached, so that errors (404, 429
+        etc) are tried again next time.
+        """
+        if method != "GET":
+            content, status_code = super().fetch(client, method, url, data, headers, json_format)
+            return content, status_code
+
+        cache_file = self.cache_path / f"{hashlib.sha1(url.encode()).hexdigest()}.json"
+        ttl = min(self.ttl, SEARCH_TTL) if "/database/search" in url else self.ttl
+        try:
+            if time.time() - cache_file.stat().st_mtime <= ttl:
+                return cache_file.read_bytes(), 200
+        except OSError:
+            pass
+
+        content, status_code = super().fetch(client, method, url, data, headers, json_format)
+        if status_code == 200:
+            self._write_cache(cache_file, content, url=url)
+        return content, status_code
+
+    def _write_cache(self, cache_file: Path, content: bytes, *, url: str) -> None:
+        """Cache a response, ignoring errors.
+
+        It is written to a file of its own, then moved in place, so that
+        other threads or an interrupted run never read half a response.
+        """
+        tmp_file: Optional[Path] = None
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                dir=cache_file.parent, suffix=".tmp", delete=False
+            ) as f:
+                tmp_file = Path(f.name)
+                f.write(content)
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            self.logger.warning(f"Could not cache {url}: {e}")
+            if tmp_file:
+                tmp_file.unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        """Forget all cached responses."""
+        shutil.rmtree(self.cache_path, ignore_errors=True)
@@ -5,10 +5,12 @@ database operations related to Discogs releases, artists, and tracks.
 """
 
 import re
+from collections.abc import Sequence
 from logging import Logger
 from typing import Any, Optional, cast
 
 from sqlalchemy import and_, func, insert, select, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.engine import CursorResult
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
@@ -25,6 +27,15 @@ from tools.orm.schema import (
     VideosTable,
 )
 
+_PAREN_RE = re.compile(r" *\(.*?\)")
+_THE_PREFIX_RE = re.compile(r"^the", re.IGNORECASE)
+
+
+def _clean_artist_name(name: str) -> str:
+    """Remove the disambiguation suffix and leading 'the' from an artist name."""
+    name = _PAREN_RE.sub("", name).strip()
+    return _THE_PREFIX_RE.sub("", name).strip()
+
 
 class DiscogsRepository(BaseRepository):
     """
@@ -128,7 +139,7 @@ class DiscogsRepository(BaseRepository):
             self.logger.error(f"Error getting next video without Discogs: {e}")
             return None
 
-    def upsert_release(self, *, record: DiscogsRelease) -> int:
+    def upsert_release(self, *, record: DiscogsRelease, session: Optional[Session] = None) -> int:
         """
         Insert or update a Discogs release record.
 
@@ -136,6 +147,9 @@ class DiscogsRepository(BaseRepository):
         ----------
         record : DiscogsRelease
             The release record to upsert.
+        session : Optional[Session], optional
+            Session to run in, as part of the caller's transaction, by
+            default None. Errors are then raised rather than logged.
 
         Returns
         -------
@@ -143,9 +157,9 @@ class DiscogsRepository(BaseRepository):
             The ID of the upserted release.
         """
         try:
-            with Session(self.sql_client.engine) as session:
-                exists_query = session.query(
-                    session.query(DiscogsReleaseTable)
+            with self._session(session) as db_session:
+                exists_query = db_session.query(
+                    db_session.query(DiscogsReleaseTable)
                     .filter(DiscogsReleaseTable.id == record.id)
                     .exists()
                 ).scalar()
@@ -164,15 +178,21 @@ class DiscogsRepository(BaseRepository):
                     uri=record.uri,
                 )
 
-                session.execute(insert_stmt)
-                session.commit()
+                db_session.execute(insert_stmt)
                 return record.id
         except SQLAlchemyError as e:
+            if session is not None:
+                raise
             self.logger.error(f"Error upserting Discogs release: {e}")
             return record.id
 
     def upsert_artist(
-        self, *, record: DiscogsArtist, release_id: int, role: Optional[str] = None
+        self,
+        *,
+        record: DiscogsArtist,
+        release_id: int,
+        role: Optional[str] = None,
+        session: Optional[Session] = None,
     ) -> int:
         """
         Insert or update a Discogs artist and link to a release.
@@ -185,6 +205,9 @@ class DiscogsRepository(BaseRepository):
             The release ID to link the artist to.
         role : Optional[str], optional
             The role of the artist on the release, by default None.
+        session : Optional[Session], optional
+            Session to run in, as part of the caller's transaction, by
+            default None. Errors are then raised rather than logged.
 
         Returns
         -------
@@ -192,10 +215,10 @@ class DiscogsRepository(BaseRepository):
             The ID of the upserted artist.
         """
         try:
-            with Session(self.sql_client.engine) as session:
+            with self._session(session) as db_session:
                 # Check if artist is already linked to release
-                exists_query = session.query(
-                    session.query(ReleaseArtistsTable)
+                exists_query = db_session.query(
+                    db_session.query(ReleaseArtistsTable)
                     .filter(
                         and_(
                             ReleaseArtistsTable.release_id == release_id,
@@ -210,25 +233,21 @@ class DiscogsRepository(BaseRepository):
                     return record.id
 
                 # Check if artist exists
-                exists_query = session.query(
-                    session.query(DiscogsArtistTable)
+                exists_query = db_session.query(
+                    db_session.query(DiscogsArtistTable)
                     .filter(DiscogsArtistTable.id == record.id)
                     .exists()
                 ).scalar()
 
-                # Clean artist name
-                name = re.sub(r" *\(.*?\)", "", record.name).strip()
-                name = re.sub(r"^the", "", name, flags=re.IGNORECASE).strip()
-
                 # Insert artist if doesn't exist
                 if not exists_query:
                     insert_stmt = insert(DiscogsArtistTable).values(
                         id=record.id,
-                        name=name,
+                        name=_clean_artist_name(record.name),
                         profile=record.profile,
                         uri=record.uri,
                     )
-                    session.execute(insert_stmt)
+                    db_session.execute(insert_stmt)
 
                 # Link artist to release
                 link_stmt = insert(ReleaseArtistsTable).values(
@@ -237,14 +256,80 @@ class DiscogsRepository(BaseRepository):
                     role=role,
                     is_main=1,
                 )
-                session.execute(link_stmt)
-                session.commit()
+                db_session.execute(link_stmt)
                 return record.id
         except SQLAlchemyError as e:
+            if session is not None:
+                raise
             self.logger.error(f"Error upserting Discogs artist: {e}")
             return record.id
 
-    def upsert_track(self, *, record: DiscogsTrack, video_id: str) -> int:
+    def upsert_artists(
+        self,
+        *,
+        records: Sequence[tuple[DiscogsArtist, Optional[str]]],
+        release_id: int,
+        session: Optional[Session] = None,
+    ) -> list[int]:
+        """
+        Insert Discogs artists and link them to a release, in one go.
+
+        Artists already in the DB, or already linked to the release, are
+        left as they are.
+
+        Parameters
+        ----------
+        records : Sequence[tuple[DiscogsArtist, Optional[str]]]
+            The artist records to upsert, each with its role on the release.
+        release_id : int
+            The release ID to link the artists to.
+        session : Optional[Session], optional
+            Session to run in, as part of the caller's transaction, by
+            default None. Errors are then raised rather than logged.
+
+        Returns
+        -------
+        list[int]
+            The IDs of the upserted artists.
+        """
+        if not records:
+            return []
+
+        try:
+            with self._session(session) as db_session:
+                db_session.execute(
+                    sqlite_insert(DiscogsArtistTable).on_conflict_do_nothing(),
+                    [
+                        {
+                            "id": record.id,
+                            "name": _clean_artist_name(record.name),
+                            "profile": record.profile,
+                            "uri": record.uri,
+                        }
+                        for record, _ in records
+                    ],
+                )
+                db_session.execute(
+                    sqlite_insert(ReleaseArtistsTable).on_conflict_do_nothing(),
+                    [
+                        {
+                            "release_id": release_id,
+                            "artist_id": record.id,
+                            "role": role,
+                            "is_main": 1,
+                        }
+                        for record, role in records
+                    ],
+                )
+        except SQLAlchemyError as e:
+            if session is not None:
+                raise
+            self.logger.error(f"Error upserting Discogs artists: {e}")
+        return [record.id for record, _ in records]
+
+    def upsert_track(
+        self, *, record: DiscogsTrack, video_id: str, session: Optional[Session] = None
+    ) -> int:
         """
         Insert or update a Discogs track and link to a video.
 
@@ -254,6 +339,9 @@ class DiscogsRepository(BaseRepository):
             The track record to upsert.
         video_id : str
             The video ID to link the track to.
+        session : Optional[Session], optional
+            Session to run in, as part of the caller's transaction, by
+            default None. Errors are then raised rather than logged.
 
         Returns
         -------
@@ -261,10 +349,10 @@ class DiscogsRepository(BaseRepository):
             The ID of the upserted track.
         """
         try:
-            with Session(self.sql_client.engine) as session:
+            with self._session(session) as db_session:
                 # Check if track exists
                 track_stmt = (
-                    session.query(DiscogsTrackTable.id)
+                    db_session.query(DiscogsTrackTable.id)
                     .filter(
                         and_(
                             DiscogsTrackTable.title == record.title,
@@ -273,7 +361,7 @@ class DiscogsRepository(BaseRepository):
                     )
                     .limit(1)
                 )
-                existing_track = session.execute(track_stmt).first()
+                existing_track = db_session.execute(track_stmt).first()
 
                 if existing_track is None:
                     # Insert new track
@@ -284,7 +372,7 @@ class DiscogsRepository(BaseRepository):
                         type_=record.type_,
                         release_id=record.release_id,
                     )
-                    insert_result = cast("CursorResult[Any]", session.execute(insert_stmt))
+                    insert_result = cast("CursorResult[Any]", db_session.execute(insert_stmt))
                     inserted_primary_key = insert_result.inserted_primary_key
                     if inserted_primary_key is None:
                         raise SQLAlchemyError("Insert did not return a primary key")
@@ -304,11 +392,12 @@ class DiscogsRepository(BaseRepository):
                         )
                     )
                 )
-                session.execute(update_stmt)
-                session.commit()
+                db_session.execute(update_stmt)
 
                 return track_id
         except SQLAlchemyError as e:
+            if session is not None:
+                raise
             self.logger.error(f"Error upserting Discogs track: {e}")
             return 0
 
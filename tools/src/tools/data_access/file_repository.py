@@ -1,5 +1,6 @@
 """Provide a FileRepository for managing file operations."""
 
+import os
 import shutil
 from logging import Logger, getLogger
 from pathlib import Path
@@ -116,6 +117,54 @@ class FileRepository:
         thumbnail_path = self.make_thumbnail_path(video_id)
         return thumbnail_path.exists()
 
+    def existing_video_ids(self) -> set[str]:
+        """
+        Return the ids of all the videos in the filesystem.
+
+        Reads each folder once, which is much cheaper than calling
+        video_file_exists for every video.
+        """
+        return self._existing_ids(root=self.videos_root, ext=self.config.video_ext)
+
+    def existing_thumbnail_ids(self) -> set[str]:
+        """
+        Return the ids of all the thumbnails in the filesystem.
+
+        Reads each folder once, which is much cheaper than calling
+        thumbnail_file_exists for every video.
+        """
+        return self._existing_ids(root=self.thumbnails_root, ext=self.config.thumbnail_ext)
+
+    def _existing_ids(self, *, root: Path, ext: str) -> set[str]:
+        """
+        Collect the keys of all the files with extension ext under root.
+
+        Files are stored in one subfolder per initial, see make_video_path.
+
+        Args:
+            - root: The folder containing the per-initial subfolders.
+            - ext: The file extension, without the dot.
+
+        Returns:
+            The keys of all the files found.
+        """
+        suffix = f".{ext}"
+        ids: set[str] = set()
+        try:
+            with os.scandir(root) as folders:
+                for folder in folders:
+                    if not folder.is_dir():
+                        continue
+                    with os.scandir(folder.path) as entries:
+                        ids.update(
+                            entry.name.removesuffix(suffix)
+                            for entry in entries
+                            if entry.name.endswith(suffix)
+                        )
+        except FileNotFoundError:
+            self.logger.debug(f"{root} not found, no files in it")
+        return ids
+
 
 def file_repository(config: YarkieSettings, logger: Logger | None = None) -> FileRepository:
     """
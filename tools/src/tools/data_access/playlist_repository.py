@@ -75,7 +75,9 @@ class PlaylistRepository(BaseRepository):
             self.logger.error(f"Error retrieving playlist keys: {e}")
             return tuple()
 
-    def update_playlists(self, playlists: list[Playlist]) -> list[Playlist]:
+    def update_playlists(
+        self, playlists: list[Playlist], *, session: Optional[Session] = None
+    ) -> list[Playlist]:
         """Update playlist records in the database.
 
         This method updates playlist information without modifying the
@@ -85,6 +87,9 @@ class PlaylistRepository(BaseRepository):
         ----------
         playlists : list[Playlist]
             A list of Playlist instances to update.
+        session : Optional[Session], optional
+            Session to run in, as part of the caller's transaction, by
+            default None.
 
         Returns
         -------
@@ -100,12 +105,16 @@ class PlaylistRepository(BaseRepository):
             for playlist in playlists
         ]
 
-        self._simple_upsert(table_class=PlaylistsTable, records=playlist_records, pk="id")
+        self._simple_upsert(
+            table_class=PlaylistsTable, records=playlist_records, pk="id", session=session
+        )
         self.logger.info(f"Updated {len(playlists)} playlist(s)")
 
         return playlists
 
-    def clear_playlist_links(self, playlists: list[Playlist]) -> None:
+    def clear_playlist_links(
+        self, playlists: list[Playlist], *, session: Optional[Session] = None
+    ) -> None:
         """Remove all video links for the given playlists.
 
         Typically called before recreating playlist-video relationships
@@ -115,6 +124,9 @@ class PlaylistRepository(BaseRepository):
         ----------
         playlists : list[Playlist]
             A list of Playlist instances whose video links should be cleared.
+        session : Optional[Session], optional
+            Session to run in, as part of the caller's transaction, by
+            default None. Errors are then raised rather than logged.
         """
         if not playlists:
             return
@@ -122,14 +134,15 @@ class PlaylistRepository(BaseRepository):
         playlist_ids = [playlist.id for playlist in playlists]
 
         try:
-            with Session(self.sql_client.engine) as session:
+            with self._session(session) as db_session:
                 stmt = delete(PlaylistEntriesTable).where(
                     PlaylistEntriesTable.playlist_id.in_(playlist_ids)
                 )
-                session.execute(stmt)
-                session.commit()
-                self.logger.info(f"Removed links to videos (if any) for {len(playlists)} playlists")
+                db_session.execute(stmt)
+            self.logger.info(f"Removed links to videos (if any) for {len(playlists)} playlists")
         except SQLAlchemyError as e:
+            if session is not None:
+                raise
             self.logger.error(f"Error clearing playlist links: {e}")
 
     def delete_playlists(self, playlist_ids: list[str]) -> int:
@@ -2,20 +2,42 @@ import logging
 from pathlib import Path
 from typing import Optional
 
-from sqlalchemy import MetaData, create_engine, text
+from sqlalchemy import MetaData, create_engine, event, text
+from sqlalchemy.engine.interfaces import DBAPIConnection
 from sqlalchemy.orm import scoped_session, sessionmaker
+from sqlalchemy.pool import ConnectionPoolEntry
 
 from tools.config.app_config import YarkieSettings
 from tools.orm.schema import Base as Base
 
 metadata = MetaData()
 
+# WAL only needs to sync on checkpoints rather than on every commit,
+# which is safe enough for a local archive and much faster on bulk writes
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+)
+
+
+def _set_sqlite_pragmas(
+    dbapi_connection: DBAPIConnection, connection_record: ConnectionPoolEntry
+) -> None:
+    """Tune each new sqlite connection for write-heavy use."""
+    cursor = dbapi_connection.cursor()
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
 
 class SQLClient:
     def __init__(self, *, db_url: Path, logger: Optional[logging.Logger] = None):
         self.logger = logger or logging.getLogger(__name__)
         self.logger.debug(f"Connecting to database at {db_url}")
         self.engine = create_engine(f"sqlite:///{db_url}")
+        event.listen(self.engine, "connect", _set_sqlite_pragmas)
         self.Session = scoped_session(sessionmaker(bind=self.engine))
 
     def execute_query(self, query: str) -> None:
@@ -6,12 +6,14 @@ information, tracking downloads, managing video metadata, and deleting
 videos.
 """
 
-from collections.abc import Sequence
+from collections import defaultdict
+from collections.abc import Iterable, Sequence
+from datetime import datetime
 from logging import Logger
 from pathlib import Path
 from typing import Any, Optional, cast
 
-from sqlalchemy import CursorResult, and_, delete, or_, select, update
+from sqlalchemy import CursorResult, and_, bindparam, delete, or_, select, update
 from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
@@ -23,6 +25,26 @@ from tools.models.fakes import FakeVideoFactory
 from tools.models.models import DeletedYoutubeObj, Video, YoutubeObj, last_updated_factory
 from tools.orm.schema import PlaylistEntriesTable, VideosTable
 
+# Fields that are managed locally rather than coming from YouTube, so are
+# not overwritten when a video is upserted
+_LOCAL_VIDEO_FIELDS = frozenset({"id", "downloaded", "video_file", "thumbnail"})
+
+# Video fields that are backed by a column in the videos table
+_VIDEO_COLUMNS = tuple(field for field in Video.model_fields if field in VideosTable.__table__.c)
+
+
+def _row_to_video(row: VideosTable) -> Video:
+    """Build a Video from a DB row without re-running pydantic validation.
+
+    The row has already been typed by the SQL schema, so validation is
+    skipped. The only exception is last_updated, which is stored as TEXT
+    and needs converting back to a datetime.
+    """
+    fields = {field: getattr(row, field) for field in _VIDEO_COLUMNS}
+    if isinstance(fields["last_updated"], str):
+        fields["last_updated"] = datetime.fromisoformat(fields["last_updated"])
+    return Video.model_construct(**fields)
+
 
 class VideoRepository(BaseRepository):
     """
@@ -53,7 +75,9 @@ class VideoRepository(BaseRepository):
         """
         super().__init__(sql_client=sql_client, logger=logger, config=config)
 
-    def update_videos(self, video_data: list[dict[str, Any]]) -> int:
+    def update_videos(
+        self, video_data: Iterable[dict[str, Any]], *, session: Optional[Session] = None
+    ) -> int:
         """Update or insert multiple video records in the database.
 
         Behavior depends on the data provided:
@@ -64,77 +88,93 @@ class VideoRepository(BaseRepository):
 
         Parameters
         ----------
-        video_data : list[dict[str, Any]]
-            A list of dictionaries representing video records.
+        video_data : Iterable[dict[str, Any]]
+            Dictionaries representing video records, consumed only once,
+            so a generator can be passed.
             Each dictionary must contain an 'id' field.
             Include 'title' for UPSERT behavior, omit for UPDATE-only.
+        session : Optional[Session], optional
+            Session to run in, as part of the caller's transaction, by
+            default None. Database errors are then raised rather than
+            logged, so that the caller can roll back.
 
         Returns
         -------
         int
             The number of videos successfully updated/inserted.
         """
-        if not video_data:
-            return 0
-
-        # Validate the data by attempting to create Video instances.
+        # Validate the data by attempting to create Video instances, and
+        # prepare records with defaults, in a single pass over video_data.
         # Use fake data to fill in missing fields for validation.
-        fake_video_data = FakeVideoFactory.build().model_dump(exclude={"id"})
-        try:
-            all(Video.model_validate(record | fake_video_data) for record in video_data)
-        except Exception as e:
-            self.logger.error(f"Invalid video data provided: {e}")
-            return 0
-
-        # Prepare records with defaults
-        updated_records = []
+        # Records are grouped by field set as they come, so that each group
+        # is sent as a single executemany statement rather than one
+        # statement per record, and video_data is never copied as a whole
+        fake_video_data: Optional[dict[str, Any]] = None
+        groups: dict[frozenset[str], list[dict[str, Any]]] = defaultdict(list)
+        count = 0
         for record in video_data:
-            updated_record = {k: v for k, v in record.items()}
+            if fake_video_data is None:
+                fake_video_data = FakeVideoFactory.build().model_dump(exclude={"id"})
+            try:
+                Video.model_validate(record | fake_video_data)
+            except Exception as e:
+                self.logger.error(f"Invalid video data provided: {e}")
+                return 0
+            updated_record = record.copy()
             if "last_updated" not in updated_record:
                 updated_record["last_updated"] = last_updated_factory()
             if "deleted" not in updated_record:
                 updated_record["deleted"] = False
-            updated_records.append(updated_record)
+            groups[frozenset(updated_record)].append(updated_record)
+            count += 1
+
+        if not count:
+            return 0
 
         try:
-            with Session(self.sql_client.engine) as session:
-                # Process each record individually to handle varying field sets
-                for record in updated_records:
-                    # Check if this specific record has complete data (with title)
-                    has_complete_data = "title" in record
+            with self._session(session) as db_session:
+                for fields, records in groups.items():
+                    # Check if these records have complete data (with title)
+                    has_complete_data = "title" in fields
 
                     if has_complete_data:
-                        # UPSERT: insert new video or update existing one
-                        stmt = sqlite_insert(VideosTable).values(record)
-
-                        # Build updates dictionary for columns in this specific record
-                        # Exclude locally-managed fields (downloaded, video_file, thumbnail)
-                        # from UPDATE to preserve download state
-                        record_keys = set(record.keys()) - {
-                            "id",
-                            "downloaded",
-                            "video_file",
-                            "thumbnail",
+                        # UPSERT: insert new videos or update existing ones
+                        stmt = sqlite_insert(VideosTable)
+
+                        # Update the columns present in the records, excluding
+                        # locally-managed fields to preserve download state
+                        updates = {
+                            col_name: stmt.excluded[col_name]
+                            for col_name in fields - _LOCAL_VIDEO_FIELDS
                         }
-                        updates = {col_name: stmt.excluded[col_name] for col_name in record_keys}
 
                         stmt = stmt.on_conflict_do_update(
                             index_elements=["id"],
                             set_=updates,
                         )
-                        session.execute(stmt)
+                        db_session.execute(stmt, records)
                     else:
-                        # UPDATE only: for partial data (e.g., specific field updates)
-                        stmt = (
+                        # UPDATE only: for partial data (e.g., specific field
+                        # updates). A Core executemany, so that unknown ids
+                        # match no rows instead of failing the whole batch
+                        columns = fields - {"id"}
+                        update_stmt = (
                             update(VideosTable)
-                            .values(**{k: v for k, v in record.items() if k != "id"})
-                            .where(VideosTable.id == record["id"])
+                            .where(VideosTable.id == bindparam("b_id"))
+                            .values({col_name: bindparam(col_name) for col_name in columns})
                         )
-                        session.execute(stmt)
-                session.commit()
-                self.logger.info(f"Updated {len(video_data)} video(s)")
-                return len(video_data)
+                        db_session.connection().execute(
+                            update_stmt,
+                            [
+                                {"b_id": record["id"], **{col: record[col] for col in columns}}
+                                for record in records
+                            ],
+                        )
+            self.logger.info(f"Updated {count} video(s)")
+            return count
         except (SQLAlchemyError, TypeError) as e:
+            if session is not None:
+                raise
             self.logger.error(f"Error upserting VideosTable: {e}")
             return 0
 
@@ -185,7 +225,7 @@ class VideoRepository(BaseRepository):
                     )
                 )
                 result = session.execute(stmt)
-                video_list = [Video.model_validate(row[0].__dict__) for row in result.fetchall()]
+                video_list = [_row_to_video(row[0]) for row in result.fetchall()]
                 self.logger.info(f"Found {len(video_list)} video(s) needing download")
                 return video_list
         except SQLAlchemyError as e:
@@ -204,6 +244,35 @@ class VideoRepository(BaseRepository):
         """
         self._update_video(key=key, updates={"video_file": local_file})
 
+    def mark_videos_downloaded(self, downloads: Sequence[tuple[str, str]]) -> None:
+        """Mark several videos as downloaded, in a single transaction.
+
+        Parameters
+        ----------
+        downloads : Sequence[tuple[str, str]]
+            Pairs of video id and path to the locally downloaded file.
+        """
+        if not downloads:
+            return
+        last_updated = last_updated_factory()
+        try:
+            with Session(self.sql_client.engine) as session:
+                # A Core executemany, so that an unknown id matches no rows
+                # instead of failing the whole batch
+                stmt = (
+                    update(VideosTable)
+                    .where(VideosTable.id == bindparam("b_id"))
+                    .values(video_file=bindparam("video_file"), last_updated=last_updated)
+                )
+                session.connection().execute(
+                    stmt,
+                    [{"b_id": key, "video_file": local_file} for key, local_file in downloads],
+                )
+                session.commit()
+                self.logger.debug(f"Marked {len(downloads)} videos as downloaded")
+        except SQLAlchemyError as e:
+            self.logger.error(f"Error marking videos as downloaded: {e}")
+
     def mark_thumbnail_downloaded(self, key: str, local_file: str) -> None:
         """Mark a video's thumbnail as downloaded with the specified file.
 
@@ -393,9 +462,11 @@ class VideoRepository(BaseRepository):
             True if the video was successfully added, False otherwise.
         """
         try:
-            video_dict = video.model_dump()
+            # playlist_id is not a column of the videos table
+            video_dict = video.model_dump(exclude={"playlist_id"})
             video_dict["last_updated"] = last_updated_factory()
-            self._update_video_table(records=[video_dict])
+            if not self._update_video_table(records=[video_dict]):
+                return False
             self.logger.info(f"Added video {video.id}")
             return True
         except Exception as e:
@@ -425,7 +496,7 @@ class VideoRepository(BaseRepository):
                     self.logger.info(f"Video {video_id} not found")
                     return None
 
-                video = Video.model_validate(result[0].__dict__)
+                video = _row_to_video(result[0])
                 self.logger.debug(f"Retrieved video {video_id}")
                 return video
         except SQLAlchemyError as e:
@@ -473,7 +544,7 @@ class VideoRepository(BaseRepository):
                     stmt = stmt.limit(limit)
 
                 result = session.execute(stmt)
-                video_list = [Video.model_validate(row[0].__dict__) for row in result.fetchall()]
+                video_list = [_row_to_video(row[0]) for row in result.fetchall()]
                 self.logger.info(
                     f"Found {len(video_list)} video(s) with filters: "
                     f"downloaded={downloaded}, deleted={deleted}"
@@ -508,16 +579,21 @@ class VideoRepository(BaseRepository):
         except SQLAlchemyError as e:
             self.logger.error(f"Error updating video {key}: {e}")
 
-    def _update_video_table(self, records: list[dict[str, Any]]) -> None:
+    def _update_video_table(self, records: list[dict[str, Any]]) -> bool:
         """Upsert records into the videos table.
 
         Parameters
         ----------
         records : list[dict[str, Any]]
             A list of dictionaries representing records to upsert.
+
+        Returns
+        -------
+        bool
+            False if the DB write failed, True otherwise.
         """
         if not records:
-            return
+            return True
 
         updated_records = []
         for record in records:
@@ -525,7 +601,10 @@ class VideoRepository(BaseRepository):
                 continue
 
             # Apply defaults only if not already present in record
-            updated_record = {k: v for k, v in record.items() if not (k == "title" and v is None)}
+            if "title" in record and record["title"] is None:
+                updated_record = {k: v for k, v in record.items() if k != "title"}
+            else:
+                updated_record = record.copy()
             if "last_updated" not in updated_record:
                 updated_record["last_updated"] = last_updated_factory()
             if "deleted" not in updated_record:
@@ -533,24 +612,30 @@ class VideoRepository(BaseRepository):
 
             updated_records.append(updated_record)
 
+        if not updated_records:
+            return True
+
         try:
             with Session(self.sql_client.engine) as session:
-                stmt = sqlite_insert(VideosTable).values(updated_records)
-
-                # Build updates dictionary only for columns present in records
-                # Get columns from the first record (all records should have same structure)
-                if updated_records:
-                    record_keys = set(updated_records[0].keys()) - {"id"}
-                    updates = {col_name: stmt.excluded[col_name] for col_name in record_keys}
+                # Most records are new videos, so insert first and skip
+                # any that already exist...
+                stmt = (
+                    sqlite_insert(VideosTable)
+                    .values(updated_records)
+                    .on_conflict_do_nothing(index_elements=["id"])
+                    .returning(VideosTable.id)
+                )
+                inserted_ids = {row[0] for row in session.execute(stmt)}
 
-                    stmt = stmt.on_conflict_do_update(
-                        index_elements=["id"],
-                        set_=updates,
-                    )
-                    session.execute(stmt)
-                    session.commit()
+                # ...then only update the ones that collided
+                collided = [r for r in updated_records if r["id"] not in inserted_ids]
+                if collided:
+                    session.execute(update(VideosTable), collided)
+                session.commit()
+                return True
         except (SQLAlchemyError, TypeError) as e:
             self.logger.error(f"Error inserting/updating VideosTable: {e}")
+            return False
 
     def _get_video_ids(self) -> list[str]:
         """Get all video IDs from the database.
@@ -1,13 +1,42 @@
 """Module providing YouTube Data Access Object (DAO)."""
 
+import hashlib
+import json
+import os
+import tempfile
+import time
+from functools import lru_cache
 from logging import Logger, getLogger
+from pathlib import Path
 from typing import Any, Optional
 
 from yt_dlp import DownloadError, YoutubeDL
 
+from tools.config.app_config import YarkieSettings
 from tools.data_access.video_logger import SilentVideoLogger
 from tools.models.models import DeletedYoutubeObj, Playlist, Video, YoutubeObj
 
+# The playlist is not part of the memoized info, as the same video can
+# belong to several; it is set on the copy instead
+_VIDEO_FIELDS = tuple(field for field in Video.model_fields if field != "playlist_id")
+
+# Fields defaulting to a value computed for each record, i.e. timestamps
+_VIDEO_FACTORY_FIELDS = tuple(
+    field for field, info in Video.model_fields.items() if info.default_factory is not None
+)
+
+
+@lru_cache(maxsize=4096)
+def _validate_video(fields: tuple[tuple[str, Any], ...]) -> Video:
+    """Validate video info, memoized on the fields Video actually uses.
+
+    The same video is often returned more than once in a run, i.e. when
+    it belongs to more than one playlist, so there is no need to validate
+    it again. Callers must copy the result, as it is shared, and set the
+    playlist_id and any factory defaults on the copy.
+    """
+    return Video.model_validate(dict(fields))
+
 
 class YoutubeDAO:
     """Handles data access for YouTube information retrieval."""
@@ -19,15 +48,30 @@ class YoutubeDAO:
         "ignore_no_formats_error": True,
     }
 
-    def __init__(self, logger: Optional[Logger] = None):
-        """Initialize the YouTube DAO."""
+    def __init__(
+        self,
+        logger: Optional[Logger] = None,
+        cache_path: Optional[Path] = None,
+        cache_ttl: int = 0,
+    ):
+        """Initialize the YouTube DAO.
+
+        Args:
+            - logger: Optional logger instance.
+            - cache_path: Where to keep the info fetched from YouTube.
+            - cache_ttl: How many seconds cached info is reused for; the
+              cache is off if 0 or there is no cache_path.
+        """
         self.l = logger or getLogger(__name__)
+        self.cache_path = cache_path
+        self.cache_ttl = cache_ttl
 
-    def get_info(self, keys: tuple[str, ...]) -> list[YoutubeObj]:
+    def get_info(self, keys: tuple[str, ...], refresh: bool = False) -> list[YoutubeObj]:
         """Retrieve YouTube information for the given key.
 
         Args:
             - key: The YouTube video or playlist identifier.
+            - refresh: Fetch from YouTube even if there is cached info.
 
         Returns:
             A list of YouTube objects representing videos or playlists.
@@ -36,12 +80,14 @@ class YoutubeDAO:
 
         for key in keys:
             self.l.info(f"Tackling {key}")
-            extracted: dict[str, Any] = {}
+            extracted: dict[str, Any] | None = None if refresh else self._read_cache(key)
             try:
-                with YoutubeDL(self.ydl_settings) as ydl:
-                    extracted = ydl.extract_info(key, download=False)
+                if extracted is None:
+                    with YoutubeDL(self.ydl_settings) as ydl:
+                        extracted = ydl.extract_info(key, download=False)
+                    self._write_cache(key, extracted)
 
-                    self.l.debug(f"Extracted: {extracted['title']}")
+                self.l.debug(f"Extracted: {extracted['title']}")
 
                 if "entries" in extracted:
                     # it's a playlist
@@ -68,6 +114,50 @@ class YoutubeDAO:
 
         return info
 
+    def _cache_file(self, key: str) -> Path | None:
+        """Return the file the info for key is cached in, if caching."""
+        if not self.cache_path or self.cache_ttl <= 0:
+            return None
+        return self.cache_path / f"{hashlib.sha1(key.encode()).hexdigest()}.json"
+
+    def _read_cache(self, key: str) -> dict[str, Any] | None:
+        """Return the cached info for key, unless missing or expired."""
+        cache_file = self._cache_file(key)
+        if not cache_file:
+            return None
+        try:
+            if time.time() - cache_file.stat().st_mtime > self.cache_ttl:
+                return None
+            with cache_file.open() as f:
+                self.l.debug("Using cached info for %s", key)
+                cached: dict[str, Any] = json.load(f)
+                return cached
+        except (OSError, ValueError):
+            return None
+
+    def _write_cache(self, key: str, extracted: dict[str, Any]) -> None:
+        """Cache the info for key, ignoring errors.
+
+        It is written to a file of its own, then moved in place, so that an
+        interrupted run never leaves half the info behind.
+        """
+        cache_file = self._cache_file(key)
+        if not cache_file:
+            return
+        tmp_file: Optional[Path] = None
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                "w", dir=cache_file.parent, suffix=".tmp", delete=False
+            ) as f:
+                tmp_file = Path(f.name)
+                json.dump(YoutubeDL.sanitize_info(extracted), f)
+            os.replace(tmp_file, cache_file)
+        except (OSError, TypeError, ValueError) as e:
+            self.l.warning("Could not cache info for %s: %s", key, e)
+            if tmp_file:
+                tmp_file.unlink(missing_ok=True)
+
     def _extract_video_info(
         self, video_info: dict[str, Any], playlist_id: str | None = None
     ) -> YoutubeObj:
@@ -86,12 +176,32 @@ class YoutubeDAO:
         try:
             video_info["playlist_id"] = playlist_id
 
-            return Video.model_validate(video_info)
+            fields = tuple(
+                (field, video_info[field]) for field in _VIDEO_FIELDS if field in video_info
+            )
+            try:
+                hash(fields)
+            except TypeError:
+                # unexpected non-scalar values, can't be cached
+                return Video.model_validate(video_info)
+            update: dict[str, Any] = {
+                field: Video.model_fields[field].get_default(call_default_factory=True)
+                for field in _VIDEO_FACTORY_FIELDS
+                if field not in video_info
+            }
+            update["playlist_id"] = playlist_id
+            return _validate_video(fields).model_copy(update=update)
         except Exception as e:
             self.l.error(f"_extract_video_info error for video {video_info['id']}: {e}")
             return DeletedYoutubeObj(id=video_info["id"], playlist_id=playlist_id)
 
 
-def youtube_dao(logger: Optional[Logger] = None) -> YoutubeDAO:
-    """Return a YoutubeDAO instance."""
-    return YoutubeDAO(logger=logger)
+def youtube_dao(
+    *, logger: Optional[Logger] = None, config: Optional[YarkieSettings] = None
+) -> YoutubeDAO:
+    """Return a YoutubeDAO instance, caching info as per config if given."""
+    if not config:
+        return YoutubeDAO(logger=logger)
+    return YoutubeDAO(
+        logger=logger, cache_path=config.info_cache_path, cache_ttl=config.info_cache_ttl
+    )
@@ -0,0 +1,45 @@
+"""Module providing string cleaning utilities."""
+
+
+def strip_parens(text: str) -> str:
+    """
+    Remove all the " (...)" spans from a string.
+
+    Same as re.sub(r" \\(.*?\\)", "", text), without the regex engine.
+
+    Args:
+        - text: The string to clean.
+
+    Returns:
+        The string without the parenthesised spans.
+    """
+    parts = []
+    start = 0
+    while (opening := text.find(" (", start)) != -1:
+        closing = text.find(")", opening + 2)
+        if closing == -1:
+            break
+        if "\n" in text[opening:closing]:
+            # like '.', a span doesn't go across lines
+            parts.append(text[start : opening + 1])
+            start = opening + 1
+            continue
+        parts.append(text[start:opening])
+        start = closing + 1
+    parts.append(text[start:])
+    return "".join(parts)
+
+
+def strip_the_prefix(text: str) -> str:
+    """
+    Remove a leading "the " from a string, whatever its case.
+
+    Args:
+        - text: The string to clean.
+
+    Returns:
+        The string without the leading "the", and the whitespace after it.
+    """
+    if text[:3].lower() == "the" and text[3:4].isspace():
+        return text[3:].lstrip()
+    return text
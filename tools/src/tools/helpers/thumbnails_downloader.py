@@ -1,8 +1,10 @@
 """Module providing a thumbnails downloader utility."""
 
 import asyncio
+from collections import defaultdict
 from logging import Logger, getLogger
 from typing import Optional
+from urllib.parse import urlparse
 
 from aiohttp import ClientResponse, ClientSession
 
@@ -10,16 +12,25 @@ from tools.config.app_config import YarkieSettings
 from tools.data_access.file_repository import FileRepository, file_repository
 from tools.data_access.video_repository import VideoRepository
 
+# Max number of in-flight requests, overall and to any single host
+MAX_CONCURRENT_DOWNLOADS = 32
+PER_HOST_LIMIT = 8
 
-def thumbnails_downloader(
+
+async def thumbnails_downloader_async(
     key_url_pairs: list[tuple[str, str]],
     video_repository: VideoRepository,
     config: YarkieSettings,
     file_repo: Optional[FileRepository] = None,
     logger: Optional[Logger] = None,
+    concurrency: int = MAX_CONCURRENT_DOWNLOADS,
 ) -> None:
     """Download thumbnails for the given key-url pairs.
 
+    Async version of thumbnails_downloader, for callers that already
+    run an event loop. Requests run concurrently, capped overall and
+    per host, so that a slow host doesn't hold up the others.
+
     Args:
         - key_url_pairs: A list of tuples containing video keys and
           thumbnail URLs.
@@ -27,16 +38,14 @@ def thumbnails_downloader(
         - config: Application configuration settings.
         - file_repo: An optional FileRepository instance (default is created).
         - logger: Optional logger instance for consistent logging across the app.
+        - concurrency: Max number of requests in flight at any one time.
     """
     log = logger or getLogger(__name__)
-    if not file_repo:
-        file_repo = file_repository(config=config, logger=log)
-
-    async def run_fetch_jobs() -> None:
-        """Run asynchronous jobs to fetch thumbnails."""
-        async with ClientSession() as session:
-            tasks = [fetch_a_thumbnail(key, url, session) for (key, url) in key_url_pairs]
-            await asyncio.gather(*tasks)
+    all_hosts = asyncio.Semaphore(concurrency)
+    repo = file_repo or file_repository(config=config, logger=log)
+    host_semaphores: defaultdict[str, asyncio.Semaphore] = defaultdict(
+        lambda: asyncio.Semaphore(PER_HOST_LIMIT)
+    )
 
     async def fetch_a_thumbnail(key: str, url: str, session: ClientSession) -> None:
         """Fetch a thumbnail from the provided URL.
@@ -47,12 +56,50 @@ def thumbnails_downloader(
             - session: An aiohttp ClientSession instance.
         """
         try:
-            resp: ClientResponse = await session.request(method="GET", url=url)
-            resp.raise_for_status()
-            image: bytes = await resp.read()
-            moved_to = await file_repo.write_thumbnail(key=key, image=image)
+            # per host first, so that requests queued for a slow host
+            # don't take up slots other hosts could use
+            async with host_semaphores[urlparse(url).hostname or ""], all_hosts:
+                resp: ClientResponse = await session.request(method="GET", url=url)
+                resp.raise_for_status()
+                image: bytes = await resp.read()
+            moved_to = await repo.write_thumbnail(key=key, image=image)
             video_repository.mark_thumbnail_downloaded(key=key, local_file=moved_to)
         except Exception:
             """Errors are ignored."""
 
-    asyncio.run(run_fetch_jobs())
+    async with ClientSession() as session:
+        tasks = [fetch_a_thumbnail(key, url, session) for (key, url) in key_url_pairs]
+        await asyncio.gather(*tasks)
+
+
+def thumbnails_downloader(
+    key_url_pairs: list[tuple[str, str]],
+    video_repository: VideoRepository,
+    config: YarkieSettings,
+    file_repo: Optional[FileRepository] = None,
+    logger: Optional[Logger] = None,
+    concurrency: int = MAX_CONCURRENT_DOWNLOADS,
+) -> None:
+    """Download thumbnails for the given key-url pairs.
+
+    Synchronous wrapper around thumbnails_downloader_async.
+
+    Args:
+        - key_url_pairs: A list of tuples containing video keys and
+          thumbnail URLs.
+        - video_repository: A VideoRepository instance for marking downloads.
+        - config: Application configuration settings.
+        - file_repo: An optional FileRepository instance (default is created).
+        - logger: Optional logger instance for consistent logging across the app.
+        - concurrency: Max number of requests in flight at any one time.
+    """
+    asyncio.run(
+        thumbnails_downloader_async(
+            key_url_pairs=key_url_pairs,
+            video_repository=video_repository,
+            config=config,
+            file_repo=file_repo,
+            logger=logger,
+            concurrency=concurrency,
+        )
+    )
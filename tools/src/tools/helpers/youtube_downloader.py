@@ -1,8 +1,10 @@
 """Module providing a YouTube downloader utility."""
 
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial
 from logging import Logger, getLogger
 from pathlib import Path
+from threading import RLock
 from typing import Any, Optional
 
 from yt_dlp import YoutubeDL, postprocessor
@@ -13,16 +15,63 @@ from tools.data_access.video_logger import SilentVideoLogger
 from tools.data_access.video_repository import VideoRepository
 from tools.helpers.hooks import downloading_hook
 
+# Split each file in 16 1MB chunks, downloaded over 16 connections
+ARIA2C_ARGS = ["-x", "16", "-s", "16", "-k", "1M"]
+
+# How many downloaded videos MovePP collects before writing them to the DB
+FLUSH_EVERY = 64
+
+
+class DownloadedVideos:
+    """Videos moved after download, written to the DB in batches.
+
+    It is thread safe, so that it can be shared by the MovePP of each worker.
+    """
+
+    def __init__(self, video_repository: VideoRepository):
+        """Collect downloaded videos for the given repository."""
+        self.video_repository = video_repository
+        self._downloaded: list[tuple[str, str]] = []
+        self._moved: dict[str, str] = {}
+        self._lock = RLock()
+
+    def add(self, key: str, moved_to: str) -> None:
+        """Record a downloaded video, writing a batch to the DB when full."""
+        with self._lock:
+            self._downloaded.append((key, moved_to))
+            self._moved[key] = moved_to
+            if len(self._downloaded) >= FLUSH_EVERY:
+                self.flush()
+
+    @property
+    def moved(self) -> dict[str, str]:
+        """Videos moved so far, with where they were moved to."""
+        return self._moved
+
+    def flush(self) -> None:
+        """Mark the videos moved so far as downloaded in the DB.
+
+        If this never happens (i.e. the process is killed) the files are
+        still on disk, and ArchiverService.sync_local will pick them up.
+        """
+        with self._lock:
+            self.video_repository.mark_videos_downloaded(self._downloaded)
+            self._downloaded = []
+
 
 # error: Class cannot subclass "PostProcessor" (has type "Any")
 # probably due to MetaClass
 class MovePP(postprocessor.PostProcessor):
-    """YoutubeDL post-processor, called after download."""
+    """YoutubeDL post-processor, called after download.
+
+    Each YoutubeDL instance needs one of its own; they can share the
+    DownloadedVideos they report to.
+    """
 
     def __init__(
         self,
         file_repo: FileRepository,
-        video_repository: VideoRepository,
+        downloaded: DownloadedVideos,
         logger: Logger,
         *args: tuple[Any],
         **kwargs: dict[str, Any],
@@ -30,17 +79,48 @@ class MovePP(postprocessor.PostProcessor):
         """Move downloaded videos to the final destination."""
         super().__init__(*args, **kwargs)
         self.file_repo = file_repo
-        self.video_repository = video_repository
+        self.downloaded = downloaded
         self.logger = logger
 
     def run(self, information):
-        """Run the post-processing steps after a video is downloaded."""
-        moved_to = self.file_repo.move_video_after_download(Path(information["_filename"]))
-        self.video_repository.mark_video_downloaded(key=information.get("id"), local_file=moved_to)
-        self.logger.debug(f"Moved from {Path(information['_filename'])} to {moved_to}")
+        """Run the post-processing steps after a video is downloaded.
+
+        The DB is updated in batches, see DownloadedVideos.
+        """
+        src = Path(information["_filename"])
+        moved_to = self.file_repo.move_video_after_download(src)
+        self.downloaded.add(information.get("id"), moved_to)
+        # lazy formatting, this runs once per video
+        self.logger.debug("Moved from %s to %s", src, moved_to)
         return [], information
 
 
+def _download(
+    *,
+    keys: list[str],
+    ydl_settings: dict[str, Any],
+    file_repo: FileRepository,
+    downloaded: DownloadedVideos,
+    logger: Logger,
+) -> None:
+    """Download videos with a YoutubeDL instance of their own.
+
+    Args:
+        - keys: A list of video keys to download.
+        - ydl_settings: Settings for YoutubeDL, copied as it may alter them.
+        - file_repo: The FileRepository the downloaded videos are moved with.
+        - downloaded: Where the downloaded videos are collected.
+        - logger: Logger instance.
+    """
+    move_pp = MovePP(file_repo=file_repo, downloaded=downloaded, logger=logger)
+    with YoutubeDL(dict(ydl_settings)) as ydl:
+        ydl.add_post_processor(move_pp, when="after_move")
+        try:
+            ydl.download(keys)
+        except Exception as e:
+            logger.error(f"Downloading failed {e}")
+
+
 def youtube_downloader(
     *,
     keys: list[str],
@@ -48,7 +128,7 @@ def youtube_downloader(
     file_repo: Optional[FileRepository] = None,
     config: YarkieSettings,
     logger: Optional[Logger] = None,
-) -> None:
+) -> dict[str, str]:
     """Download videos from YouTube using provided keys.
 
     Args:
@@ -57,6 +137,9 @@ def youtube_downloader(
         - file_repo: An optional FileRepository instance (default is created).
         - config: Application configuration settings.
         - logger: Optional logger instance for consistent logging across the app.
+
+    Returns:
+        A dict of the keys that were downloaded, and where they were moved to.
     """
     log = logger or getLogger(__name__)
     if not file_repo:
@@ -68,23 +151,42 @@ def youtube_downloader(
         "merge_output_format": config.video_ext,
         "remux_video": config.video_ext,
         "format_sort": {"vcodec": "h264,lang,quality,res,fps", "hdr": 12, "acodec": "aac"},
-        "concurrent_fragment_downloads": 8,
+        "concurrent_fragment_downloads": config.concurrent_fragments,
         "ignore_no_formats_error": True,
         "outtmpl": f"{config.download_path}/%(id)s.%(ext)s",
         "retries": 3,
+        # bytes/s below which a fragment counts as throttled and is re-requested
+        "throttledratelimit": 100_000,
         "extractor_args": {
             "youtube:player-client": "default,-web_safari",
             "player_js_version": "actual",
         },
         "js_runtimes": {"node": {"path": "/opt/homebrew/bin/node"}},
     }
+    if config.external_downloader:
+        ydl_settings["external_downloader"] = {"default": config.external_downloader}
+        if config.external_downloader == "aria2c":
+            ydl_settings["external_downloader_args"] = {"aria2c": ARIA2C_ARGS}
 
-    with YoutubeDL(ydl_settings) as ydl:
-        ydl.add_post_processor(
-            MovePP(file_repo=file_repo, video_repository=video_repository, logger=log),
-            when="after_move",
-        )
-        try:
-            ydl.download(keys)
-        except Exception as e:
-            log.error(f"Downloading failed {e}")
+    downloaded = DownloadedVideos(video_repository=video_repository)
+    download = partial(
+        _download,
+        ydl_settings=ydl_settings,
+        file_repo=file_repo,
+        downloaded=downloaded,
+        logger=log,
+    )
+    workers = min(config.download_workers, len(keys))
+    try:
+        if workers <= 1:
+            download(keys=keys)
+        else:
+            # YoutubeDL downloads one video after the other, and much of
+            # that time is spent waiting on YouTube; run a few side by side
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(download, keys=keys[i::workers]) for i in range(workers)]
+            for future in futures:
+                future.result()
+    finally:
+        downloaded.flush()
+    return downloaded.moved
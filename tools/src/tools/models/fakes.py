@@ -1,17 +1,48 @@
 """Provide factories for fake versions of models."""
 
+from collections.abc import Callable
 from datetime import datetime
+from itertools import cycle
+from typing import Any, TypeVar
 
 from faker import Faker
 from polyfactory import Use
 from polyfactory.factories.pydantic_factory import ModelFactory
+from pydantic import BaseModel
 
 from tools.models.models import DeletedYoutubeObj, Playlist, Video
 
 faker_instance = Faker()
 
+# Faker is slow; building thousands of fakes spent most of the time in
+# it. Values are generated once and handed out round-robin instead.
+POOL_SIZE = 1024
+_titles = cycle([faker_instance.sentence() for _ in range(POOL_SIZE)])
+_urls = cycle([faker_instance.url() for _ in range(POOL_SIZE)])
+_timestamps = cycle([faker_instance.iso8601(end_datetime=datetime.now()) for _ in range(POOL_SIZE)])
 
-class FakePlaylistFactory(ModelFactory[Playlist]):
+T = TypeVar("T", bound=BaseModel)
+_provider_maps: dict[type, dict[Any, Callable[[], Any]]] = {}
+
+
+class _CachedProvidersFactory(ModelFactory[T]):
+    """
+    ModelFactory that builds its type-to-provider map only once.
+
+    PolyFactory rebuilds the map for every field of every instance, which
+    took most of the time of a build.
+    """
+
+    __is_base_factory__ = True
+
+    @classmethod
+    def get_provider_map(cls) -> dict[Any, Callable[[], Any]]:
+        if cls not in _provider_maps:
+            _provider_maps[cls] = super().get_provider_map()
+        return _provider_maps[cls]
+
+
+class FakePlaylistFactory(_CachedProvidersFactory[Playlist]):
     """
     Factory class for Playlist instances with mock data.
 
@@ -30,12 +61,12 @@ class FakePlaylistFactory(ModelFactory[Playlist]):
     __model__ = Playlist
     __faker__ = faker_instance
 
-    title = Use(faker_instance.sentence)
-    last_updated = Use(lambda: faker_instance.iso8601(end_datetime=datetime.now()))
+    title = Use(lambda: next(_titles))
+    last_updated = Use(lambda: next(_timestamps))
     enabled = True
 
 
-class FakeVideoFactory(ModelFactory[Video]):
+class FakeVideoFactory(_CachedProvidersFactory[Video]):
     """
     Factory class for Video instances with mock data.
 
@@ -53,10 +84,10 @@ class FakeVideoFactory(ModelFactory[Video]):
     __model__ = Video
     __faker__ = faker_instance
 
-    thumbnail = Use(faker_instance.url)
+    thumbnail = Use(lambda: next(_urls))
 
 
-class FakeDeletedVideoFactory(ModelFactory[DeletedYoutubeObj]):
+class FakeDeletedVideoFactory(_CachedProvidersFactory[DeletedYoutubeObj]):
     """
     Factory class for Video instances with mock data.
 
@@ -1,11 +1,35 @@
 """Provide Pydantic models for DB table structure."""
 
+from collections.abc import Generator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime
 from typing import Callable, Optional, TypeAlias
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
-last_updated_factory: Callable[[], str] = lambda: datetime.now().isoformat()
+_frozen_now: ContextVar[datetime | None] = ContextVar("_frozen_now", default=None)
+
+
+def now() -> datetime:
+    """Return the current time, or the one frozen by frozen_now()."""
+    return _frozen_now.get() or datetime.now()
+
+
+@contextmanager
+def frozen_now() -> Generator[datetime]:
+    """Read the clock once, for all the records created or updated within.
+
+    This way a batch of records shares the same last_updated.
+    """
+    token = _frozen_now.set(datetime.now())
+    try:
+        yield now()
+    finally:
+        _frozen_now.reset(token)
+
+
+last_updated_factory: Callable[[], str] = lambda: now().isoformat()
 
 
 class Playlist(BaseModel, extra="ignore"):
@@ -22,11 +46,11 @@ class Playlist(BaseModel, extra="ignore"):
     id: str  # noqa: A003
     title: str
     description: str | None = None
-    last_updated: datetime = Field(default_factory=datetime.now)
+    last_updated: datetime = Field(default_factory=now)
     enabled: bool = True
 
 
-class Video(BaseModel, extra="ignore"):
+class Video(BaseModel):
     """
     Data structure for basic rows of Videos table in DB.
 
@@ -61,6 +85,8 @@ class Video(BaseModel, extra="ignore"):
         (default is the current timestamp).
     """
 
+    model_config = ConfigDict(from_attributes=True, extra="ignore")
+
     id: str  # noqa: A003
     playlist_id: str | None = None
     title: str
@@ -74,7 +100,7 @@ class Video(BaseModel, extra="ignore"):
     thumbnail: Optional[str] = ""
     deleted: bool = False
     downloaded: bool = False
-    last_updated: datetime = Field(default_factory=datetime.now)
+    last_updated: datetime = Field(default_factory=now)
 
 
 class DeletedYoutubeObj(BaseModel, extra="ignore"):
@@ -94,7 +120,7 @@ class DeletedYoutubeObj(BaseModel, extra="ignore"):
     id: str  # noqa: A003 # cannot be changed as it comes from DB
     playlist_id: str | None = None
     deleted: bool = True
-    last_updated: datetime = Field(default_factory=datetime.now)
+    last_updated: datetime = Field(default_factory=now)
 
     def is_playlist(self) -> bool:
         """Guess whether entry is a playlist.
@@ -102,7 +128,7 @@ class DeletedYoutubeObj(BaseModel, extra="ignore"):
         This is a guess because this object may have been created
         without actually connecting to YouTube.
         """
-        return self.id[:3] == "PLZ" and len(self.id) > 12
+        return len(self.id) > 12 and self.id.startswith("PLZ")
 
 
 YoutubeObj: TypeAlias = Playlist | Video | DeletedYoutubeObj
@@ -126,7 +152,7 @@ class DiscogsArtist(BaseModel):
     name: str
     profile: str | None = None
     uri: str
-    last_updated: datetime = Field(default_factory=datetime.now)
+    last_updated: datetime = Field(default_factory=now)
 
 
 class DiscogsRelease(BaseModel):
@@ -137,7 +163,7 @@ class DiscogsRelease(BaseModel):
     styles: list[str] = Field(default_factory=list)
     released: int
     uri: str
-    last_updated: datetime = Field(default_factory=datetime.now)
+    last_updated: datetime = Field(default_factory=now)
 
 
 class DiscogsTrack(BaseModel):
@@ -13,6 +13,9 @@ from tools.services.thumbnail_downloader_service import ThumbnailDownloaderServi
 from tools.services.video_downloader_service import VideoDownloaderService
 from tools.services.video_sync_service import VideoSyncService
 
+# Thumbnails still to download are stored as their remote URL
+REMOTE_PREFIXES = ("http://", "https://")
+
 
 class ArchiverService:
     """Service for archiving YouTube data."""
@@ -54,7 +57,7 @@ class ArchiverService:
             An optional file repository instance, by default None.
         """
         self.logger = logger or getLogger(__name__)
-        self.youtube = youtube or youtube_dao(logger=self.logger)
+        self.youtube = youtube or youtube_dao(logger=self.logger, config=config)
         self.playlist_repository = playlist_repository
         self.video_repository = video_repository
         self.sync_service = sync_service
@@ -73,20 +76,24 @@ class ArchiverService:
             logger=self.logger,
         )
 
-    def refresh_playlist(self, keys: tuple[str, ...] | None = None) -> None:
+    def refresh_playlist(
+        self, keys: tuple[str, ...] | None = None, *, refresh_metadata: bool = False
+    ) -> None:
         """Refresh the specified playlist.
 
         Parameters
         ----------
         keys : The keys identifying the playlist. If empty it will do
         _all_ the playlists in the DB (but not the videos)
+        refresh_metadata : Ignore any cached info from YouTube, by
+        default False
         """
         playlist_keys = keys or self.playlist_repository.get_all_playlists_keys()
 
         self.logger.info(f"Now refreshing: {playlist_keys}")
 
         # Get fresh information from YouTube
-        fresh_info = self._get_info_from_youtube(keys=playlist_keys)
+        fresh_info = self._get_info_from_youtube(keys=playlist_keys, refresh=refresh_metadata)
 
         # Check if there are videos
         if not fresh_info:
@@ -107,18 +114,27 @@ class ArchiverService:
         self._download_thumbnails(videos_to_download=videos_to_download)
         self._refresh_database(fresh_info=fresh_info)
 
-    def _get_info_from_youtube(self, keys: tuple[str, ...]) -> list[YoutubeObj]:
+    def _get_info_from_youtube(
+        self, keys: tuple[str, ...], refresh: bool = False
+    ) -> list[YoutubeObj]:
         """Get playlist/video info from YouTube and handle errors.
 
+        Parameters
+        ----------
+        keys : tuple[str, ...]
+            The playlists/videos to get info for.
+        refresh : bool, optional
+            Whether to skip the info cache, by default False.
+
         Returns
         -------
         List of YouTube objects containing information about videos
         and playlists.
         """
         self.logger.info("Getting info from youtube (this will take a while)...")
-        fresh_info = self.youtube.get_info(keys)
+        fresh_info = self.youtube.get_info(keys, refresh=refresh)
         if fresh_info:
-            self.logger.debug(f"...found {len(fresh_info) - 1} videos in total")
+            self.logger.debug("...found %d videos in total", len(fresh_info) - 1)
         return fresh_info
 
     def _update_db_records(self, fresh_info: list[YoutubeObj]) -> None:
@@ -143,7 +159,7 @@ class ArchiverService:
         # That will be dealt with by the downloaders.
         videos_to_download = self.video_repository.pass_needs_download(fresh_info)
         if videos_to_download:
-            self.logger.debug(f"{len(videos_to_download)} need downloading")
+            self.logger.debug("%d need downloading", len(videos_to_download))
         return videos_to_download
 
     def _filter_videos_needing_files(self, videos: list[Video]) -> list[str]:
@@ -175,9 +191,9 @@ class ArchiverService:
             List of (video_id, thumbnail_url) pairs for videos needing thumbnails.
         """
         return [
-            (video.id, video.thumbnail)
+            (video.id, thumbnail)
             for video in videos
-            if video.thumbnail is not None and video.thumbnail.startswith("http")
+            if (thumbnail := video.thumbnail) and thumbnail.startswith(REMOTE_PREFIXES)
         ]
 
     def _download_videos(self, videos_to_download: list[Video]) -> None:
@@ -198,7 +214,25 @@ class ArchiverService:
         self.video_repository.refresh_deleted_videos(all_videos=fresh_info)
         self.video_repository.refresh_download_field()
 
-    def _sync_video_file(self, *, video: Video, download: bool) -> bool:
+    def _snapshot_files(self) -> tuple[set[str], set[str]]:
+        """Take a snapshot of the video and thumbnail files on disk.
+
+        Returns
+        -------
+        tuple[set[str], set[str]]
+            The ids of the videos and of the thumbnails found on disk.
+        """
+        return self.file_repo.existing_video_ids(), self.file_repo.existing_thumbnail_ids()
+
+    def _video_file_exists(self, video_id: str, existing_videos: set[str] | None) -> bool:
+        """Check whether a video file is on disk, using the snapshot if there is one."""
+        if existing_videos is None:
+            return self.file_repo.video_file_exists(video_id)
+        return video_id in existing_videos
+
+    def _sync_video_file(
+        self, *, video: Video, download: bool, existing_videos: set[str] | None = None
+    ) -> bool:
         """Sync video file with filesystem.
 
         Parameters
@@ -207,6 +241,9 @@ class ArchiverService:
             The video to sync.
         download : bool
             Whether to download missing files.
+        existing_videos : set[str] | None, optional
+            Snapshot of the video ids on disk, by default None, which
+            means the filesystem is checked for each video.
 
         Returns
         -------
@@ -216,26 +253,34 @@ class ArchiverService:
         if video.video_file:
             return False
 
-        self.logger.debug(f"Needs video {video.id} {video.title}...")
+        self.logger.debug("Needs video %s %s...", video.id, video.title)
 
-        if download and not self.file_repo.video_file_exists(video.id):
-            self.logger.info(f"Downloading file for video {video.id}.")
-            self.video_downloader.download_videos(keys=[video.id])
-
-        if self.file_repo.video_file_exists(video.id):
+        if self._video_file_exists(video.id, existing_videos):
             self.logger.debug("...file found for video, updating record.")
             video.video_file = str(self.file_repo.make_video_path(video.id))
             return True
 
+        if download:
+            self.logger.info(f"Downloading file for video {video.id}.")
+            downloaded = self.video_downloader.download_videos(keys=[video.id])
+            if video.id in downloaded:
+                video.video_file = downloaded[video.id]
+                return True
+
         return False
 
-    def _sync_thumbnail_file(self, video: Video) -> bool:
+    def _sync_thumbnail_file(
+        self, video: Video, existing_thumbnails: set[str] | None = None
+    ) -> bool:
         """Sync thumbnail file with filesystem.
 
         Parameters
         ----------
         video : Video
             The video to sync.
+        existing_thumbnails : set[str] | None, optional
+            Snapshot of the thumbnail ids on disk, by default None, which
+            means the filesystem is checked for each video.
 
         Returns
         -------
@@ -245,9 +290,14 @@ class ArchiverService:
         if video.thumbnail:
             return False
 
-        self.logger.debug(f"Needs thumbnail {video.id} {video.title}...")
+        self.logger.debug("Needs thumbnail %s %s...", video.id, video.title)
+
+        if existing_thumbnails is None:
+            thumbnail_exists = self.file_repo.thumbnail_file_exists(video.id)
+        else:
+            thumbnail_exists = video.id in existing_thumbnails
 
-        if self.file_repo.thumbnail_file_exists(video.id):
+        if thumbnail_exists:
             self.logger.debug("...file found for thumbnail, updating record.")
             video.thumbnail = str(self.file_repo.make_thumbnail_path(video.id))
             return True
@@ -268,15 +318,20 @@ class ArchiverService:
             True if the flag was updated, False otherwise.
         """
         if video.thumbnail and video.video_file and not video.downloaded:
-            self.logger.debug(f"Flipping downloaded flag for {video.id}")
+            self.logger.debug("Flipping downloaded flag for %s", video.id)
             video.downloaded = True
             return True
 
         return False
 
     def _sync_video_with_filesystem(
-        self, *, video: Video, download: bool
-    ) -> dict[str, str | bool] | None:
+        self,
+        *,
+        video: Video,
+        download: bool,
+        existing_videos: set[str] | None = None,
+        existing_thumbnails: set[str] | None = None,
+    ) -> dict[str, str | bool | None] | None:
         """Sync a single video with filesystem.
 
         Parameters
@@ -285,19 +340,32 @@ class ArchiverService:
             The video to sync.
         download : bool
             Whether to download missing files.
+        existing_videos : set[str] | None, optional
+            Snapshot of the video ids on disk, by default None.
+        existing_thumbnails : set[str] | None, optional
+            Snapshot of the thumbnail ids on disk, by default None.
 
         Returns
         -------
-        dict[str, str | bool] | None
+        dict[str, str | bool | None] | None
             Video data if updated, None otherwise.
         """
-        video_updated = self._sync_video_file(video=video, download=download)
-        thumbnail_updated = self._sync_thumbnail_file(video=video)
+        video_updated = self._sync_video_file(
+            video=video, download=download, existing_videos=existing_videos
+        )
+        thumbnail_updated = self._sync_thumbnail_file(
+            video=video, existing_thumbnails=existing_thumbnails
+        )
         downloaded_updated = self._update_downloaded_flag(video=video)
 
         if video_updated or thumbnail_updated or downloaded_updated:
-            self.logger.debug(f"Updating video {video.id} {video.title}...")
-            return video.model_dump(include={"id", "thumbnail", "video_file", "downloaded"})
+            self.logger.debug("Updating video %s %s...", video.id, video.title)
+            return {
+                "id": video.id,
+                "thumbnail": video.thumbnail,
+                "video_file": video.video_file,
+                "downloaded": video.downloaded,
+            }
 
         return None
 
@@ -317,10 +385,20 @@ class ArchiverService:
         potentials = self.video_repository.get_videos_needing_download()
         self.logger.info(f"Syncing local DB with files on disk for {len(potentials)} videos...")
 
+        # One read per folder instead of one stat per video
+        existing_videos, existing_thumbnails = self._snapshot_files()
+
         records = [
             update
             for video in potentials
-            if (update := self._sync_video_with_filesystem(video=video, download=download))
+            if (
+                update := self._sync_video_with_filesystem(
+                    video=video,
+                    download=download,
+                    existing_videos=existing_videos,
+                    existing_thumbnails=existing_thumbnails,
+                )
+            )
             is not None
         ]
 
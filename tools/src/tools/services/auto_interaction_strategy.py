@@ -1,4 +1,4 @@
-"""Automated interaction strategy for testing DiscogsProcessor."""
+"""Automated interaction strategy for DiscogsProcessor, for tests and batch runs."""
 
 from typing import Any
 
@@ -9,7 +9,8 @@ class AutoInteractionStrategy:
 
     This strategy is designed for testing and automation, returning
     predefined choices instead of prompting for user input. Useful
-    for unit testing DiscogsProcessor without mocking Click.
+    for unit testing DiscogsProcessor without mocking Click, and for
+    unattended runs (postprocess --auto) with the default choices.
     """
 
     def __init__(
@@ -6,6 +6,7 @@ abstraction layer between business logic and user interaction. Different
 implementations can provide CLI, API, or automated interaction behaviors.
 """
 
+import json
 from typing import Any, Protocol
 
 import click
@@ -13,6 +14,11 @@ import click
 from tools.commands.helpers import prompt_numbered_choice
 
 
+def _format_title(idx: int, item: Any) -> str:
+    """Format a release or track as a numbered choice."""
+    return f"{idx}. {item.title}"
+
+
 class InteractionStrategy(Protocol):
     """
     Protocol for handling user interactions during Discogs processing.
@@ -190,6 +196,18 @@ class CliInteractionStrategy:
     # in lieu of pagination we just cap the number of releases
     max_releases: int = 32
 
+    def __init__(self, *, auto_single: bool = True):
+        """
+        Initialize the strategy.
+
+        Parameters
+        ----------
+        auto_single : bool, optional
+            Whether to pick the only search string or track without
+            prompting, by default True.
+        """
+        self.auto_single = auto_single
+
     def select_search_string(self, *, video_id: str, options: list[str]) -> str | None:
         """
         Prompt user to select or enter a search string.
@@ -210,6 +228,9 @@ class CliInteractionStrategy:
             The selected or custom search string, or None if skipped.
         """
         click.echo(f"\n---------------------------------\nVideo ID: {video_id}")
+        if self.auto_single and len(options) == 1:
+            return options[0]
+
         click.echo("Possible search strings:")
         search_string = prompt_numbered_choice(
             options,
@@ -237,22 +258,23 @@ class CliInteractionStrategy:
             - Custom search string if user wants to search again
             - None if user quits
         """
-        if len(releases) == 0:
+        count = len(releases)
+        if count == 0:
             return None
 
-        if len(releases) == 1:
+        if count == 1:
             # Single result - return immediately
             return releases[0]
 
         # Multiple results - let user select
-        click.echo(f"Found {len(releases)} results")
+        click.echo(f"Found {count} results")
 
         # TODO: implement pagination
         releases = releases[: self.max_releases]
 
         selected = prompt_numbered_choice(
             releases,
-            formatter=lambda idx, result: f"{idx}. {result.title}",
+            formatter=_format_title,
             prompt_text="Which release?",
             allow_custom=True,
             allow_quit=True,
@@ -293,8 +315,6 @@ class CliInteractionStrategy:
         bool
             True if user confirms, False otherwise.
         """
-        import json
-
         click.echo(json.dumps(artist, indent=2, ensure_ascii=False))
         return click.confirm("Use artist?", default=True, show_default=True)
 
@@ -342,11 +362,14 @@ class CliInteractionStrategy:
         if not tracks:
             return None
 
+        if self.auto_single and len(tracks) == 1:
+            return tracks[0]
+
         click.echo(f"This release has {len(tracks)} tracks")
 
         selected_track = prompt_numbered_choice(
             tracks,
-            formatter=lambda idx, track: f"{idx}. {track.title}",
+            formatter=_format_title,
             prompt_text="Which track?",
             allow_quit=True,
         )
@@ -6,16 +6,84 @@ multistep workflow for processing videos with Discogs metadata. It separates
 business logic from user interaction by accepting an InteractionStrategy.
 """
 
-from logging import Logger, getLogger
-from typing import Any
+from concurrent.futures import Future, ThreadPoolExecutor
+from logging import DEBUG, Logger, getLogger
+from typing import Any, Callable
 
 import click
+from discogs_client import Master, Release
 from discogs_client.exceptions import HTTPError
 
 from tools.models.processing_models import ProcessingResult
 from tools.services.discogs_interaction_strategy import InteractionStrategy
 from tools.services.discogs_service import DiscogsService
 
+# How many of the suggested search strings are searched for in parallel,
+# in the background while the user is choosing one; the fetcher keeps the
+# requests within Discogs' rate limit
+PREFETCH_SEARCHES = 3
+
+
+def _release_artists(release: Any) -> list[dict[str, Any]]:
+    """Artists of a Release, converted from Artist objects to dicts."""
+    return [artist.data for artist in release.artists]
+
+
+def _master_artists(master: Any) -> list[dict[str, Any]]:
+    """Artists of a Master, which are already in dict form."""
+    if master.data.get("artists") is None:
+        master.fetch("artists")
+    return list(master.data.get("artists", []))
+
+
+def _release_data(release: Any) -> dict[str, Any]:
+    """The fields of a Release that are saved to the DB."""
+    return {
+        "id": release.id,
+        "title": release.title,
+        "country": release.country,
+        "genres": release.genres,
+        "styles": release.styles,
+        "year": release.year,
+        "url": release.url,
+    }
+
+
+def _master_data(master: Any) -> dict[str, Any]:
+    """The fields of a Master that are saved to the DB."""
+    master.fetch("title")
+    master.fetch("country")
+    return {
+        "id": master.id,
+        "title": master.data.get("title", ""),
+        "country": master.data.get("country", ""),
+        "genres": master.genres,
+        "styles": master.styles,
+        "year": master.year,
+        "url": master.url,
+    }
+
+
+# Search results can be either Release or Master objects, which expose
+# their data differently
+_ARTIST_EXTRACTORS: dict[type, Callable[[Any], list[dict[str, Any]]]] = {
+    Release: _release_artists,
+    Master: _master_artists,
+}
+_RELEASE_DATA_EXTRACTORS: dict[type, Callable[[Any], dict[str, Any]]] = {
+    Release: _release_data,
+    Master: _master_data,
+}
+
+
+def _extractor(extractors: dict[type, Callable[[Any], Any]], release: Any) -> Callable[[Any], Any]:
+    """Pick the extractor for the type of release.
+
+    The type is looked up through __class__ rather than type(), so that
+    mocks spec'd on Release or Master are dispatched the same way.
+    """
+    return extractors[release.__class__]
+
 
 class DiscogsProcessor:
     """
@@ -38,6 +106,7 @@ class DiscogsProcessor:
         discogs_service: DiscogsService,
         interaction_strategy: InteractionStrategy,
         logger: Logger | None = None,
+        prefetch_searches: int = PREFETCH_SEARCHES,
     ):
         """
         Initialize the DiscogsProcessor.
@@ -50,10 +119,129 @@ class DiscogsProcessor:
             Strategy for handling user interaction decisions.
         logger : Logger | None, optional
             Logger instance for logging messages, by default None.
+        prefetch_searches : int, optional
+            How many search strings to search for in the background, by
+            default PREFETCH_SEARCHES. Searches that are never chosen
+            still count towards the rate limit.
         """
         self.discogs_service = discogs_service
         self.interaction_strategy = interaction_strategy
         self.logger = logger or getLogger(__name__)
+        # The same artists come up again and again in a run, and each
+        # API call counts towards Discogs' rate limit
+        self._artists: dict[int, dict[str, Any]] = {}
+        self.prefetch_searches = max(1, prefetch_searches)
+        self._executor = ThreadPoolExecutor(max_workers=self.prefetch_searches)
+        self._prefetched: dict[str, Future[list[Any]]] = {}
+
+    def _prefetch_searches(self, *, search_strings: list[str]) -> None:
+        """
+        Start searching for releases in the background.
+
+        Parameters
+        ----------
+        search_strings : list[str]
+            The search query strings.
+        """
+        # the previous video's searches that were never chosen are not needed
+        self._cancel_prefetched()
+        self._prefetched = {
+            search_string: self._executor.submit(
+                self.discogs_service.search_releases, search_string=search_string
+            )
+            for search_string in search_strings
+        }
+
+    def _cancel_prefetched(self) -> None:
+        """Cancel the background searches that have not started yet."""
+        for prefetched in self._prefetched.values():
+            prefetched.cancel()
+        self._prefetched = {}
+
+    def close(self) -> None:
+        """Stop searching in the background, once done with the processor."""
+        self._cancel_prefetched()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _search_releases(self, *, search_string: str) -> list[Any]:
+        """
+        Search for releases, using the prefetched results if there are any.
+
+        Parameters
+        ----------
+        search_string : str
+            The search query string.
+
+        Returns
+        -------
+        list[Any]
+            A list of Discogs release results.
+        """
+        prefetched = self._prefetched.pop(search_string, None)
+        if prefetched is not None:
+            return prefetched.result()
+        return self.discogs_service.search_releases(search_string=search_string)
+
+    def _get_artist(self, *, artist_id: int) -> dict[str, Any]:
+        """
+        Get an artist's data from Discogs, or from the ones already fetched.
+
+        Failed lookups are not remembered, so they are tried again.
+
+        Parameters
+        ----------
+        artist_id : int
+            The Discogs artist ID.
+
+        Returns
+        -------
+        dict[str, Any]
+            Artist data dictionary with keys: id, name, profile, uri, role.
+
+        Raises
+        ------
+        HTTPError
+            If the artist is not found (404) or other HTTP error occurs.
+        """
+        if artist_id not in self._artists:
+            artist_obj = self.discogs_service.get_artist_by_id(artist_id=artist_id)
+            self._artists[artist_id] = {
+                "id": artist_obj.id,
+                "name": self.discogs_service.clean_artist_name(name=artist_obj.name),
+                "profile": artist_obj.profile,
+                "uri": artist_obj.url,
+                "role": artist_obj.role,
+            }
+        return dict(self._artists[artist_id])
+
+    def _get_release_by_manual_id(self) -> Any | None:
+        """
+        Get a release by an ID the user enters, when a search finds nothing.
+
+        Returns
+        -------
+        Any | None
+            The release object, or None if user skips or release not found.
+
+        Raises
+        ------
+        HTTPError
+            If an HTTP error other than 404 occurs.
+        """
+        release_id_str = self.interaction_strategy.prompt_manual_release_id()
+        if not release_id_str:
+            return None
+        try:
+            release_id = int(release_id_str)
+            return self.discogs_service.get_release_by_id(release_id=release_id)
+        except ValueError:
+            self.logger.error(f"Invalid release ID: {release_id_str}")
+            return None
+        except HTTPError as e:
+            if e.status_code == 404:
+                self.logger.info("Release not found")
+                return None
+            raise
 
     def _select_release(self, *, search_string: str) -> Any | None:
         """
@@ -63,7 +251,8 @@ class DiscogsProcessor:
         - Initial search
         - Manual ID entry if no results
         - User selection from multiple results
-        - Nested search if user enters custom search string
+        - Searching again if user enters custom search string, until
+          they pick a release, quit, or repeat a search
 
         Parameters
         ----------
@@ -75,53 +264,33 @@ class DiscogsProcessor:
         Any | None
             The selected release object, or None if user quits or no release found.
         """
-        # Initial search
-        results = self.discogs_service.search_releases(search_string=search_string)
-
-        # Handle no results - allow manual ID entry
-        if len(results) == 0:
-            self.logger.info("No results found for search string")
-            release_id_str = self.interaction_strategy.prompt_manual_release_id()
-            if release_id_str:
-                try:
-                    release_id = int(release_id_str)
-                    return self.discogs_service.get_release_by_id(release_id=release_id)
-                except ValueError:
-                    self.logger.error(f"Invalid release ID: {release_id_str}")
-                    return None
-                except HTTPError as e:
-                    if e.status_code == 404:
-                        self.logger.info("Release not found")
-                        return None
-                    else:
-                        raise
-            return None
-
-        # Let interaction strategy handle selection
-        selected = self.interaction_strategy.select_release(releases=results)
+        searched: set[str] = set()
+        while True:
+            searched.add(search_string)
+            results = self._search_releases(search_string=search_string)
 
-        if selected is None:
-            # User quit
-            return None
-
-        if isinstance(selected, str):
-            # User entered custom search - retry with new search string
-            results = self.discogs_service.search_releases(search_string=selected)
+            # Handle no results - allow manual ID entry
             if len(results) == 0:
-                self.logger.info("No results found for custom search")
-                return None
+                self.logger.info(f"No results found for {search_string}")
+                return self._get_release_by_manual_id()
 
-            # For nested search, use interaction strategy again but simpler
-            # (no custom search option in nested selection)
-            if len(results) > 1:
-                nested_selected = self.interaction_strategy.select_release(releases=results)
-                if nested_selected is None or isinstance(nested_selected, str):
-                    return None
-                return nested_selected
-            else:
+            # A custom search finding a single release needs no choosing
+            if len(searched) > 1 and len(results) == 1:
                 return results[0]
 
-        return selected
+            # Let interaction strategy handle selection
+            selected = self.interaction_strategy.select_release(releases=results)
+
+            if not isinstance(selected, str):
+                # The selected release, or None if user quit
+                return selected
+
+            if selected in searched:
+                self.logger.info(f"Already searched for {selected}")
+                return None
+
+            # User entered custom search - retry with new search string
+            search_string = selected
 
     def _select_artists(self, *, release: Any) -> list[dict[str, Any]]:
         """
@@ -142,33 +311,24 @@ class DiscogsProcessor:
             Returns empty list if user declines all artists.
         """
         artists_to_add = []
+        # releases can list the same artist more than once, i.e. with
+        # different roles; only ask about and save each one once
+        seen_artist_ids: set[int] = set()
 
         # Get potential artists from release - handle both Master and Release objects
-        if hasattr(release, "country") and not callable(release.country):
-            # Release object - convert Artist objects to dicts
-            potential_artists = [artist.data for artist in release.artists]
-        else:
-            # Master object - artists already in dict form
-            if release.data.get("artists") is None:
-                release.fetch("artists")
-            potential_artists = [artist for artist in release.data.get("artists", [])]
-
-        # Prompt user to confirm each artist
+        potential_artists = _extractor(_ARTIST_EXTRACTORS, release)(release)
+
+        # Prompt user to confirm each artist; declined or missing artists
+        # are not asked about again either
         for artist in potential_artists:
+            if artist["id"] in seen_artist_ids:
+                continue
+            seen_artist_ids.add(artist["id"])
             if not self.interaction_strategy.confirm_artist(artist=artist):
                 continue
 
             try:
-                artist_obj = self.discogs_service.get_artist_by_id(artist_id=artist["id"])
-                artists_to_add.append(
-                    {
-                        "id": artist_obj.id,
-                        "name": self.discogs_service.clean_artist_name(name=artist_obj.name),
-                        "profile": artist_obj.profile,
-                        "uri": artist_obj.url,
-                        "role": artist_obj.role,
-                    }
-                )
+                artists_to_add.append(self._get_artist(artist_id=artist["id"]))
             except HTTPError as e:
                 if e.status_code == 404:
                     self.logger.warning(f"Artist {artist['id']} not found (404)")
@@ -185,6 +345,9 @@ class DiscogsProcessor:
                 search_string=artist_search
             )
             for artist_obj in potential_artists_search:
+                if artist_obj.id in seen_artist_ids:
+                    continue
+                seen_artist_ids.add(artist_obj.id)
                 if not self.interaction_strategy.confirm_artist(artist=artist_obj.data):
                     continue
 
@@ -262,58 +425,33 @@ class DiscogsProcessor:
             Tuple of (release_id, artist_ids, track_id).
         """
         # Prepare release data - handle both Master and Release objects
-        if hasattr(release, "country") and not callable(release.country):
-            # Release object
-            release_data = {
-                "id": release.id,
-                "title": release.title,
-                "country": release.country,
-                "genres": release.genres,
-                "styles": release.styles,
-                "year": release.year,
-                "url": release.url,
-            }
-        else:
-            # Master object
-            release.fetch("title")
-            release.fetch("country")
-            release_data = {
-                "id": release.id,
-                "title": release.data.get("title", ""),
-                "country": release.data.get("country", ""),
-                "genres": release.genres,
-                "styles": release.styles,
-                "year": release.year,
-                "url": release.url,
-            }
+        release_data = _extractor(_RELEASE_DATA_EXTRACTORS, release)(release)
 
-        # Save release
-        release_id = self.discogs_service.save_release(release_data=release_data)
-        self.logger.debug(f"Saved release {release_id}")
+        # Save release, artists and track in one go
+        with self.discogs_service.transaction() as session:
+            release_id = self.discogs_service.save_release(
+                release_data=release_data, session=session
+            )
+            self.logger.debug("Saved release %s", release_id)
 
-        # Save artists
-        artist_ids = []
-        for artist_data in artists:
-            self.discogs_service.save_artist(
-                artist_data=artist_data,
-                release_id=release_id,
-                role=artist_data["role"],
+            artist_ids = self.discogs_service.save_artists(
+                artists_data=artists, release_id=release_id, session=session
+            )
+            if self.logger.isEnabledFor(DEBUG):
+                self.logger.debug("Saved artists %s", [artist["name"] for artist in artists])
+
+            track_id = self.discogs_service.save_track(
+                track_data={
+                    "release_id": release.id,
+                    "title": track["title"],
+                    "duration": track["duration"],
+                    "position": track["position"],
+                    "type_": track["type_"],
+                },
+                video_id=video_id,
+                session=session,
             )
-            artist_ids.append(artist_data["id"])
-            self.logger.debug(f"Saved artist {artist_data['name']}")
-
-        # Save track
-        track_id = self.discogs_service.save_track(
-            track_data={
-                "release_id": release.id,
-                "title": track["title"],
-                "duration": track["duration"],
-                "position": track["position"],
-                "type_": track["type_"],
-            },
-            video_id=video_id,
-        )
-        self.logger.debug(f"Saved track {track_id}")
+            self.logger.debug("Saved track %s", track_id)
 
         return (release_id, artist_ids, track_id)
 
@@ -342,7 +480,9 @@ class DiscogsProcessor:
             and any error information.
         """
         try:
-            # Step 1: Select search string
+            # Step 1: Select search string, searching for the likeliest
+            # ones in the meantime
+            self._prefetch_searches(search_strings=search_strings[: self.prefetch_searches])
             search_string = self.interaction_strategy.select_search_string(
                 video_id=video_id, options=search_strings
             )
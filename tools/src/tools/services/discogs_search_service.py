@@ -6,11 +6,65 @@ searching for Discogs releases.
 """
 
 import re
+from functools import lru_cache
 from logging import Logger, getLogger
 from typing import Optional
 
+from tools.helpers.text import strip_parens
 from tools.models.models import Video
 
+# The line boundaries str.splitlines() splits on
+_LINE_BREAK_RE = re.compile(r"\r\n|[\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029]")
+
+
+@lru_cache(1024)
+def _generate_search_strings(
+    title: str, uploader: Optional[str], description: Optional[str]
+) -> tuple[str, ...]:
+    """Generate search strings, see DiscogsSearchService.generate_search_strings.
+
+    Cached, as the same videos come up again, i.e. when skipped or retried;
+    1024 entries, as descriptions can be long.
+    """
+    # Clean up title by removing text in parentheses and whitespace
+    clean_title = strip_parens(title).strip()
+
+    # Add uploader-based search string if available
+    uploader_string = None
+    if uploader:
+        # Remove " - Topic" suffix that YouTube adds to official artist channels
+        clean_uploader = uploader.removesuffix(" - Topic")
+        uploader_string = f"{clean_title} - {clean_uploader}"
+
+    # Add description-based search string if available
+    description_string = None
+    if description:
+        # Only the first 3 lines are needed, descriptions can be long
+        description_lines = _LINE_BREAK_RE.split(description, maxsplit=3)
+
+        # Prefer the 3rd line if available (often contains track info),
+        # otherwise use first 64 chars of first line; a trailing newline
+        # doesn't start another line
+        if len(description_lines) > 3 or (len(description_lines) == 3 and description_lines[2]):
+            desc_text = description_lines[2]
+        else:
+            desc_text = description_lines[0][:64]
+
+        # Clean up description formatting
+        desc_text = desc_text.replace(" · ", " ")
+
+        # Add description in format appropriate to context
+        if clean_title in desc_text:
+            description_string = desc_text
+        else:
+            description_string = f"{clean_title} - {desc_text}"
+
+    return tuple(
+        string
+        for string in (clean_title, uploader_string, description_string)
+        if string is not None
+    )
+
 
 class DiscogsSearchService:
     """
@@ -60,39 +114,7 @@ class DiscogsSearchService:
             A list of search strings ordered by specificity, with the most
             specific search string first.
         """
-        strings: list[str] = []
-
-        # Clean up title by removing text in parentheses and whitespace
-        clean_title = re.sub(r" \(.*?\)", "", title).strip()
-        strings.append(clean_title)
-
-        # Add uploader-based search string if available
-        if uploader:
-            # Remove " - Topic" suffix that YouTube adds to official artist channels
-            clean_uploader = uploader.replace(" - Topic", "")
-            strings.append(f"{clean_title} - {clean_uploader}")
-
-        # Add description-based search string if available
-        if description:
-            description_lines = description.splitlines()
-
-            # Prefer the 3rd line if available (often contains track info),
-            # otherwise use first 64 chars of first line
-            if len(description_lines) >= 3:
-                desc_text = description_lines[2]
-            else:
-                desc_text = description_lines[0][:64]
-
-            # Clean up description formatting
-            desc_text = desc_text.replace(" · ", " ")
-
-            # Add description in format appropriate to context
-            if clean_title in desc_text:
-                strings.append(desc_text)
-            else:
-                strings.append(f"{clean_title} - {desc_text}")
-
-        return strings
+        return list(_generate_search_strings(title, uploader, description))
 
     def next_video_to_process(
         self,
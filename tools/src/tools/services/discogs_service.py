@@ -5,17 +5,44 @@ Discogs API interactions, data processing, and database operations
 for managing music releases, artists, and tracks.
 """
 
-import re
+import shutil
+from collections import OrderedDict
+from collections.abc import Generator
+from contextlib import contextmanager
+from functools import cached_property
+from itertools import islice
 from logging import Logger, getLogger
+from threading import Lock
 from typing import Any, Optional
 
 import discogs_client
+from sqlalchemy.orm import Session
 
 from tools.config.app_config import YarkieSettings
+from tools.data_access.discogs_fetcher import CachingFetcher, RateLimitedFetcher
 from tools.data_access.discogs_repository import DiscogsRepository
+from tools.helpers.text import strip_parens, strip_the_prefix
 from tools.models.models import DiscogsArtist, DiscogsRelease, DiscogsTrack
 from tools.services.discogs_search_service import DiscogsSearchService
 
+# How many searches are kept in memory; releases and artists are all kept,
+# as the client objects only hold what was actually fetched
+SEARCH_CACHE_SIZE = 512
+
+# How many results of a search are used; Discogs returns them 50 per page,
+# so this only needs the first page
+SEARCH_LIMIT = 48
+
+# Discogs formats telling what kind of release a search result is
+_VIDEO_FORMATS = frozenset({"VHS", "DVD", "Blu-ray", "PAL", "DVDr", "CDr"})
+_ALBUM_FORMATS = frozenset({"Album", "LP", "EP", "33 ⅓ RPM"})
+_SINGLE_FORMATS = frozenset({"Single", "45 RPM", "Flexi-disc", '12"'})
+
+
+def _maybe_sort(values: list[str]) -> list[str]:
+    """Sort a list, unless it has nothing to sort (most have 0 or 1 items)."""
+    return values if len(values) < 2 else sorted(values)
+
 
 class DiscogsService:
     """
@@ -52,9 +79,94 @@ class DiscogsService:
         self.search_service = search_service
         self.config = config
         self.logger = logger or getLogger(__name__)
-        self.discogs_client = discogs_client.Client(
-            "ExampleApplication/0.1", user_token=config.discogs_token
+        # client objects are kept, so each is only fetched once per run
+        self._releases: dict[int, Any] = {}
+        self._artists: dict[int, Any] = {}
+        self._searches: OrderedDict[tuple[str, str], list[Any]] = OrderedDict()
+        self._searches_lock = Lock()
+
+    @cached_property
+    def fetcher(self) -> RateLimitedFetcher:
+        """The fetcher sending the client's requests, created with the client."""
+        if self.config.discogs_cache_ttl > 0:
+            return CachingFetcher(
+                self.config.discogs_token,
+                cache_path=self.config.discogs_cache_path,
+                ttl=self.config.discogs_cache_ttl,
+                logger=self.logger,
+            )
+        return RateLimitedFetcher(self.config.discogs_token)
+
+    @cached_property
+    def discogs_client(self) -> discogs_client.Client:
+        """The Discogs API client, only created if the API is actually used."""
+        client = discogs_client.Client(
+            "ExampleApplication/0.1", user_token=self.config.discogs_token
+        )
+        # the client has no public way of setting its fetcher; see
+        # test_discogs_client_requests_go_through_fetcher
+        client._fetcher = self.fetcher
+        return client
+
+    def clear_cache(self) -> None:
+        """Forget all cached Discogs responses, in memory and on disk if caching."""
+        self._releases.clear()
+        self._artists.clear()
+        with self._searches_lock:
+            self._searches.clear()
+        if self.config.discogs_cache_ttl > 0:
+            shutil.rmtree(self.config.discogs_cache_path, ignore_errors=True)
+
+    def _search(self, *, search_string: str, search_type: str) -> list[Any]:
+        """
+        Search Discogs, reusing the results of recent equivalent searches.
+
+        Parameters
+        ----------
+        search_string : str
+            The search query string.
+        search_type : str
+            The type of search to perform (e.g., "master", "release", "artist").
+
+        Returns
+        -------
+        list[Any]
+            A new list of the first SEARCH_LIMIT Discogs results.
+        """
+        # Discogs ignores case and extra whitespace, so can the cache
+        key = (" ".join(search_string.split()).casefold(), search_type)
+        with self._searches_lock:
+            if key in self._searches:
+                self._searches.move_to_end(key)
+                return list(self._searches[key])
+
+        # searches can run in the background, don't hold the lock while waiting
+        # the results are paginated, only fetch the pages that are used
+        results = list(
+            islice(self.discogs_client.search(search_string, type=search_type), SEARCH_LIMIT)
         )
+        with self._searches_lock:
+            self._searches[key] = results
+            if len(self._searches) > SEARCH_CACHE_SIZE:
+                self._searches.popitem(last=False)
+        return list(results)
+
+    @contextmanager
+    def transaction(self) -> Generator[Session]:
+        """
+        Save everything within the block in a single DB transaction.
+
+        Yields
+        ------
+        Session
+            The session to pass to the save_* methods; the transaction is
+            committed when the block exits, or rolled back if it raises.
+        """
+        with (
+            Session(self.discogs_repository.sql_client.engine) as session,
+            session.begin(),
+        ):
+            yield session
 
     def get_next_video_to_process(
         self, *, offset: int = 0, deterministic: bool = True
@@ -102,9 +214,9 @@ class DiscogsService:
         Returns
         -------
         list[Any]
-            A list of Discogs release results.
+            The first SEARCH_LIMIT Discogs release results.
         """
-        return list(self.discogs_client.search(search_string, type=search_type))
+        return self._search(search_string=search_string, search_type=search_type)
 
     def get_release_by_id(self, *, release_id: int) -> Any:
         """
@@ -125,7 +237,9 @@ class DiscogsService:
         HTTPError
             If the release is not found (404) or other HTTP error occurs.
         """
-        return self.discogs_client.release(release_id)
+        if release_id not in self._releases:
+            self._releases[release_id] = self.discogs_client.release(release_id)
+        return self._releases[release_id]
 
     def filter_and_prioritize_releases(self, *, results: list[Any]) -> list[Any]:
         """
@@ -148,22 +262,20 @@ class DiscogsService:
         singles = []
         rest = []
 
-        for result in results[:48]:  # Limit to first 48 results
-            format_ = result.data["format"]
+        for result in results[:SEARCH_LIMIT]:
+            formats = set(result.data["format"])
 
             # Skip video formats
-            if any(fmt in format_ for fmt in ["VHS", "DVD", "Blu-ray", "PAL", "DVDr", "CDr"]):
+            if formats & _VIDEO_FORMATS:
                 continue
 
             # Categorize by format
-            if "Compilation" in format_:
+            if "Compilation" in formats:
                 rest.append(result)
-            elif any(fmt in format_ for fmt in ["Album", "LP", "EP", "33 ⅓ RPM"]):
+            elif formats & _ALBUM_FORMATS:
                 albums.append(result)
-            elif any(fmt in format_ for fmt in ["Single", "45 RPM", "Flexi-disc", '12"']):
+            elif formats & _SINGLE_FORMATS:
                 singles.append(result)
-            elif "CD" in format_:
-                rest.append(result)
             else:
                 rest.append(result)
 
@@ -182,9 +294,9 @@ class DiscogsService:
         Returns
         -------
         list[Any]
-            A list of Discogs artist results.
+            The first SEARCH_LIMIT Discogs artist results.
         """
-        return list(self.discogs_client.search(search_string, type="artist"))
+        return self._search(search_string=search_string, search_type="artist")
 
     def get_artist_by_id(self, *, artist_id: int) -> Any:
         """
@@ -205,7 +317,9 @@ class DiscogsService:
         HTTPError
             If the artist is not found (404) or other HTTP error occurs.
         """
-        return self.discogs_client.artist(artist_id)
+        if artist_id not in self._artists:
+            self._artists[artist_id] = self.discogs_client.artist(artist_id)
+        return self._artists[artist_id]
 
     def clean_artist_name(self, *, name: str) -> str:
         """
@@ -223,11 +337,13 @@ class DiscogsService:
         str
             The cleaned artist name.
         """
-        cleaned = re.sub(r" \(.*?\)", "", name).strip()
-        cleaned = re.sub(r"^the\s+", "", cleaned, flags=re.IGNORECASE).strip()
+        cleaned = strip_parens(name).strip()
+        cleaned = strip_the_prefix(cleaned).strip()
         return cleaned
 
-    def save_release(self, *, release_data: dict[str, Any]) -> int:
+    def save_release(
+        self, *, release_data: dict[str, Any], session: Optional[Session] = None
+    ) -> int:
         """
         Save a Discogs release to the database.
 
@@ -236,6 +352,9 @@ class DiscogsService:
         release_data : dict[str, Any]
             A dictionary containing release data from Discogs API.
             Must include: id, title, country, genres, styles, year, url.
+        session : Optional[Session], optional
+            Session to save in, as part of the caller's transaction, by
+            default None. Errors are then raised rather than logged.
 
         Returns
         -------
@@ -246,13 +365,13 @@ class DiscogsService:
             id=release_data["id"],
             title=release_data["title"],
             country=release_data.get("country", ""),
-            genres=sorted(release_data.get("genres", [])),
-            styles=sorted(release_data.get("styles", [])),
+            genres=_maybe_sort(release_data.get("genres") or []),
+            styles=_maybe_sort(release_data.get("styles") or []),
             released=release_data.get("year", 0),
             uri=release_data["url"],
         )
-        release_id = self.discogs_repository.upsert_release(record=release)
-        self.logger.debug(f"Saved release {release_id}")
+        release_id = self.discogs_repository.upsert_release(record=release, session=session)
+        self.logger.debug("Saved release %s", release_id)
         return release_id
 
     def save_artist(
@@ -261,6 +380,7 @@ class DiscogsService:
         artist_data: dict[str, Any],
         release_id: int,
         role: Optional[str] = None,
+        session: Optional[Session] = None,
     ) -> int:
         """
         Save a Discogs artist and link to a release.
@@ -274,6 +394,9 @@ class DiscogsService:
             The release ID to link the artist to.
         role : Optional[str], optional
             The role of the artist on the release, by default None.
+        session : Optional[Session], optional
+            Session to save in, as part of the caller's transaction, by
+            default None. Errors are then raised rather than logged.
 
         Returns
         -------
@@ -287,12 +410,58 @@ class DiscogsService:
             uri=artist_data["uri"],
         )
         artist_id = self.discogs_repository.upsert_artist(
-            record=artist, release_id=release_id, role=role
+            record=artist, release_id=release_id, role=role, session=session
         )
-        self.logger.debug(f"Saved artist {artist_data['name']}")
+        self.logger.debug("Saved artist %s", artist_data["name"])
         return artist_id
 
-    def save_track(self, *, track_data: dict[str, Any], video_id: str) -> int:
+    def save_artists(
+        self,
+        *,
+        artists_data: list[dict[str, Any]],
+        release_id: int,
+        session: Optional[Session] = None,
+    ) -> list[int]:
+        """
+        Save several Discogs artists and link them to a release.
+
+        Parameters
+        ----------
+        artists_data : list[dict[str, Any]]
+            Dictionaries containing artist data.
+            Must include: id, name, profile, uri; may include role.
+        release_id : int
+            The release ID to link the artists to.
+        session : Optional[Session], optional
+            Session to save in, as part of the caller's transaction, by
+            default None. Errors are then raised rather than logged.
+
+        Returns
+        -------
+        list[int]
+            The IDs of the saved artists.
+        """
+        records = [
+            (
+                DiscogsArtist(
+                    id=artist_data["id"],
+                    name=artist_data["name"],
+                    profile=artist_data.get("profile", ""),
+                    uri=artist_data["uri"],
+                ),
+                artist_data.get("role"),
+            )
+            for artist_data in artists_data
+        ]
+        artist_ids = self.discogs_repository.upsert_artists(
+            records=records, release_id=release_id, session=session
+        )
+        self.logger.debug("Saved %d artists", len(artist_ids))
+        return artist_ids
+
+    def save_track(
+        self, *, track_data: dict[str, Any], video_id: str, session: Optional[Session] = None
+    ) -> int:
         """
         Save a Discogs track and link to a video.
 
@@ -303,6 +472,9 @@ class DiscogsService:
             Must include: release_id, title, duration, position, type_.
         video_id : str
             The video ID to link the track to.
+        session : Optional[Session], optional
+            Session to save in, as part of the caller's transaction, by
+            default None. Errors are then raised rather than logged.
 
         Returns
         -------
@@ -316,7 +488,9 @@ class DiscogsService:
             position=track_data.get("position", ""),
             type_=track_data.get("type_", ""),
         )
-        track_id = self.discogs_repository.upsert_track(record=track, video_id=video_id)
+        track_id = self.discogs_repository.upsert_track(
+            record=track, video_id=video_id, session=session
+        )
         return track_id
 
 
@@ -42,18 +42,23 @@ class VideoDownloaderService:
         self.logger = logger or getLogger(__name__)
         self.file_repo = file_repo or file_repository(config=config, logger=self.logger)
 
-    def download_videos(self, keys: list[str]) -> None:
+    def download_videos(self, keys: list[str]) -> dict[str, str]:
         """Download videos from YouTube using provided keys.
 
         Parameters
         ----------
         keys : list[str]
             A list of video keys to download.
+
+        Returns
+        -------
+        dict[str, str]
+            The keys that were downloaded, mapped to their local file.
         """
         if not keys:
-            return
+            return {}
 
-        youtube_downloader(
+        return youtube_downloader(
             keys=keys,
             video_repository=self.video_repository,
             file_repo=self.file_repo,
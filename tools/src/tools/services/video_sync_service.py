@@ -5,15 +5,50 @@ logic for synchronizing YouTube playlists and videos with the local database,
 including transaction management and deletion handling.
 """
 
-from logging import Logger, getLogger
-from typing import Any, Optional
+from collections.abc import Iterable
+from itertools import chain
+from logging import DEBUG, Logger, getLogger
+from operator import attrgetter
+from typing import Optional
 
+from sqlalchemy import bindparam, update
 from sqlalchemy.orm import Session
 
 from tools.data_access.playlist_repository import PlaylistRepository
 from tools.data_access.sql_client import SQLClient
 from tools.data_access.video_repository import VideoRepository
-from tools.models.models import DeletedYoutubeObj, Playlist, Video, YoutubeObj
+from tools.models.models import DeletedYoutubeObj, Playlist, Video, YoutubeObj, frozen_now
+from tools.orm.schema import PlaylistsTable, VideosTable
+
+# Video fields written to the database on sync; the locally-managed
+# fields are not overwritten on existing rows, see update_videos
+_VIDEO_SYNC_FIELDS = (
+    "id",
+    "title",
+    "description",
+    "uploader",
+    "duration",
+    "upload_date",
+    "width",
+    "height",
+    "video_file",
+    "thumbnail",
+    "deleted",
+    "downloaded",
+)
+_video_sync_values = attrgetter(*_VIDEO_SYNC_FIELDS)
+
+# Deletion statements are built once; each sync only binds the ids
+_DISABLE_PLAYLISTS_STMT = (
+    update(PlaylistsTable)
+    .where(PlaylistsTable.id.in_(bindparam("ids", expanding=True)))
+    .values(enabled=False)
+)
+_MARK_VIDEOS_DELETED_STMT = (
+    update(VideosTable)
+    .where(VideosTable.id.in_(bindparam("ids", expanding=True)))
+    .values(deleted=True)
+)
 
 
 class VideoSyncService:
@@ -55,7 +90,7 @@ class VideoSyncService:
     def sync_youtube_data(
         self,
         *,
-        all_records: list[YoutubeObj],
+        all_records: Iterable[YoutubeObj],
     ) -> None:
         """
         Synchronize YouTube data (playlists and videos) with the local database.
@@ -67,152 +102,139 @@ class VideoSyncService:
         4. Update video information and create new links
 
         All operations are performed within a single database transaction
-        to ensure data consistency.
+        to ensure data consistency; if any step fails, none of the changes
+        are kept.
 
         Parameters
         ----------
-        all_records : list[YoutubeObj]
-            A list of YoutubeObj instances (Playlist, Video, or
-            DeletedYoutubeObj) to synchronize.
+        all_records : Iterable[YoutubeObj]
+            YoutubeObj instances (Playlist, Video, or DeletedYoutubeObj)
+            to synchronize; iterated only once, so a generator can be
+            passed.
         """
-        # TODO: Improve transaction support - currently repositories create their
-        # own sessions, so they don't participate in a shared transaction.
-        # This needs refactoring to pass session to repository methods.
-        try:
-            with Session(self.sql_client.engine) as session:
-                # Begin transaction for deletion handling
-                with session.begin():
-                    # Step 1: Handle deleted items and get remaining records
-                    enabled_records = self.handle_deleted_videos(
-                        all_records=all_records,
-                        session=session,
-                    )
+        # Nothing to sync is common on incremental runs; skip the database
+        records = iter(all_records)
+        first = next(records, None)
+        if first is None:
+            self.logger.info("Nothing to sync")
+            return
 
-                # Note: Steps 2-4 use repository methods that create their own
-                # sessions, so they execute outside the transaction above
+        try:
+            # all records in this sync get the same last_updated, and are
+            # written in a single transaction, which is rolled back on error
+            with (
+                frozen_now(),
+                Session(self.sql_client.engine) as session,
+                session.begin(),
+            ):
+                # Step 1: Handle deleted items and get remaining records
+                playlists, videos = self.handle_deleted_videos(
+                    all_records=chain((first,), records),
+                    session=session,
+                )
 
-                # Step 2: Filter and update playlists
-                playlists = [r for r in enabled_records if isinstance(r, Playlist)]
+                # Step 2: Update playlists
                 if playlists:
                     updated_playlists = self.playlist_repository.update_playlists(
-                        playlists=playlists
+                        playlists=playlists, session=session
                     )
-                    self.logger.info(f"Updated {len(updated_playlists)} playlists")
+                    self.logger.info("Updated %d playlists", len(updated_playlists))
 
                     # Step 3: Clear old playlist-video links
-                    self.playlist_repository.clear_playlist_links(playlists=updated_playlists)
+                    self.playlist_repository.clear_playlist_links(
+                        playlists=updated_playlists, session=session
+                    )
                 else:
                     self.logger.info("No playlists to update")
 
                 # Step 4: Update videos and their playlist links
-                videos = [r for r in enabled_records if isinstance(r, Video)]
                 if videos:
-                    # Convert videos to dict format for repository
-                    video_dicts = [
-                        {
-                            "id": v.id,
-                            "title": v.title,
-                            "description": v.description,
-                            "uploader": v.uploader,
-                            "duration": v.duration,
-                            "upload_date": v.upload_date,
-                            "width": v.width,
-                            "height": v.height,
-                            "video_file": v.video_file,
-                            "thumbnail": v.thumbnail,
-                            "deleted": v.deleted,
-                            "downloaded": v.downloaded,
-                        }
+                    # Convert videos to dict format for repository, lazily,
+                    # so the dicts are not all held alongside the videos
+                    video_dicts = (
+                        dict(zip(_VIDEO_SYNC_FIELDS, _video_sync_values(v), strict=True))
                         for v in videos
-                    ]
-                    count = self.video_repository.update_videos(video_data=video_dicts)
-                    self.logger.info(f"Updated {count} videos")
+                    )
+                    count = self.video_repository.update_videos(
+                        video_data=video_dicts, session=session
+                    )
+                    self.logger.info("Updated %d videos", count)
                 else:
                     self.logger.info("No videos to update")
 
         except Exception as e:
-            self.logger.error(f"Error synchronizing YouTube data: {e}")
+            self.logger.error("Error synchronizing YouTube data: %s", e)
             raise
 
     def handle_deleted_videos(
         self,
         *,
-        all_records: list[YoutubeObj],
+        all_records: Iterable[YoutubeObj],
         session: Session,
-    ) -> list[YoutubeObj]:
+    ) -> tuple[list[Playlist], list[Video]]:
         """
         Process deleted videos and playlists, marking them in the database.
 
         This method separates deleted items from active items, marks the
-        deleted items appropriately in the database, and returns the list
-        of active items for further processing.
+        deleted items appropriately in the database, and returns the active
+        playlists and videos for further processing.
 
         Parameters
         ----------
-        all_records : list[YoutubeObj]
-            A list of YoutubeObj instances to process.
+        all_records : Iterable[YoutubeObj]
+            YoutubeObj instances to process, iterated only once.
         session : Session
             SQLAlchemy session for database operations.
 
         Returns
         -------
-        list[YoutubeObj]
-            A list of active (non-deleted) YoutubeObj instances.
+        tuple[list[Playlist], list[Video]]
+            The enabled playlists and the non-deleted videos, in input order.
         """
-        filtered: list[YoutubeObj] = []
-        deleted_playlists: list[dict[str, Any]] = []
-        deleted_videos: list[dict[str, Any]] = []
-
-        # Separate deleted from active records
+        active_playlists: list[Playlist] = []
+        active_videos: list[Video] = []
+        # sets, as an id can be reported as deleted more than once
+        deleted_playlist_ids: set[str] = set()
+        deleted_video_ids: set[str] = set()
+        debug = self.logger.isEnabledFor(DEBUG)
+
+        # Separate deleted from active records, checking the most common type
+        # first: videos far outnumber playlists, and deleted entries are rare
         for record in all_records:
-            if isinstance(record, DeletedYoutubeObj):
+            if isinstance(record, Video):
+                if record.deleted:
+                    if debug:
+                        self.logger.debug(
+                            "Adding %s to deleted videos, because Video.deleted", record.id
+                        )
+                    deleted_video_ids.add(record.id)
+                else:
+                    active_videos.append(record)
+            elif isinstance(record, Playlist):
+                if record.enabled:
+                    active_playlists.append(record)
+                else:
+                    deleted_playlist_ids.add(record.id)
+            elif isinstance(record, DeletedYoutubeObj):
                 if record.is_playlist():
-                    deleted_playlists.append({"id": record.id, "enabled": False})
+                    deleted_playlist_ids.add(record.id)
                 else:
-                    deleted_videos.append({"id": record.id, "deleted": True})
-            elif isinstance(record, Playlist) and not record.enabled:
-                deleted_playlists.append({"id": record.id, "enabled": False})
-            elif isinstance(record, Video) and record.deleted:
-                self.logger.debug(f"Adding {record.id} to deleted videos, because Video.deleted")
-                deleted_videos.append({"id": record.id, "deleted": True})
-            else:
-                filtered.append(record)
-
-        # Mark deleted playlists
-        if deleted_playlists:
-            # TODO: This should use PlaylistRepository when it has an
-            # update method that accepts dict format or when we refactor
-            # to use Pydantic models throughout
-            from sqlalchemy import update
-
-            from tools.orm.schema import PlaylistsTable
-
-            for playlist in deleted_playlists:
-                stmt = (
-                    update(PlaylistsTable)
-                    .where(PlaylistsTable.id == playlist["id"])
-                    .values(enabled=playlist["enabled"])
-                )
-                session.execute(stmt)
-            self.logger.info(f"Disabled {len(deleted_playlists)} playlists")
+                    deleted_video_ids.add(record.id)
+
+        # Mark deleted playlists, all in one statement
+        # TODO: This should use PlaylistRepository when it has a method
+        # for disabling playlists
+        if deleted_playlist_ids:
+            session.execute(_DISABLE_PLAYLISTS_STMT, {"ids": list(deleted_playlist_ids)})
+            self.logger.info("Disabled %d playlists", len(deleted_playlist_ids))
         else:
             self.logger.info("No playlists were disabled")
 
-        # Mark deleted videos
-        if deleted_videos:
-            from sqlalchemy import update
-
-            from tools.orm.schema import VideosTable
-
-            for video in deleted_videos:
-                stmt = (
-                    update(VideosTable)
-                    .where(VideosTable.id == video["id"])
-                    .values(deleted=video["deleted"])
-                )
-                session.execute(stmt)
-            self.logger.info(f"Marked {len(deleted_videos)} videos as deleted")
+        # Mark deleted videos, all in one statement
+        if deleted_video_ids:
+            session.execute(_MARK_VIDEOS_DELETED_STMT, {"ids": list(deleted_video_ids)})
+            self.logger.info("Marked %d videos as deleted", len(deleted_video_ids))
         else:
             self.logger.info("No videos were deleted")
 
-        return filtered
+        return active_playlists, active_videos
@@ -0,0 +1,44 @@
+"""Tests for the discogs postprocess command."""
+
+from unittest.mock import Mock, patch
+
+import click
+import pytest
+
+from tools.commands.discogs.postprocess import postprocess
+from tools.services.auto_interaction_strategy import AutoInteractionStrategy
+from tools.services.discogs_interaction_strategy import CliInteractionStrategy
+
+
+@pytest.fixture()
+def mock_app_context():
+    """Create a mock AppContext."""
+    context = Mock()
+    context.logger = Mock()
+    context.discogs_repository = Mock()
+    context.config = Mock()
+    return context
+
+
+@pytest.mark.parametrize(
+    ("auto", "strategy_class"),
+    [(False, CliInteractionStrategy), (True, AutoInteractionStrategy)],
+)
+def test_postprocess_interaction_strategy(mock_app_context, auto, strategy_class):
+    """Test --auto processes videos without prompting, sequentially."""
+    with (
+        patch("tools.commands.discogs.postprocess.DiscogsSearchService"),
+        patch("tools.commands.discogs.postprocess.create_discogs_service") as create_service,
+        patch("tools.commands.discogs.postprocess.DiscogsProcessor") as mock_processor_class,
+    ):
+        discogs_service = create_service.return_value
+        discogs_service.get_next_video_to_process.return_value = None
+
+        ctx = click.Context(click.Command("postprocess"), obj=mock_app_context)
+        ctx.invoke(postprocess, deterministic=False, refresh_cache=False, auto=auto)
+
+    strategy = mock_processor_class.call_args.kwargs["interaction_strategy"]
+    assert isinstance(strategy, strategy_class)
+    assert (mock_processor_class.call_args.kwargs["prefetch_searches"] == 1) is auto
+    discogs_service.get_next_video_to_process.assert_called_once_with(offset=0, deterministic=auto)
+    mock_processor_class.return_value.close.assert_called_once()
@@ -29,4 +29,11 @@ def mock_config() -> YarkieSettings:
     config.DEFAULT_DATA_ROOT = Path(".")
     config.download_path = "/tmp"
     config.db_path = Path(":memory:")
+    config.concurrent_fragments = 16
+    config.external_downloader = None
+    config.download_workers = 1
+    config.info_cache_path = Path("/tmp")
+    config.info_cache_ttl = 0
+    config.discogs_cache_path = Path("/tmp")
+    config.discogs_cache_ttl = 0
     return config
@@ -1,4 +1,5 @@
 from unittest.mock import MagicMock, Mock
+from uuid import uuid4
 
 import pytest
 
@@ -49,26 +50,48 @@ def logger():
     return Mock()
 
 
-def test_refresh_playlist_no_videos(
-    faker, logger, youtube_dao, playlist_repository, video_repository, sync_service, mock_config
+@pytest.fixture(scope="module")
+def playlist_key():
+    """Fixture to provide the key of a playlist to refresh."""
+    return str(uuid4())
+
+
+@pytest.fixture()
+def make_archiver(
+    youtube_dao, playlist_repository, video_repository, sync_service, mock_config, logger
 ):
+    """Fixture to create an ArchiverService from the mocks, with any overrides."""
+
+    def _make(**overrides):
+        kwargs = {
+            "youtube": youtube_dao,
+            "playlist_repository": playlist_repository,
+            "video_repository": video_repository,
+            "sync_service": sync_service,
+            "config": mock_config,
+            "logger": logger,
+        }
+        return ArchiverService(**(kwargs | overrides))
+
+    return _make
+
+
+def _logged(call) -> str:
+    """The message a logger mock call would have logged."""
+    return call.args[0] % call.args[1:]
+
+
+def test_refresh_playlist_no_videos(playlist_key, logger, youtube_dao, make_archiver):
     """No videos are found."""
     youtube_dao.get_info.return_value = []
-    archiver_service = ArchiverService(
-        youtube=youtube_dao,
-        playlist_repository=playlist_repository,
-        video_repository=video_repository,
-        sync_service=sync_service,
-        config=mock_config,
-        logger=logger,
-    )
-    archiver_service.refresh_playlist((faker.uuid4(),))
+    archiver_service = make_archiver()
+    archiver_service.refresh_playlist((playlist_key,))
     assert logger.mock_calls[-1].args[0] == "...no videos found"
     assert len(logger.mock_calls) == 3
 
 
 def test_refresh_playlist_happy_path(
-    youtube_dao, logger, video_repository, sync_service, faker, mock_config, playlist_repository
+    youtube_dao, logger, video_repository, sync_service, playlist_key, make_archiver
 ):
     """Test refresh_playlist when videos are found."""
     videos_to_download = FakeVideoFactory.batch(size=2, downloaded=0, deleted=0, video_file="")
@@ -79,45 +102,32 @@ def test_refresh_playlist_happy_path(
     )
     youtube_dao.get_info.return_value = fresh_info
 
-    # Mock video repository methods
-    video_repository.refresh_download_field = Mock()
-    video_repository.refresh_deleted_videos = Mock()
-    video_repository.pass_needs_download = Mock(return_value=videos_to_download)
-
-    # Mock sync service
-    sync_service.sync_youtube_data = Mock()
+    video_repository.pass_needs_download.return_value = videos_to_download
 
     # Create mock downloader services
-    mock_video_downloader = MagicMock()
-    mock_thumbnail_downloader = MagicMock()
-
-    archiver_service = ArchiverService(
-        youtube=youtube_dao,
-        playlist_repository=playlist_repository,
-        video_repository=video_repository,
-        sync_service=sync_service,
-        config=mock_config,
-        logger=logger,
+    mock_video_downloader = Mock(spec=["download_videos"])
+    mock_thumbnail_downloader = Mock(spec=["download_thumbnails"])
+
+    archiver_service = make_archiver(
         video_downloader=mock_video_downloader,
         thumbnail_downloader=mock_thumbnail_downloader,
     )
 
-    expected_key = faker.uuid4()
-    archiver_service.refresh_playlist(expected_key)
+    archiver_service.refresh_playlist(playlist_key)
 
     sync_service.sync_youtube_data.assert_called_once_with(all_records=fresh_info)
-    mock_video_downloader.download_videos.assert_called_once_with(
-        keys=[video.id for video in videos_to_download]
-    )
+    expected_keys = [video.id for video in videos_to_download]
+    expected_key_url_pairs = [(video.id, video.thumbnail) for video in videos_to_download]
+    mock_video_downloader.download_videos.assert_called_once_with(keys=expected_keys)
     mock_thumbnail_downloader.download_thumbnails.assert_called_once_with(
-        key_url_pairs=[(video.id, video.thumbnail) for video in videos_to_download]
+        key_url_pairs=expected_key_url_pairs
     )
     video_repository.refresh_deleted_videos.assert_called_once_with(all_videos=fresh_info)
     video_repository.refresh_download_field.assert_called_once()
 
     expected_log_messages = [
-        f"Now refreshing: {expected_key}",
-        "info from youtube",
+        f"Now refreshing: {playlist_key}",
+        "Getting info from youtube (this will take a while)...",
         "...found 3 videos in total",
         "Updating DB record for playlist...",
         "2 need downloading",
@@ -125,13 +135,11 @@ def test_refresh_playlist_happy_path(
         "Downloading thumbnails...",
         "Refreshing database...",
     ]
-    assert len(logger.mock_calls) == len(expected_log_messages)
-    for i, msg in enumerate(expected_log_messages):
-        assert msg in logger.mock_calls[i].args[0]
+    assert [_logged(call) for call in logger.mock_calls] == expected_log_messages
 
 
 def test_refresh_playlist_nothing_to_download(
-    youtube_dao, logger, video_repository, sync_service, faker, mock_config, playlist_repository
+    youtube_dao, logger, video_repository, sync_service, playlist_key, make_archiver
 ):
     """Test refresh_playlist when videos are found but nothing needs downloading."""
     videos_to_download = []
@@ -142,31 +150,18 @@ def test_refresh_playlist_nothing_to_download(
     )
     youtube_dao.get_info.return_value = fresh_info
 
-    # Mock video repository methods
-    video_repository.refresh_download_field = Mock()
-    video_repository.refresh_deleted_videos = Mock()
-    video_repository.pass_needs_download = Mock(return_value=videos_to_download)
-
-    # Mock sync service
-    sync_service.sync_youtube_data = Mock()
+    video_repository.pass_needs_download.return_value = videos_to_download
 
     # Create mock downloader services
-    mock_video_downloader = MagicMock()
-    mock_thumbnail_downloader = MagicMock()
-
-    archiver_service = ArchiverService(
-        youtube=youtube_dao,
-        playlist_repository=playlist_repository,
-        video_repository=video_repository,
-        sync_service=sync_service,
-        config=mock_config,
-        logger=logger,
+    mock_video_downloader = Mock(spec=["download_videos"])
+    mock_thumbnail_downloader = Mock(spec=["download_thumbnails"])
+
+    archiver_service = make_archiver(
         video_downloader=mock_video_downloader,
         thumbnail_downloader=mock_thumbnail_downloader,
     )
 
-    expected_key = faker.uuid4()
-    archiver_service.refresh_playlist(expected_key)
+    archiver_service.refresh_playlist(playlist_key)
 
     sync_service.sync_youtube_data.assert_called_once_with(all_records=fresh_info)
     mock_video_downloader.download_videos.assert_not_called()
@@ -175,32 +170,23 @@ def test_refresh_playlist_nothing_to_download(
     video_repository.refresh_download_field.assert_not_called()
 
     expected_log_messages = [
-        f"Now refreshing: {expected_key}",
-        "info from youtube",
+        f"Now refreshing: {playlist_key}",
+        "Getting info from youtube (this will take a while)...",
         "...found 3 videos in total",
         "Updating DB record for playlist...",
         "No videos need downloading",
     ]
-    assert len(logger.mock_calls) == len(expected_log_messages)
-    for i, msg in enumerate(expected_log_messages):
-        assert msg in logger.mock_calls[i].args[0]
+    assert [_logged(call) for call in logger.mock_calls] == expected_log_messages
 
 
-def test_sync_video_file_already_has_file(
-    logger, video_repository, sync_service, mock_config, playlist_repository
-):
+def test_sync_video_file_already_has_file(make_archiver):
     """Test _sync_video_file when video already has a file."""
     video = FakeVideoFactory.build(video_file="/path/to/video.mp4")
 
     mock_file_repo = MagicMock(spec=FileRepository)
-    mock_video_downloader = MagicMock()
-
-    archiver_service = ArchiverService(
-        playlist_repository=playlist_repository,
-        video_repository=video_repository,
-        sync_service=sync_service,
-        config=mock_config,
-        logger=logger,
+    mock_video_downloader = Mock(spec=["download_videos"])
+
+    archiver_service = make_archiver(
         file_repo=mock_file_repo,
         video_downloader=mock_video_downloader,
     )
@@ -212,23 +198,14 @@ def test_sync_video_file_already_has_file(
     mock_video_downloader.download_videos.assert_not_called()
 
 
-def test_sync_video_file_no_download_file_not_found(
-    logger, video_repository, sync_service, mock_config, playlist_repository
-):
+def test_sync_video_file_no_download_file_not_found(make_archiver):
     """Test _sync_video_file when download is False and file doesn't exist."""
     video = FakeVideoFactory.build(video_file="")
 
     mock_file_repo = MagicMock(spec=FileRepository)
     mock_file_repo.video_file_exists.return_value = False
 
-    archiver_service = ArchiverService(
-        playlist_repository=playlist_repository,
-        video_repository=video_repository,
-        sync_service=sync_service,
-        config=mock_config,
-        logger=logger,
-        file_repo=mock_file_repo,
-    )
+    archiver_service = make_archiver(file_repo=mock_file_repo)
 
     result = archiver_service._sync_video_file(video=video, download=False)
 
@@ -236,25 +213,17 @@ def test_sync_video_file_no_download_file_not_found(
     mock_file_repo.video_file_exists.assert_called_once_with(video.id)
 
 
-def test_sync_video_file_with_download_and_file_exists(
-    logger, video_repository, sync_service, mock_config, playlist_repository
-):
+def test_sync_video_file_with_download_and_file_exists(make_archiver):
     """Test _sync_video_file when download is True and file exists after download."""
     video = FakeVideoFactory.build(video_file="")
 
     mock_file_repo = MagicMock(spec=FileRepository)
-    # First call returns False (file doesn't exist), second call returns True (after download)
-    mock_file_repo.video_file_exists.side_effect = [False, True]
-    mock_file_repo.make_video_path.return_value = "/path/to/video.mp4"
-
-    mock_video_downloader = MagicMock()
-
-    archiver_service = ArchiverService(
-        playlist_repository=playlist_repository,
-        video_repository=video_repository,
-        sync_service=sync_service,
-        config=mock_config,
-        logger=logger,
+    mock_file_repo.video_file_exists.return_value = False
+
+    mock_video_downloader = Mock(spec=["download_videos"])
+    mock_video_downloader.download_videos.return_value = {video.id: "/path/to/video.mp4"}
+
+    archiver_service = make_archiver(
         file_repo=mock_file_repo,
         video_downloader=mock_video_downloader,
     )
@@ -264,25 +233,16 @@ def test_sync_video_file_with_download_and_file_exists(
     assert result is True
     assert video.video_file == "/path/to/video.mp4"
     mock_video_downloader.download_videos.assert_called_once_with(keys=[video.id])
-    assert mock_file_repo.video_file_exists.call_count == 2
+    mock_file_repo.video_file_exists.assert_called_once_with(video.id)
 
 
-def test_sync_thumbnail_file_already_has_thumbnail(
-    logger, video_repository, sync_service, mock_config, playlist_repository
-):
+def test_sync_thumbnail_file_already_has_thumbnail(make_archiver):
     """Test _sync_thumbnail_file when video already has a thumbnail."""
     video = FakeVideoFactory.build(thumbnail="https://example.com/thumb.jpg")
 
     mock_file_repo = MagicMock(spec=FileRepository)
 
-    archiver_service = ArchiverService(
-        playlist_repository=playlist_repository,
-        video_repository=video_repository,
-        sync_service=sync_service,
-        config=mock_config,
-        logger=logger,
-        file_repo=mock_file_repo,
-    )
+    archiver_service = make_archiver(file_repo=mock_file_repo)
 
     result = archiver_service._sync_thumbnail_file(video=video)
 
@@ -290,9 +250,7 @@ def test_sync_thumbnail_file_already_has_thumbnail(
     mock_file_repo.thumbnail_file_exists.assert_not_called()
 
 
-def test_sync_thumbnail_file_file_exists(
-    logger, video_repository, sync_service, mock_config, playlist_repository
-):
+def test_sync_thumbnail_file_file_exists(make_archiver):
     """Test _sync_thumbnail_file when thumbnail file exists on disk."""
     video = FakeVideoFactory.build(thumbnail="")
 
@@ -300,14 +258,7 @@ def test_sync_thumbnail_file_file_exists(
     mock_file_repo.thumbnail_file_exists.return_value = True
     mock_file_repo.make_thumbnail_path.return_value = "/path/to/thumbnail.jpg"
 
-    archiver_service = ArchiverService(
-        playlist_repository=playlist_repository,
-        video_repository=video_repository,
-        sync_service=sync_service,
-        config=mock_config,
-        logger=logger,
-        file_repo=mock_file_repo,
-    )
+    archiver_service = make_archiver(file_repo=mock_file_repo)
 
     result = archiver_service._sync_thumbnail_file(video=video)
 
@@ -316,23 +267,14 @@ def test_sync_thumbnail_file_file_exists(
     mock_file_repo.thumbnail_file_exists.assert_called_once_with(video.id)
 
 
-def test_sync_thumbnail_file_file_not_found(
-    logger, video_repository, sync_service, mock_config, playlist_repository
-):
+def test_sync_thumbnail_file_file_not_found(make_archiver):
     """Test _sync_thumbnail_file when thumbnail file doesn't exist."""
     video = FakeVideoFactory.build(thumbnail="")
 
     mock_file_repo = MagicMock(spec=FileRepository)
     mock_file_repo.thumbnail_file_exists.return_value = False
 
-    archiver_service = ArchiverService(
-        playlist_repository=playlist_repository,
-        video_repository=video_repository,
-        sync_service=sync_service,
-        config=mock_config,
-        logger=logger,
-        file_repo=mock_file_repo,
-    )
+    archiver_service = make_archiver(file_repo=mock_file_repo)
 
     result = archiver_service._sync_thumbnail_file(video=video)
 
@@ -341,116 +283,49 @@ def test_sync_thumbnail_file_file_not_found(
     mock_file_repo.thumbnail_file_exists.assert_called_once_with(video.id)
 
 
-def test_update_downloaded_flag_both_exist(
-    logger, video_repository, sync_service, mock_config, playlist_repository
-):
-    """Test _update_downloaded_flag when both video and thumbnail exist."""
-    video = FakeVideoFactory.build(
-        thumbnail="https://example.com/thumb.jpg", video_file="/path/to/video.mp4", downloaded=False
-    )
-
-    archiver_service = ArchiverService(
-        playlist_repository=playlist_repository,
-        video_repository=video_repository,
-        sync_service=sync_service,
-        config=mock_config,
-        logger=logger,
-    )
-
-    result = archiver_service._update_downloaded_flag(video=video)
-
-    assert result is True
-    assert video.downloaded is True
-
-
-def test_update_downloaded_flag_already_downloaded(
-    logger, video_repository, sync_service, mock_config, playlist_repository
-):
-    """Test _update_downloaded_flag when video is already downloaded."""
-    video = FakeVideoFactory.build(
-        thumbnail="https://example.com/thumb.jpg", video_file="/path/to/video.mp4", downloaded=True
-    )
-
-    archiver_service = ArchiverService(
-        playlist_repository=playlist_repository,
-        video_repository=video_repository,
-        sync_service=sync_service,
-        config=mock_config,
-        logger=logger,
-    )
-
-    result = archiver_service._update_downloaded_flag(video=video)
-
-    assert result is False
-    assert video.downloaded is True
-
-
-def test_update_downloaded_flag_missing_thumbnail(
-    logger, video_repository, sync_service, mock_config, playlist_repository
-):
-    """Test _update_downloaded_flag when thumbnail is missing."""
-    video = FakeVideoFactory.build(thumbnail="", video_file="/path/to/video.mp4", downloaded=False)
-
-    archiver_service = ArchiverService(
-        playlist_repository=playlist_repository,
-        video_repository=video_repository,
-        sync_service=sync_service,
-        config=mock_config,
-        logger=logger,
-    )
-
-    result = archiver_service._update_downloaded_flag(video=video)
-
-    assert result is False
-    assert video.downloaded is False
-
-
-def test_update_downloaded_flag_missing_video_file(
-    logger, video_repository, sync_service, mock_config, playlist_repository
+@pytest.mark.parametrize(
+    ("thumbnail", "video_file", "downloaded", "expected_result", "expected_downloaded"),
+    [
+        # both video and thumbnail exist
+        ("https://example.com/thumb.jpg", "/path/to/video.mp4", False, True, True),
+        # already downloaded
+        ("https://example.com/thumb.jpg", "/path/to/video.mp4", True, False, True),
+        # missing thumbnail
+        ("", "/path/to/video.mp4", False, False, False),
+        # missing video file
+        ("https://example.com/thumb.jpg", "", False, False, False),
+    ],
+)
+def test_update_downloaded_flag(
+    thumbnail, video_file, downloaded, expected_result, expected_downloaded, make_archiver
 ):
-    """Test _update_downloaded_flag when video file is missing."""
+    """Test _update_downloaded_flag only flags videos with both files."""
     video = FakeVideoFactory.build(
-        thumbnail="https://example.com/thumb.jpg", video_file="", downloaded=False
+        thumbnail=thumbnail, video_file=video_file, downloaded=downloaded
     )
 
-    archiver_service = ArchiverService(
-        playlist_repository=playlist_repository,
-        video_repository=video_repository,
-        sync_service=sync_service,
-        config=mock_config,
-        logger=logger,
-    )
+    archiver_service = make_archiver()
 
     result = archiver_service._update_downloaded_flag(video=video)
 
-    assert result is False
-    assert video.downloaded is False
+    assert result is expected_result
+    assert video.downloaded is expected_downloaded
 
 
-def test_sync_video_with_filesystem_no_updates(
-    logger, video_repository, sync_service, mock_config, playlist_repository
-):
+def test_sync_video_with_filesystem_no_updates(make_archiver):
     """Test _sync_video_with_filesystem when no updates are needed."""
     video = FakeVideoFactory.build(
         thumbnail="https://example.com/thumb.jpg", video_file="/path/to/video.mp4", downloaded=True
     )
 
-    archiver_service = ArchiverService(
-        playlist_repository=playlist_repository,
-        video_repository=video_repository,
-        sync_service=sync_service,
-        config=mock_config,
-        logger=logger,
-    )
+    archiver_service = make_archiver()
 
     result = archiver_service._sync_video_with_filesystem(video=video, download=False)
 
     assert result is None
 
 
-def test_sync_video_with_filesystem_with_updates(
-    logger, video_repository, sync_service, mock_config, playlist_repository
-):
+def test_sync_video_with_filesystem_with_updates(make_archiver):
     """Test _sync_video_with_filesystem when updates are made."""
     video = FakeVideoFactory.build(thumbnail="", video_file="", downloaded=False)
 
@@ -458,38 +333,22 @@ def test_sync_video_with_filesystem_with_updates(
     mock_file_repo.thumbnail_file_exists.return_value = True
     mock_file_repo.make_thumbnail_path.return_value = "/path/to/thumbnail.jpg"
 
-    archiver_service = ArchiverService(
-        playlist_repository=playlist_repository,
-        video_repository=video_repository,
-        sync_service=sync_service,
-        config=mock_config,
-        logger=logger,
-        file_repo=mock_file_repo,
-    )
+    archiver_service = make_archiver(file_repo=mock_file_repo)
 
     result = archiver_service._sync_video_with_filesystem(video=video, download=False)
 
     assert result is not None
+    assert set(result) == {"id", "thumbnail", "video_file", "downloaded"}
     assert result["id"] == video.id
     assert result["thumbnail"] == "/path/to/thumbnail.jpg"
-    assert "video_file" in result
-    assert "downloaded" in result
 
 
-def test_sync_local_no_videos(
-    logger, video_repository, sync_service, mock_config, playlist_repository
-):
+def test_sync_local_no_videos(video_repository, make_archiver):
     """Test sync_local when there are no videos needing download."""
     video_repository.get_videos_needing_download.return_value = []
     video_repository.update_videos.return_value = None
 
-    archiver_service = ArchiverService(
-        playlist_repository=playlist_repository,
-        video_repository=video_repository,
-        sync_service=sync_service,
-        config=mock_config,
-        logger=logger,
-    )
+    archiver_service = make_archiver()
 
     result = archiver_service.sync_local(download=False)
 
@@ -497,9 +356,7 @@ def test_sync_local_no_videos(
     video_repository.update_videos.assert_called_once_with([])
 
 
-def test_sync_local_with_updates(
-    logger, video_repository, sync_service, mock_config, playlist_repository
-):
+def test_sync_local_with_updates(video_repository, make_archiver):
     """Test sync_local when updates are made."""
     videos = FakeVideoFactory.batch(size=3, thumbnail="", video_file="", downloaded=False)
 
@@ -507,17 +364,11 @@ def test_sync_local_with_updates(
     video_repository.update_videos.return_value = None
 
     mock_file_repo = MagicMock(spec=FileRepository)
-    mock_file_repo.thumbnail_file_exists.return_value = True
+    mock_file_repo.existing_video_ids.return_value = set()
+    mock_file_repo.existing_thumbnail_ids.return_value = {video.id for video in videos}
     mock_file_repo.make_thumbnail_path.side_effect = lambda video_id: f"/path/to/{video_id}.jpg"
 
-    archiver_service = ArchiverService(
-        playlist_repository=playlist_repository,
-        video_repository=video_repository,
-        sync_service=sync_service,
-        config=mock_config,
-        logger=logger,
-        file_repo=mock_file_repo,
-    )
+    archiver_service = make_archiver(file_repo=mock_file_repo)
 
     result = archiver_service.sync_local(download=False)
 
@@ -526,140 +377,89 @@ def test_sync_local_with_updates(
     # Verify that the update was called with 3 records
     call_args = video_repository.update_videos.call_args
     assert len(call_args[0][0]) == 3
+    # The snapshot is used instead of checking each file
+    mock_file_repo.video_file_exists.assert_not_called()
+    mock_file_repo.thumbnail_file_exists.assert_not_called()
 
 
-def test_filter_videos_needing_files_with_no_video_files(
-    logger, video_repository, sync_service, mock_config, playlist_repository
-):
-    """Test _filter_videos_needing_files returns videos without video files."""
-    videos = FakeVideoFactory.batch(size=3, video_file="")
-
-    archiver_service = ArchiverService(
-        playlist_repository=playlist_repository,
-        video_repository=video_repository,
-        sync_service=sync_service,
-        config=mock_config,
-        logger=logger,
-    )
-
-    result = archiver_service._filter_videos_needing_files(videos)
-
-    assert len(result) == 3
-    assert all(video_id == video.id for video_id, video in zip(result, videos))
+def test_sync_video_file_download_fails(make_archiver):
+    """Test _sync_video_file when the video could not be downloaded."""
+    video = FakeVideoFactory.build(video_file="")
 
+    mock_file_repo = MagicMock(spec=FileRepository)
 
-def test_filter_videos_needing_files_with_some_video_files(
-    logger, video_repository, sync_service, mock_config, playlist_repository
-):
-    """Test _filter_videos_needing_files filters out videos with files."""
-    videos = [
-        FakeVideoFactory.build(video_file=""),
-        FakeVideoFactory.build(video_file="/path/to/video.mp4"),
-        FakeVideoFactory.build(video_file=""),
-    ]
+    mock_video_downloader = Mock(spec=["download_videos"])
+    mock_video_downloader.download_videos.return_value = {}
 
-    archiver_service = ArchiverService(
-        playlist_repository=playlist_repository,
-        video_repository=video_repository,
-        sync_service=sync_service,
-        config=mock_config,
-        logger=logger,
+    archiver_service = make_archiver(
+        file_repo=mock_file_repo,
+        video_downloader=mock_video_downloader,
     )
 
-    result = archiver_service._filter_videos_needing_files(videos)
-
-    assert len(result) == 2
-    assert result[0] == videos[0].id
-    assert result[1] == videos[2].id
-
-
-def test_filter_videos_needing_files_with_all_files(
-    logger, video_repository, sync_service, mock_config, playlist_repository
-):
-    """Test _filter_videos_needing_files returns empty list when all have files."""
-    videos = FakeVideoFactory.batch(size=3, video_file="/path/to/video.mp4")
-
-    archiver_service = ArchiverService(
-        playlist_repository=playlist_repository,
-        video_repository=video_repository,
-        sync_service=sync_service,
-        config=mock_config,
-        logger=logger,
-    )
+    result = archiver_service._sync_video_file(video=video, download=True, existing_videos=set())
 
-    result = archiver_service._filter_videos_needing_files(videos)
+    assert result is False
+    assert video.video_file == ""
+    mock_video_downloader.download_videos.assert_called_once_with(keys=[video.id])
+    mock_file_repo.video_file_exists.assert_not_called()
 
-    assert len(result) == 0
 
+@pytest.mark.parametrize(
+    ("video_files", "expected_indexes"),
+    [
+        # no video files
+        (["", "", ""], [0, 1, 2]),
+        # some video files
+        (["", "/path/to/video.mp4", ""], [0, 2]),
+        # all video files
+        (["/path/to/video.mp4"] * 3, []),
+    ],
+)
+def test_filter_videos_needing_files(video_files, expected_indexes, make_archiver):
+    """Test _filter_videos_needing_files returns the ids of videos without files."""
+    videos = [FakeVideoFactory.build(video_file=video_file) for video_file in video_files]
 
-def test_filter_videos_needing_thumbnails_with_http_urls(
-    logger, video_repository, sync_service, mock_config, playlist_repository
-):
-    """Test _filter_videos_needing_thumbnails returns videos with http thumbnail URLs."""
-    videos = FakeVideoFactory.batch(size=3, thumbnail="https://example.com/thumb.jpg")
-
-    archiver_service = ArchiverService(
-        playlist_repository=playlist_repository,
-        video_repository=video_repository,
-        sync_service=sync_service,
-        config=mock_config,
-        logger=logger,
-    )
+    archiver_service = make_archiver()
 
-    result = archiver_service._filter_videos_needing_thumbnails(videos)
+    result = archiver_service._filter_videos_needing_files(videos)
 
-    assert len(result) == 3
-    assert all(
-        video_id == video.id and url == video.thumbnail
-        for (video_id, url), video in zip(result, videos)
-    )
+    assert result == [videos[i].id for i in expected_indexes]
 
 
-def test_filter_videos_needing_thumbnails_mixed_types(
-    logger, video_repository, sync_service, mock_config, playlist_repository
-):
-    """Test _filter_videos_needing_thumbnails filters correctly with mixed thumbnail types."""
-    videos = [
-        FakeVideoFactory.build(thumbnail="https://example.com/thumb1.jpg"),
-        FakeVideoFactory.build(thumbnail="/local/path/thumb.jpg"),
-        FakeVideoFactory.build(thumbnail="http://example.com/thumb2.jpg"),
-        FakeVideoFactory.build(thumbnail=""),
-        FakeVideoFactory.build(thumbnail=None),
+@pytest.fixture(scope="module")
+def thumbnail_videos():
+    """Fixture to provide videos with each kind of thumbnail, for read-only tests."""
+    thumbnails = [
+        "https://example.com/thumb1.jpg",
+        "/local/path/thumb.jpg",
+        "http://example.com/thumb2.jpg",
+        "",
+        None,
     ]
+    return [FakeVideoFactory.build(thumbnail=thumbnail) for thumbnail in thumbnails]
 
-    archiver_service = ArchiverService(
-        playlist_repository=playlist_repository,
-        video_repository=video_repository,
-        sync_service=sync_service,
-        config=mock_config,
-        logger=logger,
-    )
-
-    result = archiver_service._filter_videos_needing_thumbnails(videos)
 
-    assert len(result) == 2
-    assert result[0] == (videos[0].id, videos[0].thumbnail)
-    assert result[1] == (videos[2].id, videos[2].thumbnail)
-
-
-def test_filter_videos_needing_thumbnails_with_no_http_urls(
-    logger, video_repository, sync_service, mock_config, playlist_repository
+@pytest.mark.parametrize(
+    ("indexes", "expected_indexes"),
+    [
+        pytest.param([0, 2], [0, 2], id="http_urls"),
+        pytest.param([0, 1, 2, 3, 4], [0, 2], id="mixed_types"),
+        pytest.param([1, 3, 4], [], id="no_http_urls"),
+    ],
+)
+def test_filter_videos_needing_thumbnails(
+    indexes,
+    expected_indexes,
+    thumbnail_videos,
+    make_archiver,
 ):
-    """Test _filter_videos_needing_thumbnails returns empty list when no http URLs."""
-    videos = [
-        FakeVideoFactory.build(thumbnail="/local/path/thumb.jpg"),
-        FakeVideoFactory.build(thumbnail=""),
-        FakeVideoFactory.build(thumbnail=None),
-    ]
+    """Test _filter_videos_needing_thumbnails returns videos with http thumbnail URLs."""
+    videos = [thumbnail_videos[i] for i in indexes]
 
-    archiver_service = ArchiverService(
-        playlist_repository=playlist_repository,
-        video_repository=video_repository,
-        sync_service=sync_service,
-        config=mock_config,
-        logger=logger,
-    )
+    archiver_service = make_archiver()
 
     result = archiver_service._filter_videos_needing_thumbnails(videos)
 
-    assert len(result) == 0
+    assert result == [
+        (thumbnail_videos[i].id, thumbnail_videos[i].thumbnail) for i in expected_indexes
+    ]
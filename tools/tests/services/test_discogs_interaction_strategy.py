@@ -52,9 +52,39 @@ def test_select_search_string_with_none(cli_strategy):
     ):
         mock_prompt.return_value = None
 
+        result = cli_strategy.select_search_string(
+            video_id="test_video_789", options=["Option 1", "Option 2"]
+        )
+
+        assert result is None
+
+
+def test_select_search_string_with_single_option(cli_strategy):
+    """Test a single search string is picked without prompting."""
+    with (
+        patch("tools.services.discogs_interaction_strategy.click.echo"),
+        patch("tools.services.discogs_interaction_strategy.prompt_numbered_choice") as mock_prompt,
+    ):
         result = cli_strategy.select_search_string(video_id="test_video_789", options=["Option 1"])
 
+        assert result == "Option 1"
+        mock_prompt.assert_not_called()
+
+
+def test_select_search_string_with_single_option_no_auto_single():
+    """Test a single search string can still be prompted for."""
+    with (
+        patch("tools.services.discogs_interaction_strategy.click.echo"),
+        patch("tools.services.discogs_interaction_strategy.prompt_numbered_choice") as mock_prompt,
+    ):
+        mock_prompt.return_value = None
+
+        result = CliInteractionStrategy(auto_single=False).select_search_string(
+            video_id="test_video_789", options=["Option 1"]
+        )
+
         assert result is None
+        mock_prompt.assert_called_once()
 
 
 def test_select_release_with_empty_list(cli_strategy):
@@ -217,11 +247,22 @@ def test_select_track_with_quit(cli_strategy):
     ):
         mock_prompt.return_value = None
 
-        result = cli_strategy.select_track(tracks=[mock_track])
+        result = cli_strategy.select_track(tracks=[mock_track, mock_track])
 
         assert result is None
 
 
+def test_select_track_with_single_track(cli_strategy):
+    """Test a single track is picked without prompting."""
+    mock_track = Mock()
+
+    with patch("tools.services.discogs_interaction_strategy.prompt_numbered_choice") as mock_prompt:
+        result = cli_strategy.select_track(tracks=[mock_track])
+
+        assert result == mock_track
+        mock_prompt.assert_not_called()
+
+
 def test_should_continue_after_error_yes(cli_strategy):
     """Test continuing after error."""
     with (
@@ -1,20 +1,21 @@
 """Tests for DiscogsProcessor service."""
 
-from unittest.mock import Mock
+from unittest.mock import MagicMock, Mock
 
 import pytest
+from discogs_client import Master, Release
 
 from tools.services.auto_interaction_strategy import AutoInteractionStrategy
-from tools.services.discogs_processor import DiscogsProcessor
+from tools.services.discogs_processor import _ARTIST_EXTRACTORS, DiscogsProcessor, _extractor
 
 
 @pytest.fixture()
 def mock_discogs_service():
     """Create a mock DiscogsService."""
-    service = Mock()
+    service = MagicMock()
 
     # Mock release object
-    release = Mock()
+    release = MagicMock(spec=Release)
     release.id = 123
     release.title = "Test Release"
     release.country = "US"
@@ -48,7 +49,9 @@ def mock_discogs_service():
         role="Main",
     )
     service.clean_artist_name.return_value = "Test Artist"
-    service.save_artist.return_value = None
+    service.save_artists.side_effect = lambda *, artists_data, release_id, session: [
+        artist["id"] for artist in artists_data
+    ]
     service.save_track.return_value = 789
 
     return service
@@ -83,11 +86,85 @@ def test_process_video_happy_path(processor, mock_discogs_service):
     assert result.track_id == 789
     assert result.error is None
 
-    # Verify service calls
-    mock_discogs_service.search_releases.assert_called_once()
+    # Verify service calls, once searches still running in the background finish
+    for prefetched in processor._prefetched.values():
+        prefetched.result()
+    assert mock_discogs_service.search_releases.call_count == 2
     mock_discogs_service.save_release.assert_called_once()
-    mock_discogs_service.save_artist.assert_called_once()
+    mock_discogs_service.save_artists.assert_called_once()
     mock_discogs_service.save_track.assert_called_once()
+    mock_discogs_service.transaction.return_value.__exit__.assert_called_once()
+    # everything is saved within the transaction's session
+    session = mock_discogs_service.transaction.return_value.__enter__.return_value
+    for save in ("save_release", "save_artists", "save_track"):
+        assert getattr(mock_discogs_service, save).call_args.kwargs["session"] is session
+
+
+def test_process_video_uses_prefetched_search(processor, mock_discogs_service):
+    """Test the search strings are searched for while the user chooses."""
+    processor.interaction_strategy = Mock(wraps=AutoInteractionStrategy())
+
+    def select_search_string(*, video_id, options):
+        # the searches have started before the user made a choice
+        for prefetched in processor._prefetched.values():
+            prefetched.result()
+        searched = [
+            c.kwargs["search_string"] for c in mock_discogs_service.search_releases.mock_calls
+        ]
+        assert sorted(searched) == sorted(options)
+        return options[0]
+
+    processor.interaction_strategy.select_search_string.side_effect = select_search_string
+
+    result = processor.process_video(
+        video_id="test_video_123",
+        search_strings=["Artist - Title", "Title"],
+    )
+
+    assert result.success is True
+    # the chosen search string wasn't searched for again
+    assert mock_discogs_service.search_releases.call_count == 2
+
+
+def test_process_video_prefetches_fewer_searches(mock_discogs_service):
+    """Test only as many search strings as configured are searched for in advance."""
+    processor = DiscogsProcessor(
+        discogs_service=mock_discogs_service,
+        interaction_strategy=AutoInteractionStrategy(),
+        prefetch_searches=1,
+    )
+
+    result = processor.process_video(
+        video_id="test_video_123",
+        search_strings=["Artist - Title", "Title"],
+    )
+
+    assert result.success is True
+    mock_discogs_service.search_releases.assert_called_once_with(search_string="Artist - Title")
+
+
+def test_prefetch_searches_cancels_unused_searches(processor):
+    """Test searches still waiting from the previous video are cancelled."""
+    stale = Mock()
+    processor._prefetched = {"Old Artist - Old Title": stale}
+
+    processor._prefetch_searches(search_strings=["Artist - Title"])
+
+    stale.cancel.assert_called_once()
+    assert list(processor._prefetched) == ["Artist - Title"]
+
+
+def test_close_shuts_down_background_searches(processor):
+    """Test closing the processor cancels its searches and stops its threads."""
+    pending = Mock()
+    processor._prefetched = {"Artist - Title": pending}
+
+    processor.close()
+
+    pending.cancel.assert_called_once()
+    assert processor._prefetched == {}
+    with pytest.raises(RuntimeError):
+        processor._executor.submit(print)
 
 
 def test_process_video_no_search_string_selected(processor):
@@ -185,8 +262,7 @@ def test_select_release_with_custom_search(processor, mock_discogs_service):
 
 def test_select_artists_with_manual_search(processor, mock_discogs_service):
     """Test artist selection with manual search fallback."""
-    release = Mock()
-    release.country = "US"  # Mark as Release object
+    release = MagicMock(spec=Release)
     artist1 = Mock(data={"id": 1, "name": "Artist 1"})
     release.artists = [artist1]
 
@@ -226,8 +302,7 @@ def test_select_track_with_empty_tracklist(processor):
 
 def test_save_metadata_with_master_object(processor, mock_discogs_service):
     """Test saving metadata with a Master object (has .data dict)."""
-    # Create a Master-like object
-    master = Mock()
+    master = MagicMock(spec=Master)
     master.id = 999
     master.data = {
         "title": "Master Title",
@@ -238,8 +313,6 @@ def test_save_metadata_with_master_object(processor, mock_discogs_service):
     master.styles = ["Classic Rock"]
     master.year = 1975
     master.url = "https://discogs.com/master/999"
-    # No .country attribute - this makes it a Master
-    delattr(master, "country")
 
     artists = [
         {
@@ -354,10 +427,13 @@ def test_select_release_with_custom_search_no_results(processor, mock_discogs_se
 
     processor.interaction_strategy = Mock()
     processor.interaction_strategy.select_release.return_value = "custom search query"
+    processor.interaction_strategy.prompt_manual_release_id.return_value = None
 
     result = processor._select_release(search_string="Test Query")
 
     assert result is None
+    # the user can enter an ID after a custom search too
+    processor.interaction_strategy.prompt_manual_release_id.assert_called_once()
 
 
 def test_select_release_with_nested_multiple_results(processor, mock_discogs_service):
@@ -402,29 +478,47 @@ def test_select_release_with_nested_user_quits(processor, mock_discogs_service):
 
 
 def test_select_release_with_nested_returns_string(processor, mock_discogs_service):
-    """Test nested search when user enters another custom search (should return None)."""
+    """Test nested search when user enters another custom search (searches again)."""
+    selected = Mock(title="Selected")
     mock_discogs_service.search_releases.side_effect = [
         [Mock(title="First Result")],  # Initial search
         [Mock(title="Result 1"), Mock(title="Result 2")],  # Custom search
+        [Mock(title="Result 3"), selected],  # Another custom search
     ]
 
     processor.interaction_strategy = Mock()
     processor.interaction_strategy.select_release.side_effect = [
         "custom search query",  # First call returns custom search
         "another custom search",  # Second call (nested) returns string
+        selected,
     ]
 
     result = processor._select_release(search_string="Test Query")
 
+    assert result == selected
+    assert mock_discogs_service.search_releases.call_count == 3
+
+
+def test_select_release_with_repeated_custom_search(processor, mock_discogs_service):
+    """Test entering a custom search already searched for (should return None)."""
+    mock_discogs_service.search_releases.side_effect = [
+        [Mock(title="First Result")],  # Initial search
+        [Mock(title="Result 1"), Mock(title="Result 2")],  # Custom search
+    ]
+
+    processor.interaction_strategy = AutoInteractionStrategy(custom_search="custom search query")
+
+    result = processor._select_release(search_string="Test Query")
+
     assert result is None
+    assert mock_discogs_service.search_releases.call_count == 2
 
 
 def test_select_artists_with_non_404_http_error(processor, mock_discogs_service):
     """Test artist selection when non-404 HTTP error occurs (should raise)."""
     from discogs_client.exceptions import HTTPError
 
-    release = Mock()
-    release.country = "US"
+    release = MagicMock(spec=Release)
     release.artists = [Mock(data={"id": 456, "name": "Test Artist"})]
 
     mock_discogs_service.get_artist_by_id.side_effect = HTTPError("Server Error", 500)
@@ -436,6 +530,74 @@ def test_select_artists_with_non_404_http_error(processor, mock_discogs_service)
         processor._select_artists(release=release)
 
 
+def test_select_artists_skips_duplicates(processor, mock_discogs_service):
+    """Test an artist listed twice on a release is only asked about once."""
+    release = MagicMock(spec=Release)
+    release.artists = [Mock(data={"id": 456, "name": "Test Artist"})] * 2
+    processor.interaction_strategy = Mock()
+    processor.interaction_strategy.confirm_artist.return_value = True
+
+    artists = processor._select_artists(release=release)
+
+    assert [artist["id"] for artist in artists] == [456]
+    processor.interaction_strategy.confirm_artist.assert_called_once()
+
+
+def test_select_artists_asks_once_about_declined_duplicates(processor, mock_discogs_service):
+    """Test an artist listed twice is not asked about again once declined."""
+    release = MagicMock(spec=Release)
+    release.artists = [Mock(data={"id": 456, "name": "Test Artist"})] * 2
+    processor.interaction_strategy = Mock()
+    processor.interaction_strategy.confirm_artist.return_value = False
+    processor.interaction_strategy.search_artist_manually.return_value = None
+
+    assert processor._select_artists(release=release) == []
+    processor.interaction_strategy.confirm_artist.assert_called_once()
+
+
+def test_select_artists_asks_once_about_missing_duplicates(processor, mock_discogs_service):
+    """Test an artist listed twice is not asked about again once not found."""
+    from discogs_client.exceptions import HTTPError
+
+    release = MagicMock(spec=Release)
+    release.artists = [Mock(data={"id": 456, "name": "Test Artist"})] * 2
+    mock_discogs_service.get_artist_by_id.side_effect = HTTPError("Not Found", 404)
+    processor.interaction_strategy = Mock()
+    processor.interaction_strategy.confirm_artist.return_value = True
+    processor.interaction_strategy.search_artist_manually.return_value = None
+
+    assert processor._select_artists(release=release) == []
+    processor.interaction_strategy.confirm_artist.assert_called_once()
+    mock_discogs_service.get_artist_by_id.assert_called_once_with(artist_id=456)
+
+
+def test_select_artists_fetches_each_artist_once(processor, mock_discogs_service):
+    """Test artists already fetched in this run are not fetched again."""
+    release = mock_discogs_service.search_releases.return_value[0]
+
+    first = processor._select_artists(release=release)
+    second = processor._select_artists(release=release)
+
+    assert first == second
+    mock_discogs_service.get_artist_by_id.assert_called_once_with(artist_id=456)
+
+
+def test_select_artists_retries_failed_artist(processor, mock_discogs_service):
+    """Test artists not found are looked up again next time."""
+    from discogs_client.exceptions import HTTPError
+
+    release = mock_discogs_service.search_releases.return_value[0]
+    artist = mock_discogs_service.get_artist_by_id.return_value
+    mock_discogs_service.get_artist_by_id.side_effect = [HTTPError("Not Found", 404), artist]
+    processor.interaction_strategy = Mock()
+    processor.interaction_strategy.confirm_artist.return_value = True
+    processor.interaction_strategy.search_artist_manually.return_value = None
+
+    assert processor._select_artists(release=release) == []
+    assert processor._select_artists(release=release)[0]["id"] == 456
+    assert mock_discogs_service.get_artist_by_id.call_count == 2
+
+
 def test_process_video_handles_click_abort(processor, mock_discogs_service):
     """Test that click.Abort is re-raised."""
     import click
@@ -460,3 +622,27 @@ def test_process_video_handles_keyboard_interrupt(processor, mock_discogs_servic
             video_id="test_video_123",
             search_strings=["Artist - Title"],
         )
+
+
+def test_save_metadata_dispatches_on_release_type(processor, mock_discogs_service):
+    """Real Release and Master objects are told apart by their type."""
+    data = {
+        "id": 1,
+        "title": "Title",
+        "country": "UK",
+        "genres": ["Rock"],
+        "styles": [],
+        "year": 1975,
+        "uri": "https://discogs.com/1",
+        "artists": [{"id": 111, "name": "Artist 1"}],
+    }
+    track = {"title": "Track 1", "duration": "3:30", "position": "A1", "type_": "track"}
+
+    for cls in (Release, Master):
+        release = cls(Mock(), dict(data))
+        artists = _extractor(_ARTIST_EXTRACTORS, release)(release)
+        assert [artist["id"] for artist in artists] == [111]
+        processor._save_metadata(video_id="vid123", release=release, artists=[], track=track)
+        release_data = mock_discogs_service.save_release.call_args.kwargs["release_data"]
+        assert release_data["title"] == "Title"
+        assert release_data["country"] == "UK"
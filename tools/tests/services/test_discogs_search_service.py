@@ -1,5 +1,6 @@
 """Tests for DiscogsSearchService."""
 
+import random
 from unittest.mock import Mock
 
 import pytest
@@ -30,6 +31,40 @@ class TestGenerateSearchStrings:
         assert len(result) == 1
         assert result[0] == "Song Title"
 
+    def test_generate_search_strings_description_lines(self, discogs_search_service):
+        """Test the description line is picked as splitlines() would."""
+        rnd = random.Random(0)
+        separators = ["\n", "\r\n", "\r", "\v", "\f", "\x1c", "\x85", "\u2028", "\u2029"]
+        for _ in range(1000):
+            lines = [rnd.choice(["", "a", "Song b", "x" * 70]) for _ in range(rnd.randint(1, 5))]
+            description = "".join(line + rnd.choice(separators) for line in lines[:-1])
+            # the last line may end with a line break, too
+            description += lines[-1] + rnd.choice(["", *separators])
+            if not description:
+                continue
+            description_lines = description.splitlines()
+            expected = (
+                description_lines[2] if len(description_lines) >= 3 else description_lines[0][:64]
+            )
+
+            result = discogs_search_service.generate_search_strings(
+                title="Song", description=description
+            )
+
+            assert result[-1] == (expected if "Song" in expected else f"Song - {expected}"), repr(
+                description
+            )
+
+    def test_generate_search_strings_returns_new_list(self, discogs_search_service):
+        """Test repeated calls return equal lists that can be changed independently."""
+        first = discogs_search_service.generate_search_strings(title="Cached Title")
+        first.append("changed")
+
+        second = discogs_search_service.generate_search_strings(title="Cached Title")
+
+        assert second == ["Cached Title"]
+        assert second is not first
+
     def test_generate_search_strings_with_title_and_uploader(self, discogs_search_service):
         """Test generating search strings with title and uploader."""
         result = discogs_search_service.generate_search_strings(
@@ -1,15 +1,21 @@
 """Tests for DiscogsService."""
 
 import logging
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from tools.config.app_config import YarkieSettings
+from tools.data_access.discogs_fetcher import CachingFetcher, RateLimitedFetcher
 from tools.data_access.discogs_repository import DiscogsRepository
 from tools.models.models import Video
 from tools.services.discogs_search_service import DiscogsSearchService
-from tools.services.discogs_service import DiscogsService, create_discogs_service
+from tools.services.discogs_service import (
+    SEARCH_LIMIT,
+    DiscogsService,
+    create_discogs_service,
+)
 
 
 @pytest.fixture
@@ -17,6 +23,8 @@ def mock_config():
     """Create a mock configuration."""
     config = MagicMock(spec=YarkieSettings)
     config.discogs_token = "test_token_12345"
+    config.discogs_cache_path = Path("/tmp")
+    config.discogs_cache_ttl = 0
     return config
 
 
@@ -78,6 +86,11 @@ def test_init_creates_service_with_all_dependencies(
         assert service.search_service == mock_search_service
         assert service.config == mock_config
         assert service.logger == mock_logger
+        # the client, and the fetcher it uses, are only created when first used
+        mock_client.assert_not_called()
+        assert "fetcher" not in vars(service)
+
+        assert service.discogs_client == service.discogs_client
         mock_client.assert_called_once_with("ExampleApplication/0.1", user_token="test_token_12345")
 
 
@@ -97,6 +110,61 @@ def test_init_creates_default_logger_when_none_provided(
         assert service.logger is not None
 
 
+def test_init_caches_responses(mock_discogs_repository, mock_search_service, mock_config, tmp_path):
+    """Test Discogs responses are cached if configured."""
+    mock_config.discogs_cache_path = tmp_path
+    mock_config.discogs_cache_ttl = 60
+
+    service = DiscogsService(
+        discogs_repository=mock_discogs_repository,
+        search_service=mock_search_service,
+        config=mock_config,
+    )
+
+    assert isinstance(service.discogs_client._fetcher, CachingFetcher)
+    assert isinstance(service.fetcher, CachingFetcher)
+    assert service.fetcher.cache_path == tmp_path
+
+
+def test_init_rate_limits_requests(discogs_service):
+    """Test requests are rate limited even without caching."""
+    assert type(discogs_service.discogs_client._fetcher) is RateLimitedFetcher
+
+
+def test_discogs_client_requests_go_through_fetcher(discogs_service):
+    """Test the client sends its requests through the service's fetcher.
+
+    The client has no public way of setting its fetcher, so this fails if
+    the private attribute it is set on goes away.
+    """
+    with patch.object(
+        RateLimitedFetcher, "fetch", return_value=(b'{"id": 1, "title": "Fetched"}', 200)
+    ) as fetch:
+        assert discogs_service.discogs_client.release(1).title == "Fetched"
+
+    fetch.assert_called_once()
+
+
+def test_clear_cache_empties_disk_cache(
+    mock_discogs_repository, mock_search_service, mock_config, tmp_path
+):
+    """Test the disk cache is emptied without creating the fetcher."""
+    mock_config.discogs_cache_path = tmp_path / "discogs"
+    mock_config.discogs_cache_ttl = 60
+    mock_config.discogs_cache_path.mkdir()
+    (mock_config.discogs_cache_path / "response.json").write_text("{}")
+    service = DiscogsService(
+        discogs_repository=mock_discogs_repository,
+        search_service=mock_search_service,
+        config=mock_config,
+    )
+
+    service.clear_cache()
+
+    assert not mock_config.discogs_cache_path.exists()
+    assert "fetcher" not in vars(service)
+
+
 # Test get_next_video_to_process
 
 
@@ -187,6 +255,67 @@ def test_search_releases_with_custom_type(discogs_service):
     discogs_service.discogs_client.search.assert_called_once_with("Test", type="release")
 
 
+def test_search_releases_cached(discogs_service):
+    """Test repeated searches only go to Discogs once, until the cache is cleared."""
+    discogs_service.discogs_client.search = MagicMock(side_effect=lambda *_, **__: iter([1, 2]))
+
+    first = discogs_service.search_releases(search_string="Test")
+    first.append(3)
+    second = discogs_service.search_releases(search_string="Test")
+    discogs_service.search_releases(search_string="Test", search_type="release")
+
+    assert second == [1, 2]
+    assert discogs_service.discogs_client.search.call_count == 2
+
+    discogs_service.clear_cache()
+    discogs_service.search_releases(search_string="Test")
+
+    assert discogs_service.discogs_client.search.call_count == 3
+
+
+def test_search_releases_only_fetches_results_used(discogs_service):
+    """Test results past SEARCH_LIMIT are not fetched from Discogs."""
+    fetched = []
+
+    def paginated_results(*_, **__):
+        for i in range(SEARCH_LIMIT * 3):
+            fetched.append(i)
+            yield i
+
+    discogs_service.discogs_client.search = MagicMock(side_effect=paginated_results)
+
+    results = discogs_service.search_releases(search_string="Test")
+
+    assert results == list(range(SEARCH_LIMIT))
+    assert len(fetched) == SEARCH_LIMIT
+
+
+def test_search_releases_cache_ignores_case_and_whitespace(discogs_service):
+    """Test searches differing only in case or spacing are only made once."""
+    discogs_service.discogs_client.search = MagicMock(side_effect=lambda *_, **__: iter([1]))
+
+    discogs_service.search_releases(search_string="Straße  Song")
+    discogs_service.search_releases(search_string=" STRASSE song ")
+
+    discogs_service.discogs_client.search.assert_called_once_with("Straße  Song", type="master")
+
+
+def test_search_releases_cache_is_bounded(discogs_service):
+    """Test the least recently used searches are forgotten."""
+    discogs_service.discogs_client.search = MagicMock(side_effect=lambda *_, **__: iter([]))
+
+    with patch("tools.services.discogs_service.SEARCH_CACHE_SIZE", 2):
+        discogs_service.search_releases(search_string="a")
+        discogs_service.search_releases(search_string="b")
+        discogs_service.search_releases(search_string="a")
+        discogs_service.search_releases(search_string="c")
+        discogs_service.search_releases(search_string="a")
+        discogs_service.search_releases(search_string="b")
+
+    searched = [c.args[0] for c in discogs_service.discogs_client.search.call_args_list]
+    assert searched == ["a", "b", "c", "b"]
+
+
 # Test get_release_by_id
 
 
@@ -198,6 +327,7 @@ def test_get_release_by_id_calls_discogs_client(discogs_service):
     result = discogs_service.get_release_by_id(release_id=12345)
 
     assert result == mock_release
+    assert discogs_service.get_release_by_id(release_id=12345) == mock_release
     discogs_service.discogs_client.release.assert_called_once_with(12345)
 
 
@@ -311,6 +441,7 @@ def test_get_artist_by_id_calls_discogs_client(discogs_service):
     result = discogs_service.get_artist_by_id(artist_id=54321)
 
     assert result == mock_artist
+    assert discogs_service.get_artist_by_id(artist_id=54321) == mock_artist
     discogs_service.discogs_client.artist.assert_called_once_with(54321)
 
 
@@ -400,6 +531,32 @@ def test_save_release_handles_missing_optional_fields(
     assert release.released == 0
 
 
+# Test save_artists
+
+
+def test_save_artists_saves_all_artists_at_once(
+    discogs_service,
+    mock_discogs_repository,
+):
+    """Test saving several artists with a single repository call."""
+    mock_discogs_repository.upsert_artists.return_value = [1, 2]
+
+    artists_data = [
+        {"id": 1, "name": "Artist 1", "uri": "https://test.com/1", "role": "Main"},
+        {"id": 2, "name": "Artist 2", "uri": "https://test.com/2"},
+    ]
+
+    result = discogs_service.save_artists(artists_data=artists_data, release_id=12345)
+
+    assert result == [1, 2]
+    call_args = mock_discogs_repository.upsert_artists.call_args
+    assert call_args.kwargs["release_id"] == 12345
+    assert [(artist.id, role) for artist, role in call_args.kwargs["records"]] == [
+        (1, "Main"),
+        (2, None),
+    ]
+
+
 # Test save_artist
 
 
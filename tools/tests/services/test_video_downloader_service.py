@@ -45,8 +45,9 @@ def test_download_videos_with_keys(mock_config, video_repository, logger):
     keys = ["video1", "video2", "video3"]
 
     with patch("tools.services.video_downloader_service.youtube_downloader") as mock_downloader:
-        service.download_videos(keys=keys)
+        result = service.download_videos(keys=keys)
 
+    assert result == mock_downloader.return_value
     mock_downloader.assert_called_once_with(
         keys=keys,
         video_repository=video_repository,
@@ -67,6 +68,7 @@ def test_download_videos_with_empty_keys(mock_config, video_repository, logger):
     keys = []
 
     with patch("tools.services.video_downloader_service.youtube_downloader") as mock_downloader:
-        service.download_videos(keys=keys)
+        result = service.download_videos(keys=keys)
 
+    assert result == {}
     mock_downloader.assert_not_called()
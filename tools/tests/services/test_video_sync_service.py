@@ -85,6 +85,43 @@ class TestSyncYoutubeData:
             # Verify video operations were called
             video_repository.update_videos.assert_called_once()
 
+    def test_sync_youtube_data_passes_video_fields(
+        self,
+        video_sync_service,
+        video_repository,
+    ):
+        """Test that each video is passed to the repository as a dict of its fields."""
+        video = FakeVideoFactory.build(deleted=False)
+
+        with patch("tools.services.video_sync_service.Session") as mock_session:
+            mock_session_instance = MagicMock()
+            mock_session.return_value.__enter__.return_value = mock_session_instance
+            records = []
+
+            def update_videos(video_data, session):
+                records.extend(video_data)
+                return len(records)
+
+            video_repository.update_videos.side_effect = update_videos
+
+            video_sync_service.sync_youtube_data(all_records=[video])
+
+            (record,) = records
+            assert record == {
+                "id": video.id,
+                "title": video.title,
+                "description": video.description,
+                "uploader": video.uploader,
+                "duration": video.duration,
+                "upload_date": video.upload_date,
+                "width": video.width,
+                "height": video.height,
+                "video_file": video.video_file,
+                "thumbnail": video.thumbnail,
+                "deleted": video.deleted,
+                "downloaded": video.downloaded,
+            }
+
     def test_sync_youtube_data_with_only_playlists(
         self,
         video_sync_service,
@@ -152,7 +189,8 @@ class TestSyncYoutubeData:
 
             video_sync_service.sync_youtube_data(all_records=[])
 
-            # Verify no operations were called
+            # Verify no operations were called, nor a session opened
+            mock_session.assert_not_called()
             playlist_repository.update_playlists.assert_not_called()
             playlist_repository.clear_playlist_links.assert_not_called()
             video_repository.update_videos.assert_not_called()
@@ -171,15 +209,15 @@ class TestSyncYoutubeData:
             mock_session.return_value.__enter__.return_value = mock_session_instance
 
             with patch.object(video_sync_service, "handle_deleted_videos") as mock_handle_deleted:
-                mock_handle_deleted.return_value = [video]
+                mock_handle_deleted.return_value = ([], [video])
 
                 video_sync_service.sync_youtube_data(all_records=[video, deleted_video])
 
-                # Verify handle_deleted_videos was called
-                mock_handle_deleted.assert_called_once_with(
-                    all_records=[video, deleted_video],
-                    session=mock_session_instance,
-                )
+                # Verify handle_deleted_videos was called with all the records
+                mock_handle_deleted.assert_called_once()
+                kwargs = mock_handle_deleted.call_args.kwargs
+                assert list(kwargs["all_records"]) == [video, deleted_video]
+                assert kwargs["session"] is mock_session_instance
 
     def test_sync_youtube_data_uses_transaction(
         self,
@@ -198,6 +236,31 @@ class TestSyncYoutubeData:
             # Verify transaction was started
             mock_session_instance.begin.assert_called_once()
 
+    def test_sync_youtube_data_shares_session_across_steps(
+        self,
+        video_sync_service,
+        playlist_repository,
+        video_repository,
+    ):
+        """Test that every step runs in the session of the sync transaction."""
+        playlist = FakePlaylistFactory.build()
+        video = FakeVideoFactory.build(deleted=False)
+
+        with patch("tools.services.video_sync_service.Session") as mock_session:
+            mock_session_instance = MagicMock()
+            mock_session.return_value.__enter__.return_value = mock_session_instance
+            playlist_repository.update_playlists.return_value = [playlist]
+
+            video_sync_service.sync_youtube_data(all_records=[playlist, video])
+
+            mock_session.assert_called_once()
+            for method in (
+                playlist_repository.update_playlists,
+                playlist_repository.clear_playlist_links,
+                video_repository.update_videos,
+            ):
+                assert method.call_args.kwargs["session"] is mock_session_instance
+
     def test_sync_youtube_data_logs_error_on_exception(
         self,
         video_sync_service,
@@ -237,8 +300,7 @@ class TestHandleDeletedVideos:
         )
 
         # Verify only active video is returned
-        assert len(result) == 1
-        assert result[0] == active_video
+        assert result == ([], [active_video])
 
         # Verify delete operation was executed
         mock_session_instance.execute.assert_called()
@@ -261,12 +323,67 @@ class TestHandleDeletedVideos:
             )
 
             # Verify only active playlist is returned
-            assert len(result) == 1
-            assert result[0] == active_playlist
+            assert result == ([active_playlist], [])
 
             # Verify delete operation was executed
             mock_session_instance.execute.assert_called()
 
+    def test_handle_deleted_videos_updates_each_table_once(
+        self,
+        video_sync_service,
+        logger,
+    ):
+        """Test that all deletions are marked with one UPDATE per table."""
+        deleted_videos = [FakeDeletedVideoFactory.build() for _ in range(3)]
+        deleted_playlists = [FakePlaylistFactory.build(enabled=False) for _ in range(2)]
+
+        mock_session_instance = MagicMock()
+
+        result = video_sync_service.handle_deleted_videos(
+            all_records=[*deleted_videos, *deleted_playlists],
+            session=mock_session_instance,
+        )
+
+        assert result == ([], [])
+        assert mock_session_instance.execute.call_count == 2
+        logger.info.assert_any_call("Disabled %d playlists", 2)
+        logger.info.assert_any_call("Marked %d videos as deleted", 3)
+
+    def test_handle_deleted_videos_deduplicates_ids(
+        self,
+        video_sync_service,
+        logger,
+    ):
+        """Test that a video reported as deleted twice is marked only once."""
+        deleted_video = FakeDeletedVideoFactory.build()
+        flagged_video = FakeVideoFactory.build(id=deleted_video.id, deleted=True)
+
+        mock_session_instance = MagicMock()
+
+        video_sync_service.handle_deleted_videos(
+            all_records=[deleted_video, flagged_video],
+            session=mock_session_instance,
+        )
+
+        _, params = mock_session_instance.execute.call_args.args
+        assert params == {"ids": [deleted_video.id]}
+        logger.info.assert_any_call("Marked %d videos as deleted", 1)
+
+    def test_handle_deleted_videos_accepts_generator(
+        self,
+        video_sync_service,
+    ):
+        """Test that records can be streamed from a generator."""
+        playlist = FakePlaylistFactory.build(enabled=True)
+        video = FakeVideoFactory.build(deleted=False)
+
+        result = video_sync_service.handle_deleted_videos(
+            all_records=(record for record in [playlist, video]),
+            session=MagicMock(),
+        )
+
+        assert result == ([playlist], [video])
+
     def test_handle_deleted_videos_with_no_deleted_items(
         self,
         video_sync_service,
@@ -283,10 +400,8 @@ class TestHandleDeletedVideos:
             session=mock_session_instance,
         )
 
-        # Verify all items are returned
-        assert len(result) == 2
-        assert active_video in result
-        assert active_playlist in result
+        # Verify all items are returned, split by type
+        assert result == ([active_playlist], [active_video])
 
         # Verify no delete operations were executed
         mock_session_instance.execute.assert_not_called()
@@ -310,8 +425,8 @@ class TestHandleDeletedVideos:
                 session=mock_session_instance,
             )
 
-            # Verify empty list is returned
-            assert len(result) == 0
+            # Verify empty lists are returned
+            assert result == ([], [])
 
             # Verify no delete operations were executed
             mock_session_instance.execute.assert_not_called()
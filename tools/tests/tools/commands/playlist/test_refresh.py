@@ -38,3 +38,15 @@ def test_happy_path(runner, faker):
             call_kwargs = mock_archiver.refresh_playlist.call_args.kwargs
             assert "keys" in call_kwargs
             assert call_kwargs["keys"] == (playlist_key,)
+            assert call_kwargs["refresh_metadata"] is False
+
+
+def test_refresh_metadata(runner, faker):
+    """The YouTube info cache can be skipped."""
+    with runner.isolated_filesystem():
+        with patch("tools.commands.playlist.refresh.create_archiver_service") as mock_factory:
+            result = runner.invoke(cli, ["playlist", "refresh", "--refresh-metadata", faker.word()])
+
+            assert result.exit_code == 0
+            mock_archiver = mock_factory.return_value
+            assert mock_archiver.refresh_playlist.call_args.kwargs["refresh_metadata"] is True
@@ -143,8 +143,7 @@ def test_custom_formatter():
             result = prompt_numbered_choice(items, formatter=custom_formatter)
 
     # Verify formatter was used
-    mock_echo.assert_any_call("1. apple (red)")
-    mock_echo.assert_any_call("2. banana (yellow)")
+    mock_echo.assert_called_once_with("1. apple (red)\n2. banana (yellow)")
     assert result == {"name": "apple", "color": "red"}
 
 
@@ -185,10 +184,8 @@ def test_default_formatter_with_string_items():
         with patch("tools.commands.helpers.click.prompt", return_value="1"):
             prompt_numbered_choice(items)
 
-    # Verify default format was used
-    mock_echo.assert_any_call("1. apple")
-    mock_echo.assert_any_call("2. banana")
-    mock_echo.assert_any_call("3. cherry")
+    # Verify default format was used, all in one go
+    mock_echo.assert_called_once_with("1. apple\n2. banana\n3. cherry")
 
 
 def test_works_with_complex_objects():
@@ -0,0 +1,171 @@
+import os
+from unittest.mock import MagicMock, patch
+
+import pytest
+from requests.adapters import HTTPAdapter
+
+from tools.data_access.discogs_fetcher import (
+    POOL_SIZE,
+    SEARCH_TTL,
+    CachingFetcher,
+    RateLimitedFetcher,
+    TokenBucket,
+)
+
+RELEASE_URL = "https://api.discogs.com/releases/123"
+SEARCH_URL = "https://api.discogs.com/database/search?q=abc"
+
+
+@pytest.fixture()
+def fetch_mock():
+    """Mock the actual HTTP requests."""
+    with patch("tools.data_access.discogs_fetcher.UserTokenRequestsFetcher.fetch") as mock:
+        mock.return_value = (b'{"id": 123}', 200)
+        yield mock
+
+
+def test_fetch_cached(fetch_mock, tmp_path):
+    """GET responses are only fetched once."""
+    sut = CachingFetcher("token", cache_path=tmp_path, ttl=60)
+
+    first = sut.fetch(None, "GET", RELEASE_URL)
+    second = sut.fetch(None, "GET", RELEASE_URL)
+
+    assert first == second == (b'{"id": 123}', 200)
+    assert fetch_mock.call_count == 1
+
+
+def test_fetch_cache_written_atomically(fetch_mock, tmp_path):
+    """A response is cached whole or not at all, leaving no partial files."""
+    logger = MagicMock()
+    sut = CachingFetcher("token", cache_path=tmp_path, ttl=60, logger=logger)
+
+    with patch("tools.data_access.discogs_fetcher.os.replace", side_effect=OSError("full")):
+        sut.fetch(None, "GET", RELEASE_URL)
+
+    assert list(tmp_path.iterdir()) == []
+    logger.warning.assert_called_once()
+
+    sut.fetch(None, "GET", RELEASE_URL)
+
+    assert [cache_file.read_bytes() for cache_file in tmp_path.iterdir()] == [b'{"id": 123}']
+
+
+def test_fetch_errors_not_cached(fetch_mock, tmp_path):
+    """Failed requests are tried again."""
+    fetch_mock.return_value = (b"Too many requests", 429)
+    sut = CachingFetcher("token", cache_path=tmp_path, ttl=60)
+
+    sut.fetch(None, "GET", RELEASE_URL)
+    sut.fetch(None, "GET", RELEASE_URL)
+
+    assert fetch_mock.call_count == 2
+
+
+def test_fetch_post_not_cached(fetch_mock, tmp_path):
+    """Only GET requests are cached."""
+    sut = CachingFetcher("token", cache_path=tmp_path, ttl=60)
+
+    sut.fetch(None, "POST", RELEASE_URL, data={"a": 1})
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_fetch_search_expires_sooner(fetch_mock, tmp_path):
+    """Searches are cached for at most SEARCH_TTL."""
+    sut = CachingFetcher("token", cache_path=tmp_path, ttl=SEARCH_TTL * 30)
+    sut.fetch(None, "GET", SEARCH_URL)
+    sut.fetch(None, "GET", RELEASE_URL)
+
+    # pretend both were cached two days ago
+    two_days_ago = os.path.getmtime(next(tmp_path.iterdir())) - 2 * SEARCH_TTL
+    for cache_file in tmp_path.iterdir():
+        os.utime(cache_file, (two_days_ago, two_days_ago))
+    sut.fetch(None, "GET", SEARCH_URL)
+    sut.fetch(None, "GET", RELEASE_URL)
+
+    assert [c.args[2] for c in fetch_mock.call_args_list] == [SEARCH_URL, RELEASE_URL, SEARCH_URL]
+
+
+def test_clear(fetch_mock, tmp_path):
+    """The cache can be emptied."""
+    sut = CachingFetcher("token", cache_path=tmp_path / "discogs", ttl=60)
+    sut.fetch(None, "GET", RELEASE_URL)
+
+    sut.clear()
+    sut.fetch(None, "GET", RELEASE_URL)
+
+    assert fetch_mock.call_count == 2
+
+
+def test_token_bucket_allows_bursts():
+    """Calls only wait once the bucket is empty."""
+    with (
+        patch("tools.data_access.discogs_fetcher.time.monotonic", return_value=100.0),
+        patch("tools.data_access.discogs_fetcher.time.sleep") as sleep_mock,
+    ):
+        sut = TokenBucket(rate=3, per=6.0)
+        for _ in range(3):
+            sut.acquire()
+        sleep_mock.assert_not_called()
+
+        sut.acquire()
+        sleep_mock.assert_called_once_with(2.0)
+
+
+def test_token_bucket_refills():
+    """Tokens come back over time."""
+    with (
+        patch("tools.data_access.discogs_fetcher.time.monotonic") as monotonic_mock,
+        patch("tools.data_access.discogs_fetcher.time.sleep") as sleep_mock,
+    ):
+        monotonic_mock.return_value = 100.0
+        sut = TokenBucket(rate=3, per=6.0)
+        for _ in range(3):
+            sut.acquire()
+
+        monotonic_mock.return_value = 104.0
+        sut.acquire()
+        sut.acquire()
+        sleep_mock.assert_not_called()
+
+
+def test_rate_limited_fetcher_takes_a_token_per_request():
+    """Each request to Discogs waits for a token."""
+    bucket = MagicMock(spec=TokenBucket)
+    sut = RateLimitedFetcher("token", bucket=bucket)
+
+    with patch.object(sut.session, "request") as request:
+        request.return_value.status_code = 200
+        sut.request("GET", RELEASE_URL, None, {})
+
+    bucket.acquire.assert_called_once()
+    request.assert_called_once_with(
+        method="GET", url=RELEASE_URL, data=None, headers={}, params=None, timeout=(None, None)
+    )
+
+
+def test_rate_limited_fetcher_reuses_connections():
+    """Requests go through one session, keeping connections open."""
+    sut = RateLimitedFetcher("token", bucket=MagicMock(spec=TokenBucket))
+
+    adapter = sut.session.get_adapter(RELEASE_URL)
+
+    assert isinstance(adapter, HTTPAdapter)
+    assert adapter.poolmanager.connection_pool_kw["maxsize"] == POOL_SIZE
+    assert adapter.max_retries.total == 3
+
+
+def test_rate_limited_fetcher_backs_off_when_throttled():
+    """Requests refused with 429 are tried again, each taking a token."""
+    bucket = MagicMock(spec=TokenBucket)
+    sut = RateLimitedFetcher("token", bucket=bucket)
+    throttled, ok = MagicMock(status_code=429), MagicMock(status_code=200)
+
+    with (
+        patch.object(sut.session, "request", side_effect=[throttled, ok]),
+        patch("discogs_client.utils.sleep"),
+    ):
+        assert sut.request("GET", RELEASE_URL, None, {}) is ok
+
+    assert bucket.acquire.call_count == 2
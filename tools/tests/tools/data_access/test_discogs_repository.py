@@ -1,9 +1,11 @@
 """Tests for DiscogsRepository."""
 
 import logging
+from unittest.mock import Mock
 
 import pytest
 from sqlalchemy import insert
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
 from tools.data_access.discogs_repository import DiscogsRepository, create_discogs_repository
@@ -382,6 +384,88 @@ def test_upsert_artist_skips_existing_link(
     assert count == 1
 
 
+# Test upsert_artists
+
+
+def test_upsert_artists_inserts_and_links_all_artists(
+    discogs_repository: DiscogsRepository,
+    test_sql_client: SQLClient,
+):
+    """Test that several artists are inserted and linked at once, skipping existing ones."""
+    release = DiscogsRelease(
+        id=12345,
+        title="Test Album",
+        country="US",
+        genres=["Rock"],
+        styles=["Indie"],
+        released=2020,
+        uri="https://www.discogs.com/release/12345",
+    )
+    discogs_repository.upsert_release(record=release)
+    existing = DiscogsArtist(id=1, name="Existing", profile="", uri="https://test.com/artist/1")
+    discogs_repository.upsert_artist(record=existing, release_id=12345, role="Main")
+
+    new = DiscogsArtist(id=2, name="The New (3)", profile="", uri="https://test.com/artist/2")
+    result = discogs_repository.upsert_artists(
+        records=[(existing, "Main"), (new, "Producer")], release_id=12345
+    )
+
+    assert result == [1, 2]
+    with Session(test_sql_client.engine) as session:
+        names = session.query(DiscogsArtistTable.name).order_by(DiscogsArtistTable.id).all()
+        roles = (
+            session.query(ReleaseArtistsTable.role).order_by(ReleaseArtistsTable.artist_id).all()
+        )
+    assert [name for (name,) in names] == ["Existing", "New"]
+    assert [role for (role,) in roles] == ["Main", "Producer"]
+
+
+# Test caller transaction
+
+
+def test_upserts_roll_back_with_caller_transaction(
+    discogs_repository: DiscogsRepository,
+    test_sql_client: SQLClient,
+):
+    """Test that upserts in the caller's session are only saved if it commits."""
+    release = DiscogsRelease(
+        id=12345,
+        title="Test Album",
+        country="US",
+        genres=["Rock"],
+        styles=["Indie"],
+        released=2020,
+        uri="https://www.discogs.com/release/12345",
+    )
+
+    with (
+        pytest.raises(RuntimeError),
+        Session(test_sql_client.engine) as session,
+        session.begin(),
+    ):
+        discogs_repository.upsert_release(record=release, session=session)
+        raise RuntimeError("interrupted")
+
+    with Session(test_sql_client.engine) as session:
+        assert session.query(DiscogsReleaseTable).count() == 0
+
+    with Session(test_sql_client.engine) as session, session.begin():
+        discogs_repository.upsert_release(record=release, session=session)
+
+    with Session(test_sql_client.engine) as session:
+        assert session.query(DiscogsReleaseTable).count() == 1
+
+
+def test_upserts_raise_in_caller_transaction(discogs_repository: DiscogsRepository):
+    """Test that errors are raised when running in the caller's session."""
+    session = Mock()
+    session.execute.side_effect = SQLAlchemyError("locked")
+    artist = DiscogsArtist(id=1, name="Artist", profile="", uri="https://discogs.com/artist/1")
+
+    with pytest.raises(SQLAlchemyError, match="locked"):
+        discogs_repository.upsert_artists(records=[(artist, None)], release_id=1, session=session)
+
+
 # Test upsert_track
 
 
@@ -69,6 +69,31 @@ def test_move_video_after_download_happy_path(faker, tmp_path, mock_config):
     assert written_video_data == video
 
 
+def test_existing_video_ids(tmp_path, mock_config):
+    """Finds all video files in the per-initial subfolders."""
+    sut = FileRepository(config=mock_config, root=tmp_path)
+    for key in ["abc", "Axy", "b12"]:
+        sut.make_video_path(key).touch()
+    (tmp_path / "videos" / "a" / "notes.txt").touch()
+
+    assert sut.existing_video_ids() == {"abc", "Axy", "b12"}
+
+
+def test_existing_thumbnail_ids(tmp_path, mock_config):
+    """Finds all thumbnail files in the per-initial subfolders."""
+    sut = FileRepository(config=mock_config, root=tmp_path)
+    sut.make_thumbnail_path("zed").touch()
+
+    assert sut.existing_thumbnail_ids() == {"zed"}
+
+
+def test_existing_ids_missing_root(tmp_path, mock_config):
+    """Returns an empty set if nothing was downloaded yet."""
+    sut = FileRepository(config=mock_config, root=tmp_path / "nothing")
+
+    assert sut.existing_video_ids() == set()
+
+
 def test_file_repository_function(mock_config):
     """Factory function for FileRepository."""
     sut = file_repository(config=mock_config)
@@ -260,6 +260,24 @@ def test_clear_playlist_links_handles_multiple_playlists(
     mock_logger.info.assert_called_once_with("Removed links to videos (if any) for 2 playlists")
 
 
+def test_clear_playlist_links_joins_caller_transaction(
+    db_with_playlists: SQLClient,
+) -> None:
+    """Should run in the given session, leaving the commit to the caller."""
+    repository = PlaylistRepository(sql_client=db_with_playlists, logger=Mock())
+    playlists = [Playlist(id="playlist1", title="Test", description="Test")]
+
+    with Session(db_with_playlists.engine) as session:
+        repository.clear_playlist_links(playlists=playlists, session=session)
+        stmt = select(PlaylistEntriesTable).where(PlaylistEntriesTable.playlist_id == "playlist1")
+        assert session.execute(stmt).fetchall() == []
+        session.rollback()
+
+    # Rolling back the caller's transaction discards the change
+    with Session(db_with_playlists.engine) as session:
+        assert len(session.execute(stmt).fetchall()) == 2
+
+
 def test_clear_playlist_links_handles_empty_list(test_sql_client: SQLClient) -> None:
     """Should return early when empty list provided."""
     mock_logger = Mock()
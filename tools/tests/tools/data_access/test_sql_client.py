@@ -0,0 +1,13 @@
+from sqlalchemy import text
+
+from tools.data_access.sql_client import SQLClient
+
+
+def test_sql_client_uses_wal(tmp_path):
+    """Connections are set up for fast writes."""
+    sut = SQLClient(db_url=tmp_path / "test.db")
+
+    with sut.engine.connect() as connection:
+        assert connection.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        # 1 == NORMAL
+        assert connection.execute(text("PRAGMA synchronous")).scalar() == 1
@@ -1,8 +1,11 @@
 """Tests for VideoRepository."""
 
+from datetime import datetime
 from unittest.mock import Mock
 
+import pytest
 from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
 from tools.data_access.sql_client import SQLClient
@@ -35,6 +38,100 @@ def test_update_videos_updates_existing_videos(db_with_videos: SQLClient) -> Non
         assert video.title == "Updated Title 1"
 
 
+def test_update_videos_accepts_generator(db_with_videos: SQLClient) -> None:
+    """Should consume a generator of records in a single pass."""
+    repository = VideoRepository(sql_client=db_with_videos, logger=Mock())
+
+    video_data = ({"id": video_id, "title": f"New {video_id}"} for video_id in ("video1", "video2"))
+
+    count = repository.update_videos(video_data=video_data)
+
+    assert count == 2
+    with Session(db_with_videos.engine) as session:
+        stmt = select(VideosTable.title).where(VideosTable.id == "video2")
+        assert session.execute(stmt).scalar_one() == "New video2"
+
+
+def test_update_videos_applies_partial_updates(db_with_videos: SQLClient) -> None:
+    """Should update only the given fields of records without a title."""
+    repository = VideoRepository(sql_client=db_with_videos, logger=Mock())
+
+    video_data = [
+        {"id": "video2", "description": "New description 2"},
+        {"id": "video4", "description": "New description 4"},
+    ]
+
+    count = repository.update_videos(video_data=video_data)
+
+    assert count == 2
+    with Session(db_with_videos.engine) as session:
+        stmt = select(VideosTable).where(VideosTable.id.in_(["video2", "video4"]))
+        videos = {video.id: video for video in session.execute(stmt).scalars()}
+        assert videos["video2"].description == "New description 2"
+        assert videos["video4"].description == "New description 4"
+        assert videos["video4"].title == "Partial Download"
+
+
+def test_update_videos_partial_update_ignores_unknown_ids(db_with_videos: SQLClient) -> None:
+    """Should still apply a partial update batch which contains an unknown id."""
+    repository = VideoRepository(sql_client=db_with_videos, logger=Mock())
+
+    video_data = [
+        {"id": "video1", "description": "New description 1"},
+        {"id": "not_in_db", "description": "Ignored"},
+    ]
+
+    count = repository.update_videos(video_data=video_data)
+
+    assert count == 2
+    with Session(db_with_videos.engine) as session:
+        stmt = select(VideosTable.description).where(VideosTable.id == "video1")
+        assert session.execute(stmt).scalar_one() == "New description 1"
+        stmt = select(VideosTable.id).where(VideosTable.id == "not_in_db")
+        assert session.execute(stmt).scalar_one_or_none() is None
+
+
+def test_update_videos_upsert_preserves_download_state(db_with_videos: SQLClient) -> None:
+    """Should insert new videos and keep locally-managed fields of existing ones."""
+    repository = VideoRepository(sql_client=db_with_videos, logger=Mock())
+
+    video_data = [
+        {
+            "id": video_id,
+            "title": f"Title {video_id}",
+            "downloaded": False,
+            "video_file": None,
+            "thumbnail": "http://example.com/thumb.jpg",
+        }
+        for video_id in ("video1", "video5")
+    ]
+
+    count = repository.update_videos(video_data=video_data)
+
+    assert count == 2
+    with Session(db_with_videos.engine) as session:
+        stmt = select(VideosTable).where(VideosTable.id.in_(["video1", "video5"]))
+        videos = {video.id: video for video in session.execute(stmt).scalars()}
+        assert videos["video1"].title == "Title video1"
+        assert videos["video1"].downloaded is True
+        assert videos["video1"].video_file == "/path/to/video1.mp4"
+        assert videos["video5"].title == "Title video5"
+        assert videos["video5"].downloaded is False
+
+
+def test_update_videos_raises_in_caller_transaction(test_sql_client: SQLClient) -> None:
+    """Should raise database errors when running in the caller's session."""
+    mock_logger = Mock()
+    repository = VideoRepository(sql_client=test_sql_client, logger=mock_logger)
+    session = Mock()
+    session.execute.side_effect = SQLAlchemyError("locked")
+
+    with pytest.raises(SQLAlchemyError, match="locked"):
+        repository.update_videos(video_data=[{"id": "video1", "title": "Test"}], session=session)
+
+    mock_logger.error.assert_not_called()
+
+
 def test_update_videos_returns_zero_for_empty_list(test_sql_client: SQLClient) -> None:
     """Should return 0 when no video data provided."""
     mock_logger = Mock()
@@ -181,6 +278,39 @@ def test_mark_video_downloaded_logs_debug_message(db_with_videos: SQLClient) ->
     mock_logger.debug.assert_called_once()
 
 
+def test_mark_videos_downloaded_updates_all(db_with_videos: SQLClient) -> None:
+    """Should update video_file for all videos, in one go."""
+    repository = VideoRepository(sql_client=db_with_videos, logger=Mock())
+
+    repository.mark_videos_downloaded(
+        [("video1", "/new/path/video1.mp4"), ("video2", "/new/path/video2.mp4")]
+    )
+
+    with Session(db_with_videos.engine) as session:
+        stmt = select(VideosTable.id, VideosTable.video_file).where(
+            VideosTable.id.in_(["video1", "video2"])
+        )
+        assert {video_id: video_file for video_id, video_file in session.execute(stmt)} == {
+            "video1": "/new/path/video1.mp4",
+            "video2": "/new/path/video2.mp4",
+        }
+
+
+def test_mark_videos_downloaded_ignores_unknown_ids(db_with_videos: SQLClient) -> None:
+    """Should still mark the known videos when the batch contains an unknown id."""
+    mock_logger = Mock()
+    repository = VideoRepository(sql_client=db_with_videos, logger=mock_logger)
+
+    repository.mark_videos_downloaded(
+        [("video1", "/new/path/video1.mp4"), ("not_in_db", "/new/path/not_in_db.mp4")]
+    )
+
+    mock_logger.error.assert_not_called()
+    with Session(db_with_videos.engine) as session:
+        stmt = select(VideosTable.video_file).where(VideosTable.id == "video1")
+        assert session.execute(stmt).scalar_one() == "/new/path/video1.mp4"
+
+
 # Tests for mark_thumbnail_downloaded
 
 
@@ -475,6 +605,17 @@ def test_get_video_by_id_returns_video_when_found(db_with_videos: SQLClient) ->
     mock_logger.debug.assert_called_once_with("Retrieved video video1")
 
 
+def test_get_video_by_id_parses_last_updated(db_with_videos: SQLClient) -> None:
+    """Should convert the TEXT last_updated column back to a datetime."""
+    repository = VideoRepository(sql_client=db_with_videos, logger=Mock())
+
+    video = repository.get_video_by_id(video_id="video1")
+
+    assert video is not None
+    assert isinstance(video.last_updated, datetime)
+    assert video.playlist_id is None
+
+
 def test_get_video_by_id_returns_none_when_not_found(db_with_videos: SQLClient) -> None:
     """Should return None when video ID doesn't exist."""
     mock_logger = Mock()
@@ -595,6 +736,24 @@ def test_get_video_ids_handles_database_error(test_sql_client: SQLClient) -> Non
     assert "Error retrieving video IDs" in str(mock_logger.error.call_args)
 
 
+def test_update_video_table_inserts_new_and_updates_existing(db_with_videos: SQLClient) -> None:
+    """Should insert new videos and update the ones already in the DB."""
+    repository = VideoRepository(sql_client=db_with_videos, logger=Mock())
+
+    records = [
+        {"id": "video1", "title": "Renamed Video"},
+        {"id": "video5", "title": "Brand New Video"},
+    ]
+    repository._update_video_table(records=records)
+
+    with Session(db_with_videos.engine) as session:
+        rows = session.execute(select(VideosTable.id, VideosTable.title))
+        titles = {video_id: title for video_id, title in rows}
+    assert titles["video1"] == "Renamed Video"
+    assert titles["video5"] == "Brand New Video"
+    assert len(titles) == 5
+
+
 def test_update_video_table_handles_database_error(test_sql_client: SQLClient) -> None:
     """Should handle SQLAlchemyError/TypeError gracefully."""
     from unittest.mock import patch
@@ -5,7 +5,7 @@ from yt_dlp import DownloadError
 
 from tools.data_access.youtube_dao import YoutubeDAO, youtube_dao
 from tools.models.fakes import FakePlaylistFactory, FakeVideoFactory
-from tools.models.models import DeletedYoutubeObj, Playlist, Video
+from tools.models.models import DeletedYoutubeObj, Playlist, Video, frozen_now
 
 
 @pytest.fixture()
@@ -51,6 +51,57 @@ def test_get_info_video_happy_path(extract_info_mock, faker):
         assert info[i].id == expected[i]["id"]
 
 
+def test_get_info_video_validated_once(extract_info_mock):
+    """The same video info is only validated once, but not shared."""
+    sut = YoutubeDAO()
+    video_info = FakeVideoFactory.build().model_dump()
+    extract_info_mock.side_effect = [dict(video_info), dict(video_info)]
+
+    with patch(
+        "tools.data_access.youtube_dao.Video.model_validate", wraps=Video.model_validate
+    ) as mock_model_validate:
+        info = sut.get_info((video_info["id"], video_info["id"]))
+
+    assert mock_model_validate.call_count == 1
+    assert info[0] == info[1]
+    assert info[0] is not info[1]
+
+
+def test_get_info_video_validated_once_across_playlists(extract_info_mock):
+    """A video in several playlists is validated once, with each playlist_id."""
+    sut = YoutubeDAO()
+    video_info = FakeVideoFactory.build().model_dump(exclude={"playlist_id"})
+    playlists = FakePlaylistFactory.batch(size=2)
+    extract_info_mock.side_effect = [
+        playlist.model_dump() | {"entries": [dict(video_info)]} for playlist in playlists
+    ]
+
+    with patch(
+        "tools.data_access.youtube_dao.Video.model_validate", wraps=Video.model_validate
+    ) as mock_model_validate:
+        info = sut.get_info(tuple(playlist.id for playlist in playlists))
+
+    assert mock_model_validate.call_count == 1
+    videos = [record for record in info if isinstance(record, Video)]
+    assert [video.playlist_id for video in videos] == [playlist.id for playlist in playlists]
+
+
+def test_get_info_video_defaults_not_memoized(extract_info_mock):
+    """Timestamps defaulted by Video are computed for each video, not cached."""
+    sut = YoutubeDAO()
+    video_info = FakeVideoFactory.build().model_dump(exclude={"last_updated"})
+    extract_info_mock.side_effect = [dict(video_info), dict(video_info)]
+
+    first = sut.get_info((video_info["id"],))[0]
+    with frozen_now() as now:
+        second = sut.get_info((video_info["id"],))[0]
+
+    assert isinstance(first, Video)
+    assert isinstance(second, Video)
+    assert second.last_updated == now
+    assert first.last_updated != now
+
+
 @patch("tools.data_access.youtube_dao.Video.model_validate")
 def test_get_info_video_deleted(mock_model_validate, extract_info_mock, faker):
     """Get information for a single video with counts."""
@@ -108,8 +159,72 @@ def test_get_info_playlist_happy_path(extract_info_mock, faker):
     assert any(expected_entries[1] == video for video in info)
 
 
+def test_get_info_cached(extract_info_mock, tmp_path):
+    """Info from YouTube is reused until it expires."""
+    sut = YoutubeDAO(cache_path=tmp_path, cache_ttl=60)
+    video_info = FakeVideoFactory.build().model_dump(mode="json")
+    extract_info_mock.return_value = video_info
+
+    first = sut.get_info((video_info["id"],))
+    second = sut.get_info((video_info["id"],))
+
+    assert extract_info_mock.call_count == 1
+    assert first == second
+
+
+def test_get_info_cache_written_atomically(extract_info_mock, tmp_path):
+    """Info is cached whole or not at all, leaving no partial files."""
+    sut = YoutubeDAO(cache_path=tmp_path, cache_ttl=60)
+    video_info = FakeVideoFactory.build().model_dump(mode="json")
+    extract_info_mock.return_value = video_info
+
+    with patch("tools.data_access.youtube_dao.os.replace", side_effect=OSError("full")):
+        info = sut.get_info((video_info["id"],))
+
+    assert info[0].id == video_info["id"]
+    assert list(tmp_path.iterdir()) == []
+
+    sut.get_info((video_info["id"],))
+
+    assert [cache_file.suffix for cache_file in tmp_path.iterdir()] == [".json"]
+
+
+def test_get_info_cached_refresh(extract_info_mock, tmp_path):
+    """Cached info can be ignored."""
+    sut = YoutubeDAO(cache_path=tmp_path, cache_ttl=60)
+    video_info = FakeVideoFactory.build().model_dump(mode="json")
+    extract_info_mock.return_value = video_info
+
+    sut.get_info((video_info["id"],))
+    sut.get_info((video_info["id"],), refresh=True)
+
+    assert extract_info_mock.call_count == 2
+
+
+def test_get_info_cache_off(extract_info_mock, tmp_path):
+    """Nothing is cached without a ttl."""
+    sut = YoutubeDAO(cache_path=tmp_path)
+    video_info = FakeVideoFactory.build().model_dump(mode="json")
+    extract_info_mock.return_value = video_info
+
+    sut.get_info((video_info["id"],))
+
+    assert list(tmp_path.iterdir()) == []
+
+
 def test_youtube_dao_function():
     """Test creating a YoutubeDAO instance using the function."""
     dao_instance = youtube_dao()
     assert dao_instance is not None
     assert isinstance(dao_instance, YoutubeDAO)
+
+
+def test_youtube_dao_function_with_config(mock_config, tmp_path):
+    """The cache is set up from the config."""
+    mock_config.info_cache_path = tmp_path
+    mock_config.info_cache_ttl = 60
+
+    sut = youtube_dao(config=mock_config)
+
+    assert sut.cache_path == tmp_path
+    assert sut.cache_ttl == 60
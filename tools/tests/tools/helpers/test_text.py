@@ -0,0 +1,47 @@
+import random
+import re
+
+import pytest
+
+from tools.helpers.text import strip_parens, strip_the_prefix
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("Song (Official Video)", "Song"),
+        ("Song (Remix) (2020)", "Song"),
+        ("Song (Remix) - Artist (Live)", "Song - Artist"),
+        ("Song(Remix)", "Song(Remix)"),
+        ("Song (unclosed", "Song (unclosed"),
+        ("Song (a(b) c)", "Song c)"),
+        ("", ""),
+    ],
+)
+def test_strip_parens(text, expected):
+    """Parenthesised spans preceded by a space are removed."""
+    assert strip_parens(text) == expected
+
+
+def test_strip_parens_same_as_regex():
+    """Any string is cleaned the same way as the regex used to."""
+    rnd = random.Random(0)
+    for _ in range(2000):
+        text = "".join(rnd.choice("ab ()\n") for _ in range(rnd.randint(0, 20)))
+        assert strip_parens(text) == re.sub(r" \(.*?\)", "", text), repr(text)
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("The Beatles", "Beatles"),
+        ("the  Who", "Who"),
+        ("THE\tCure", "Cure"),
+        ("Theatre", "Theatre"),
+        ("The", "The"),
+        ("Them Crooked Vultures", "Them Crooked Vultures"),
+    ],
+)
+def test_strip_the_prefix(text, expected):
+    """A leading 'the' is only removed as a whole word."""
+    assert strip_the_prefix(text) == expected
@@ -1,8 +1,12 @@
+import asyncio
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from tools.helpers.thumbnails_downloader import thumbnails_downloader
+from tools.helpers.thumbnails_downloader import (
+    thumbnails_downloader,
+    thumbnails_downloader_async,
+)
 
 
 @pytest.fixture()
@@ -100,3 +104,66 @@ def test_thumbnails_downloader_di(
     # Verify the injected dependencies were used
     mock_file_repo.write_thumbnail.assert_called_once()
     mock_video_repository.mark_thumbnail_downloaded.assert_called_once()
+
+
+@pytest.mark.asyncio()
+async def test_thumbnails_downloader_async(
+    mock_file_repo, mock_video_repository, monkeypatch, mock_config
+):
+    """Can be awaited from within a running event loop."""
+    mock_session = MagicMock()
+    mock_resp = AsyncMock()
+    mock_resp.raise_for_status = MagicMock()
+    mock_resp.read.return_value = b"fake_data"
+    mock_session.return_value.__aenter__.return_value.request.return_value = mock_resp
+    monkeypatch.setattr("tools.helpers.thumbnails_downloader.ClientSession", mock_session)
+
+    key_url_pairs = [
+        ("video1", "http://a.example.com/thumbnail"),
+        ("video2", "http://b.example.com/thumbnail"),
+    ]
+    await thumbnails_downloader_async(
+        key_url_pairs=key_url_pairs,
+        file_repo=mock_file_repo,
+        video_repository=mock_video_repository,
+        config=mock_config,
+    )
+
+    assert mock_file_repo.write_thumbnail.call_count == 2
+    assert mock_video_repository.mark_thumbnail_downloaded.call_count == 2
+
+
+@pytest.mark.asyncio()
+async def test_thumbnails_downloader_async_caps_concurrency(
+    mock_file_repo, mock_video_repository, monkeypatch, mock_config
+):
+    """No more than `concurrency` requests are in flight at once."""
+    in_flight = 0
+    max_in_flight = 0
+
+    async def fake_request(**kwargs):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        mock_resp = AsyncMock()
+        mock_resp.raise_for_status = MagicMock()
+        mock_resp.read.return_value = b"fake_data"
+        return mock_resp
+
+    mock_session = MagicMock()
+    mock_session.return_value.__aenter__.return_value.request.side_effect = fake_request
+    monkeypatch.setattr("tools.helpers.thumbnails_downloader.ClientSession", mock_session)
+
+    key_url_pairs = [(f"video{i}", f"http://host{i}.example.com/thumbnail") for i in range(6)]
+    await thumbnails_downloader_async(
+        key_url_pairs=key_url_pairs,
+        file_repo=mock_file_repo,
+        video_repository=mock_video_repository,
+        config=mock_config,
+        concurrency=2,
+    )
+
+    assert max_in_flight == 2
+    assert mock_file_repo.write_thumbnail.call_count == 6
@@ -6,7 +6,12 @@ from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
-from tools.helpers.youtube_downloader import MovePP, youtube_downloader
+from tools.helpers.youtube_downloader import (
+    FLUSH_EVERY,
+    DownloadedVideos,
+    MovePP,
+    youtube_downloader,
+)
 
 
 # Reusable mock for FileRepository
@@ -58,6 +63,61 @@ def test_youtube_downloader_with_keys(
     ydl_mock.__enter__().download.assert_called_with(keys)
 
 
+def test_youtube_downloader_in_parallel(
+    file_repo_mock, video_repository_mock, ydl_mock, faker, mock_config
+):
+    """Videos are split between several downloaders."""
+    mock_config.download_workers = 2
+    keys = [faker.uuid4() for _ in range(3)]
+    youtube_downloader(
+        keys=keys,
+        file_repo=file_repo_mock,
+        video_repository=video_repository_mock,
+        config=mock_config,
+    )
+    downloaded = [c.args[0] for c in ydl_mock.__enter__().download.call_args_list]
+    assert sorted(downloaded) == sorted([keys[0::2], keys[1::2]])
+    # each YoutubeDL instance gets a post-processor of its own
+    move_pps = [c.args[0] for c in ydl_mock.__enter__().add_post_processor.call_args_list]
+    assert len(move_pps) == 2
+    assert move_pps[0] is not move_pps[1]
+    assert move_pps[0].downloaded is move_pps[1].downloaded
+
+
+def test_youtube_downloader_settings_from_config(
+    file_repo_mock, video_repository_mock, faker, mock_config
+):
+    """Download tuning comes from the config."""
+    mock_config.concurrent_fragments = 4
+    mock_config.external_downloader = "aria2c"
+    with patch("tools.helpers.youtube_downloader.YoutubeDL") as youtube_dl_class:
+        youtube_downloader(
+            keys=[faker.uuid4()],
+            file_repo=file_repo_mock,
+            video_repository=video_repository_mock,
+            config=mock_config,
+        )
+    ydl_settings = youtube_dl_class.call_args.args[0]
+    assert ydl_settings["concurrent_fragment_downloads"] == 4
+    assert ydl_settings["external_downloader"] == {"default": "aria2c"}
+    assert "aria2c" in ydl_settings["external_downloader_args"]
+
+
+def test_youtube_downloader_no_external_downloader(
+    file_repo_mock, video_repository_mock, faker, mock_config
+):
+    """yt-dlp's own downloader is used by default."""
+    with patch("tools.helpers.youtube_downloader.YoutubeDL") as youtube_dl_class:
+        youtube_downloader(
+            keys=[faker.uuid4()],
+            file_repo=file_repo_mock,
+            video_repository=video_repository_mock,
+            config=mock_config,
+        )
+    ydl_settings = youtube_dl_class.call_args.args[0]
+    assert "external_downloader" not in ydl_settings
+
+
 @pytest.mark.asyncio()
 @patch("tools.helpers.youtube_downloader.MovePP", autospec=True)
 @patch("tools.helpers.youtube_downloader.file_repository")
@@ -95,12 +155,49 @@ def test_youtube_downloader_handles_exception(
 def test_move_pp_run(file_repo_mock, video_repository_mock):
     """Run the post-processing steps after a video is downloaded."""
     mock_logger = Mock()
-    move_pp = MovePP(file_repo_mock, video_repository_mock, mock_logger)
+    downloaded = DownloadedVideos(video_repository_mock)
+    move_pp = MovePP(file_repo_mock, downloaded, mock_logger)
     info = {"_filename": "downloaded_video.mp4", "id": "video_id"}
 
     move_pp.run(info)
 
+    assert downloaded.moved == {"video_id": file_repo_mock.move_video_after_download.return_value}
     file_repo_mock.move_video_after_download.assert_called_with(Path("downloaded_video.mp4"))
-    video_repository_mock.mark_video_downloaded.assert_called_with(
-        key="video_id", local_file=file_repo_mock.move_video_after_download.return_value
+    video_repository_mock.mark_videos_downloaded.assert_not_called()
+
+    downloaded.flush()
+
+    video_repository_mock.mark_videos_downloaded.assert_called_once_with(
+        [("video_id", file_repo_mock.move_video_after_download.return_value)]
+    )
+    mock_logger.debug.assert_called_with(
+        "Moved from %s to %s",
+        Path("downloaded_video.mp4"),
+        file_repo_mock.move_video_after_download.return_value,
     )
+
+
+def test_move_pp_run_flushes_in_batches(file_repo_mock, video_repository_mock):
+    """The DB is updated every FLUSH_EVERY videos."""
+    move_pp = MovePP(file_repo_mock, DownloadedVideos(video_repository_mock), Mock())
+
+    for i in range(FLUSH_EVERY + 1):
+        move_pp.run({"_filename": f"video_{i}.mp4", "id": f"video_{i}"})
+
+    video_repository_mock.mark_videos_downloaded.assert_called_once()
+    assert len(video_repository_mock.mark_videos_downloaded.call_args.args[0]) == FLUSH_EVERY
+
+
+def test_youtube_downloader_flushes_after_download(
+    file_repo_mock, video_repository_mock, ydl_mock, faker, mock_config
+):
+    """Videos still buffered are written to the DB, even if download fails."""
+    ydl_mock.__enter__().download.side_effect = Exception("Download error")
+    with patch("tools.helpers.youtube_downloader.DownloadedVideos.flush") as flush_mock:
+        youtube_downloader(
+            keys=[faker.uuid4()],
+            file_repo=file_repo_mock,
+            video_repository=video_repository_mock,
+            config=mock_config,
+        )
+    flush_mock.assert_called_once()
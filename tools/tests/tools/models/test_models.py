@@ -0,0 +1,28 @@
+"""Tests for DB models."""
+
+import pytest
+
+from tools.models.models import DeletedYoutubeObj, Video, frozen_now, last_updated_factory
+
+
+@pytest.mark.parametrize(
+    ("key", "expected"),
+    [
+        ("PLZ1234567890", True),
+        ("PLZ123", False),
+        ("PLA1234567890", False),
+        ("xPLZ123456789", False),
+    ],
+)
+def test_deleted_youtube_obj_is_playlist(key: str, expected: bool) -> None:
+    """Test guessing whether a deleted entry was a playlist."""
+    assert DeletedYoutubeObj(id=key).is_playlist() is expected
+
+
+def test_frozen_now() -> None:
+    """Test records created within frozen_now share the same timestamp."""
+    with frozen_now() as timestamp:
+        videos = [Video(id=str(i), title="title") for i in range(3)]
+        assert last_updated_factory() == timestamp.isoformat()
+
+    assert {video.last_updated for video in videos} == {timestamp}